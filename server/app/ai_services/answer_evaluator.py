@@ -41,17 +41,27 @@ Returns:
     }
 """
 
+import copy
+import hashlib
 import json
 import os
 import random
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from dotenv import load_dotenv
 
+from app.cache import TTLCache
+
 load_dotenv()
 
 USE_MOCK_AI: bool = os.getenv("USE_MOCK_AI", "true").lower() == "true"
 
+# Exact-match cache of LLM evaluations: the same answer (ignoring case and
+# whitespace) to the same question in the same track/dimension context reuses
+# the earlier result instead of paying for another LLM call.
+EVALUATION_CACHE_TTL_SECONDS = int(os.getenv("EVALUATION_CACHE_TTL_SECONDS", str(30 * 24 * 3600)))
+_evaluation_cache = TTLCache(ttl_seconds=EVALUATION_CACHE_TTL_SECONDS, max_size=50_000)
+
 CRITERIA = [
     "problem_understanding",
     "structured_thinking",
@@ -140,6 +150,32 @@ what would make the answer better — reference {track_name} where relevant.
 }}"""
 
 
+# ---------------------------------------------------------------------------
+# Result cache
+# ---------------------------------------------------------------------------
+
+
+def _evaluation_key(track_name: str, track_description: str, qa: Dict) -> str:
+    """Hash of everything the prompt depends on, with the answer normalised."""
+    normalized_answer = " ".join(str(qa.get("user_answer", "")).lower().split())
+    material = json.dumps([
+        track_name,
+        (track_description or "").strip(),
+        qa.get("dimension_name", "General"),
+        qa.get("dimension_description", ""),
+        float(qa.get("dimension_weight", 1.0)),
+        qa.get("question_type", "open"),
+        qa.get("question_text", ""),
+        normalized_answer,
+    ])
+    return hashlib.sha256(material.encode()).hexdigest()
+
+
+def _cached_evaluation(key: str) -> Optional[Dict]:
+    cached = _evaluation_cache.get(key)
+    return copy.deepcopy(cached) if cached is not None else None
+
+
 # ---------------------------------------------------------------------------
 # Public entry point
 # ---------------------------------------------------------------------------
@@ -200,6 +236,18 @@ async def _ai_evaluate(
     if not provider.is_configured():
         return _mock_evaluate(user_answer, dimension_name, dimension_weight)
 
+    cache_key = _evaluation_key(track_name, track_description, {
+        "user_answer": user_answer,
+        "question_text": question_text,
+        "dimension_name": dimension_name,
+        "dimension_description": dimension_description,
+        "dimension_weight": dimension_weight,
+        "question_type": question_type,
+    })
+    cached = _cached_evaluation(cache_key)
+    if cached is not None:
+        return cached
+
     # Use track description; fallback when empty
     desc = (track_description or "").strip()
     if not desc:
@@ -238,8 +286,9 @@ async def _ai_evaluate(
         # Strip any accidental backtick fences
         raw = raw.strip().lstrip("```json").lstrip("```").rstrip("```").strip()
 
-        result = json.loads(raw)
-        return _validate(result)
+        result = _validate(json.loads(raw))
+        _evaluation_cache.set(cache_key, copy.deepcopy(result))
+        return result
 
     except Exception:
         return _mock_evaluate(user_answer, dimension_name, dimension_weight)
@@ -374,6 +423,15 @@ async def _ai_evaluate_batch(
             for qa in questions_and_answers
         ]
 
+    # Only answers not evaluated before go to the LLM
+    cache_keys = [
+        _evaluation_key(track_name, track_description, qa) for qa in questions_and_answers
+    ]
+    evaluations: List[Optional[Dict]] = [_cached_evaluation(key) for key in cache_keys]
+    pending = [i for i, ev in enumerate(evaluations) if ev is None]
+    if not pending:
+        return evaluations
+
     desc = (track_description or "").strip()
     if not desc:
         desc = (
@@ -382,7 +440,7 @@ async def _ai_evaluate_batch(
         )
 
     qa_blocks = "\n".join(
-        _build_qa_block(i, qa) for i, qa in enumerate(questions_and_answers, start=1)
+        _build_qa_block(n, questions_and_answers[i]) for n, i in enumerate(pending, start=1)
     )
 
     prompt = _BATCH_PROMPT_TEMPLATE.format(
@@ -410,32 +468,23 @@ async def _ai_evaluate_batch(
         if not isinstance(results, list):
             results = [results]
 
-        # Ensure we have exactly N evaluations; pad or trim if needed
-        n = len(questions_and_answers)
-        evaluations = []
-        for i in range(n):
-            if i < len(results) and isinstance(results[i], dict):
-                evaluations.append(_validate(results[i]))
-            else:
-                qa = questions_and_answers[i]
-                evaluations.append(
-                    _mock_evaluate(
-                        user_answer=qa.get("user_answer", ""),
-                        dimension_name=qa.get("dimension_name", "General"),
-                        dimension_weight=float(qa.get("dimension_weight", 1.0)),
-                    )
-                )
-        return evaluations
-
+        # Ensure every pending answer gets an evaluation; pad if the reply is short
+        for n, i in enumerate(pending):
+            if n < len(results) and isinstance(results[n], dict):
+                evaluations[i] = _validate(results[n])
+                _evaluation_cache.set(cache_keys[i], copy.deepcopy(evaluations[i]))
     except Exception:
-        return [
-            _mock_evaluate(
+        pass
+
+    for i in pending:
+        if evaluations[i] is None:
+            qa = questions_and_answers[i]
+            evaluations[i] = _mock_evaluate(
                 user_answer=qa.get("user_answer", ""),
                 dimension_name=qa.get("dimension_name", "General"),
                 dimension_weight=float(qa.get("dimension_weight", 1.0)),
             )
-            for qa in questions_and_answers
-        ]
+    return evaluations
 
 
 # ---------------------------------------------------------------------------
@@ -28,15 +28,17 @@ _PLACEHOLDER_SNIPPETS = (
     "[your name]",
     "[their name]",
 )
+# Compiled once; every interviewer message goes through these
+_PLACEHOLDER_RE = re.compile("|".join(map(re.escape, _PLACEHOLDER_SNIPPETS)), re.IGNORECASE)
+_MULTISPACE_RE = re.compile(r"\s{2,}")
+_GREETING_COMMA_RE = re.compile(r"Hi\s*,\s*", re.IGNORECASE)
 
 
 def _sanitize_interviewer_text(text: str) -> str:
     """Remove bracket placeholders and tidy spacing so greetings read naturally (e.g. 'Hi,')."""
-    t = (text or "").strip()
-    for snippet in _PLACEHOLDER_SNIPPETS:
-        t = re.sub(re.escape(snippet), "", t, flags=re.IGNORECASE)
-    t = re.sub(r"\s{2,}", " ", t)
-    t = re.sub(r"Hi\s*,\s*", "Hi, ", t, count=1, flags=re.IGNORECASE)
+    t = _PLACEHOLDER_RE.sub("", (text or "").strip())
+    t = _MULTISPACE_RE.sub(" ", t)
+    t = _GREETING_COMMA_RE.sub("Hi, ", t, count=1)
     return t.strip()
 
 
@@ -298,22 +300,24 @@ async def generate_evaluation_followup(
         return _sanitize_interviewer_text(_mock_followup(dialogue_history))
 
 
+# Fixed mock follow-ups (no per-call formatting)
+_MOCK_FOLLOWUP_WRAP_UP = "I've got a clear picture. Let me put together my evaluation."
+_MOCK_FOLLOWUP_PROBE = (
+    "Got it. Imagine that approach fails in production and you're debugging at 2am. "
+    "What's your first step — what would you check, and what would you log?"
+)
+_MOCK_FOLLOWUP_OPENER = (
+    "Interesting. So in that scenario, what's the first thing that could go wrong? "
+    "And how would you handle it?"
+)
+
+
 def _mock_followup(dialogue_history: List[Dict]) -> str:
-    user_msgs = [d for d in dialogue_history if d.get("speaker") == "user"]
-    ai_msgs = [d for d in dialogue_history if d.get("speaker") == "ai"]
-    exchanges = min(len(user_msgs), len(ai_msgs))
-
-    if exchanges >= 6:
-        return "I've got a clear picture. Let me put together my evaluation."
-    if user_msgs:
-        return (
-            "Got it. Imagine that approach fails in production and you're debugging at 2am. "
-            "What's your first step — what would you check, and what would you log?"
-        )
-    return (
-        "Interesting. So in that scenario, what's the first thing that could go wrong? "
-        "And how would you handle it?"
-    )
+    if _count_exchanges(dialogue_history) >= 6:
+        return _MOCK_FOLLOWUP_WRAP_UP
+    if any(d.get("speaker") == "user" for d in dialogue_history):
+        return _MOCK_FOLLOWUP_PROBE
+    return _MOCK_FOLLOWUP_OPENER
 
 
 # ---------------------------------------------------------------------------
@@ -1,52 +1,141 @@
 """
 Authentication and authorization middleware functions
 """
-from fastapi import Depends, HTTPException, status
+import os
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy import Row, bindparam, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from jose import JWTError
-from typing import Optional
+from typing import Optional, Tuple
 
-from app.database import get_db
+from app.cache import TTLCache
+from app.database import get_async_db, get_db
 from app import models, schemas
 from app.utils import decode_access_token
 
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
+class BearerTokenScheme(OAuth2PasswordBearer):
+    """
+    OAuth2PasswordBearer with a single-slice header parse.
 
-def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db)
-) -> models.User:
+    Keeps the OpenAPI security scheme (docs lock icon / Authorize button) but
+    skips the generic scheme/param split done on every request.
     """
-    Get the current authenticated user from JWT token
+
+    async def __call__(self, request: Request) -> Optional[str]:
+        authorization = request.headers.get("authorization")
+        if authorization and len(authorization) > 7 and authorization[:7].lower() == "bearer ":
+            return authorization[7:]
+        if self.auto_error:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Not authenticated",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        return None
+
+
+oauth2_scheme = BearerTokenScheme(tokenUrl="/api/auth/login")
+
+# Columns the auth dependencies load for the current user. Routes only need
+# these, so they are fetched as a plain row instead of a full ORM instance.
+_CURRENT_USER_COLUMNS = (
+    models.User.user_id,
+    models.User.full_name,
+    models.User.email,
+    models.User.role,
+    models.User.created_at,
+)
+_CURRENT_USER_STMT = select(*_CURRENT_USER_COLUMNS).where(models.User.user_id == bindparam("user_id"))
+
+# Short-lived in-process cache of user rows keyed by user_id, so that every
+# authenticated request doesn't have to SELECT the same user again. Each
+# worker has its own copy and invalidate_user only clears the calling one,
+# so other workers can serve a deleted or changed user's old row for up to
+# USER_CACHE_TTL_SECONDS. Routes scope their queries by user_id, so a deleted
+# user's requests find nothing; get_admin_user skips the cache so a demotion
+# takes effect at once.
+USER_CACHE_TTL_SECONDS = int(os.getenv("USER_CACHE_TTL_SECONDS", "30"))
+_user_cache = TTLCache(ttl_seconds=USER_CACHE_TTL_SECONDS, max_size=10_000)
+
+
+def invalidate_user(user_id: int) -> None:
+    """
+    Drop a user from this worker's cache. Call after any change to the
+    users row (profile update, password change, role change, deletion).
     """
-    credentials_exception = HTTPException(
+    _user_cache.pop(user_id)
+
+
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    
+
+
+def _token_user_id(token: str) -> int:
+    """user_id claim of a valid access token (401 otherwise)"""
     payload = decode_access_token(token)
     if payload is None:
-        raise credentials_exception
+        raise _credentials_exception()
     
     user_id: int = payload.get("user_id")
     email: str = payload.get("sub")
     
     if email is None or user_id is None:
-        raise credentials_exception
-    
-    user = db.query(models.User).filter(models.User.user_id == user_id).first()
+        raise _credentials_exception()
+    return user_id
+
+
+def _load_user(db: Session, user_id: int) -> Row:
+    """Read the user's row from the database and refresh the cache with it"""
+    user = db.execute(_CURRENT_USER_STMT, {"user_id": user_id}).first()
     if user is None:
-        raise credentials_exception
+        raise _credentials_exception()
     
+    _user_cache.set(user_id, user)
     return user
 
 
-def get_current_active_user(
-    current_user: models.User = Depends(get_current_user)
+def get_current_user(
+    token: str = Depends(oauth2_scheme),
+    db: Session = Depends(get_db)
+) -> Row:
+    """
+    Get the current authenticated user from JWT token
+
+    Returns a lightweight read-only row (user_id, full_name, email, role,
+    created_at). Use get_current_user_model when the route needs to modify
+    or delete the user.
+    """
+    user_id = _token_user_id(token)
+    user = _user_cache.get(user_id)
+    if user is not None:
+        return user
+    return _load_user(db, user_id)
+
+
+async def get_current_user_model(
+    current_user: Row = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
 ) -> models.User:
+    """
+    Get the current user as a full ORM instance bound to the request's
+    async session
+    """
+    user = await db.get(models.User, current_user.user_id)
+    if user is None:
+        raise _credentials_exception()
+    return user
+
+
+def get_current_active_user(
+    current_user: Row = Depends(get_current_user)
+) -> Row:
     """
     Ensure user is active
     """
@@ -54,11 +143,16 @@ def get_current_active_user(
 
 
 def get_admin_user(
-    current_user: models.User = Depends(get_current_user)
-) -> models.User:
+    token: str = Depends(oauth2_scheme),
+    db: Session = Depends(get_db)
+) -> Row:
     """
     Ensure user has admin privileges
+
+    The role is read from the database rather than the user cache, so a
+    demoted or deleted admin loses access on every worker immediately.
     """
+    current_user = _load_user(db, _token_user_id(token))
     if current_user.role != "admin":
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -66,3 +160,35 @@ def get_admin_user(
         )
     return current_user
 
+
+
+def get_owned_stage(
+    db: Session,
+    stage_id: int,
+    user_id: int,
+    forbidden_detail: str = "Learning stage does not belong to you"
+) -> Tuple[models.LearningPathStage, models.LearningPath]:
+    """
+    Load a learning stage together with its path in one query and check
+    that the path belongs to user_id (404 if missing, 403 if not owned)
+    """
+    row = db.query(models.LearningPathStage, models.LearningPath).join(
+        models.LearningPath,
+        models.LearningPath.path_id == models.LearningPathStage.path_id
+    ).filter(
+        models.LearningPathStage.stage_id == stage_id
+    ).first()
+    
+    if row is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Learning stage not found"
+        )
+    
+    stage, path = row
+    if path.user_id != user_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=forbidden_detail
+        )
+    return stage, path
@@ -0,0 +1,78 @@
+"""
+Small in-process TTL cache used for hot, rarely-changing lookups
+"""
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from fastapi import Request
+
+
+class TTLCache:
+    """
+    Thread-safe dict with per-entry expiry and a size cap.
+
+    Entries are evicted oldest-first once max_size is reached. The cache is
+    local to the worker process, so TTLs should stay short enough that other
+    workers converge after a write.
+    """
+
+    def __init__(self, ttl_seconds: float, max_size: int = 10_000):
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._data: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value, or default on miss/expiry"""
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            with self._lock:
+                self._data.pop(key, None)
+            return default
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        """Store a value; ttl_seconds overrides the cache default for this entry"""
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        if ttl <= 0:
+            return
+        with self._lock:
+            if key not in self._data and len(self._data) >= self.max_size:
+                # Drop the oldest entry (dicts keep insertion order)
+                self._data.pop(next(iter(self._data)), None)
+            self._data[key] = (time.monotonic() + ttl, value)
+
+    def pop(self, key: Hashable) -> None:
+        """Remove a single entry"""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def invalidate(self, predicate: Callable[[Hashable], bool]) -> None:
+        """Remove every entry whose key matches the predicate"""
+        with self._lock:
+            for key in [k for k in self._data if predicate(k)]:
+                del self._data[key]
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        with self._lock:
+            self._data.clear()
+
+
+def request_memo(request: Request, key: Hashable, loader: Callable[[], Any]) -> Any:
+    """
+    Return loader() once per request; later calls with the same key reuse
+    the first result. Values live on request.state and die with the request,
+    so callers should memoize plain rows/values rather than ORM instances
+    that a commit would expire.
+    """
+    memo = getattr(request.state, "memo", None)
+    if memo is None:
+        memo = request.state.memo = {}
+    if key not in memo:
+        memo[key] = loader()
+    return memo[key]
@@ -1,17 +1,20 @@
 """
 GrowWise Backend — AI-Powered Learning Platform
 """
+import asyncio
 import logging
 import os
 
 from dotenv import load_dotenv
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 from sqlalchemy.orm import Session
 
-from app.database import Base, SessionLocal, engine
+from app.database import Base, SessionLocal, async_engine, engine
 from app.routers import auth, assessment, chat, content, evaluation, learning, progress, tracks
+from app.services.dashboard_rollup import DASHBOARD_ROLLUP_REFRESH_SECONDS, run_rollup_refresher
 from app import models
 from app.utils import get_password_hash
 
@@ -89,6 +92,178 @@ _PATCHES = [
     """
     CREATE INDEX IF NOT EXISTS idx_progress_analysis_reports_user ON progress_analysis_reports(user_id);
     """,
+    # Allow the "generating" status used while questions are created in the background.
+    # Swapped only while the constraint lacks it; added NOT VALID so the
+    # ACCESS EXCLUSIVE lock isn't held for the scan, which VALIDATE (a no-op
+    # once validated) then runs under a lock that lets writes through.
+    """
+    DO $$
+    BEGIN
+        IF NOT EXISTS (
+            SELECT 1 FROM pg_constraint
+            WHERE conrelid = 'assessment_sessions'::regclass
+              AND conname = 'check_assessment_status'
+              AND pg_get_constraintdef(oid) LIKE '%''generating''%'
+        ) THEN
+            ALTER TABLE assessment_sessions DROP CONSTRAINT IF EXISTS check_assessment_status;
+            ALTER TABLE assessment_sessions DROP CONSTRAINT IF EXISTS assessment_sessions_status_check;
+            ALTER TABLE assessment_sessions ADD CONSTRAINT check_assessment_status
+                CHECK (status IN ('generating', 'in_progress', 'completed')) NOT VALID;
+        END IF;
+    END $$;
+    """,
+    """
+    ALTER TABLE assessment_sessions VALIDATE CONSTRAINT check_assessment_status;
+    """,
+    # Indexes on FK columns used as query filters (missing on databases built by create_all).
+    # Until a valid unique (session_id, question_id) index exists, drop any
+    # invalid one a failed build left behind and delete duplicate pairs
+    # (keeping the first row), then build it without blocking writes. The
+    # surrogate id stays the primary key: the model and bulk inserts use it,
+    # and swapping the key would rewrite the table under an exclusive lock.
+    """
+    DO $$
+    BEGIN
+        IF NOT EXISTS (
+            SELECT 1 FROM pg_index
+            WHERE indexrelid = to_regclass('idx_assessment_session_questions_session_question')
+              AND indisvalid
+        ) THEN
+            DROP INDEX IF EXISTS idx_assessment_session_questions_session_question;
+            DELETE FROM assessment_session_questions a
+                USING assessment_session_questions b
+                WHERE a.session_id = b.session_id
+                  AND a.question_id = b.question_id
+                  AND a.id > b.id;
+        END IF;
+    END $$;
+    """,
+    """
+    CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS idx_assessment_session_questions_session_question
+        ON assessment_session_questions(session_id, question_id);
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_assessment_responses_session ON assessment_responses(session_id);
+    """,
+    # Chat history is read by chat_id in message_id order (keyset pages); the
+    # composite index also serves plain chat_id lookups, so it replaces the
+    # old single-column one
+    """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_chat_messages_chat_message
+        ON chat_messages(chat_id, message_id);
+    """,
+    """
+    DROP INDEX CONCURRENTLY IF EXISTS idx_chat_messages_chat;
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_evaluation_dialogues_sequence ON evaluation_dialogues(evaluation_id, sequence_no);
+    """,
+    # Session lookups by (user_id, is_active), latest login, and refresh token.
+    # CONCURRENTLY so an existing user_sessions table isn't write-locked.
+    """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_user_sessions_user_active
+        ON user_sessions(user_id, is_active);
+    """,
+    """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_user_sessions_user_created
+        ON user_sessions(user_id, created_at);
+    """,
+    """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_user_sessions_refresh_token
+        ON user_sessions USING hash (refresh_token);
+    """,
+    # Latest track selection per user (every mentor message) and a user's
+    # chat sessions newest-first
+    """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_user_track_selection_user_selected
+        ON user_track_selection(user_id, selected_at);
+    """,
+    """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_chat_sessions_user_started
+        ON chat_sessions(user_id, started_at);
+    """,
+    # A user's learning paths newest-first (my-paths, current-path)
+    """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_learning_paths_user_created
+        ON learning_paths(user_id, created_at);
+    """,
+    # Latest completed session per user (dashboard) and a user's sessions and
+    # content progress within a date window (timeline)
+    """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_assessment_sessions_user_status_started
+        ON assessment_sessions(user_id, status, started_at);
+    """,
+    """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_evaluation_sessions_user_status_started
+        ON evaluation_sessions(user_id, status, started_at);
+    """,
+    """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_user_content_progress_user_started
+        ON user_content_progress(user_id, started_at);
+    """,
+    # Allow the "evaluating" status used while an evaluation is scored in the
+    # background; swapped and validated like check_assessment_status above
+    """
+    DO $$
+    BEGIN
+        IF NOT EXISTS (
+            SELECT 1 FROM pg_constraint
+            WHERE conrelid = 'evaluation_sessions'::regclass
+              AND conname = 'check_evaluation_status'
+              AND pg_get_constraintdef(oid) LIKE '%''evaluating''%'
+        ) THEN
+            ALTER TABLE evaluation_sessions DROP CONSTRAINT IF EXISTS check_evaluation_status;
+            ALTER TABLE evaluation_sessions DROP CONSTRAINT IF EXISTS evaluation_sessions_status_check;
+            ALTER TABLE evaluation_sessions ADD CONSTRAINT check_evaluation_status
+                CHECK (status IN ('in_progress', 'evaluating', 'completed')) NOT VALID;
+        END IF;
+    END $$;
+    """,
+    """
+    ALTER TABLE evaluation_sessions VALIDATE CONSTRAINT check_evaluation_status;
+    """,
+    # When background scoring claimed a session, so stale claims can be retaken
+    """
+    ALTER TABLE evaluation_sessions
+        ADD COLUMN IF NOT EXISTS scoring_started_at TIMESTAMP NULL;
+    """,
+    # Per-user dashboard counts (see app/services/dashboard_rollup.py); the
+    # unique index lets the periodic refresh run CONCURRENTLY. Views from
+    # before the content totals moved to user_progress_summary are rebuilt.
+    """
+    DO $$
+    BEGIN
+        IF EXISTS (
+            SELECT 1 FROM pg_attribute
+            WHERE attrelid = to_regclass('mv_user_dashboard_rollup')
+              AND attname = 'total_content'
+        ) THEN
+            DROP MATERIALIZED VIEW mv_user_dashboard_rollup;
+        END IF;
+    END $$;
+    CREATE MATERIALIZED VIEW IF NOT EXISTS mv_user_dashboard_rollup AS
+    SELECT
+        u.user_id,
+        COALESCE(lp.total_paths, 0) AS total_paths,
+        COALESCE(a.completed_assessments, 0) AS completed_assessments,
+        COALESCE(e.completed_evaluations, 0) AS completed_evaluations,
+        now() AS refreshed_at
+    FROM users u
+    LEFT JOIN (
+        SELECT user_id, COUNT(*) AS total_paths
+        FROM learning_paths GROUP BY user_id
+    ) lp ON lp.user_id = u.user_id
+    LEFT JOIN (
+        SELECT user_id, COUNT(*) AS completed_assessments
+        FROM assessment_sessions WHERE status = 'completed' GROUP BY user_id
+    ) a ON a.user_id = u.user_id
+    LEFT JOIN (
+        SELECT user_id, COUNT(*) AS completed_evaluations
+        FROM evaluation_sessions WHERE status = 'completed' GROUP BY user_id
+    ) e ON e.user_id = u.user_id;
+    CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_user_dashboard_rollup_user
+        ON mv_user_dashboard_rollup(user_id);
+    """,
 ]
 
 
@@ -96,7 +271,9 @@ def _apply_schema_patches() -> None:
     """Run every patch inside its own transaction so one failure doesn't block the rest."""
     from sqlalchemy import text as sa_text
 
-    with engine.begin() as conn:
+    # Autocommit: each patch commits on its own, and CREATE INDEX CONCURRENTLY
+    # can't run inside a transaction block.
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
         for sql in _PATCHES:
             try:
                 conn.execute(sa_text(sql.strip()))
@@ -108,6 +285,11 @@ ADMIN_EMAIL    = os.getenv("ADMIN_EMAIL",    "admin@gmail.com")
 ADMIN_PASSWORD = os.getenv("ADMIN_PASSWORD", "admin123")
 ADMIN_NAME     = os.getenv("ADMIN_NAME",     "Admin")
 
+# create_all() inspects every table on every worker boot, so it is off unless
+# asked for; deployed databases are built from growwise_database.sql and the
+# patches below. Local setups turn it on in .env (see .env.example).
+RUN_CREATE_ALL = os.getenv("RUN_CREATE_ALL", "false").lower() == "true"
+
 # ---------------------------------------------------------------------------
 # App
 # ---------------------------------------------------------------------------
@@ -117,16 +299,24 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    # orjson renders the encoded response bodies several times faster than stdlib json
+    default_response_class=ORJSONResponse,
 )
 
 CORS_ORIGINS = os.getenv("CORS_ORIGINS", "http://localhost:3000,http://localhost:5173").split(",")
+DEBUG = os.getenv("DEBUG", "false").lower() == "true"
 app.add_middleware(
     CORSMiddleware,
     allow_origins=CORS_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Pagination cursor of GET /api/chat/sessions/{chat_id}/messages
+    expose_headers=["X-Next-Cursor"],
 )
+# Compress JSON bodies (session/user/assessment lists grow with activity);
+# small replies are left alone since gzip would only add overhead.
+app.add_middleware(GZipMiddleware, minimum_size=500, compresslevel=5)
 
 app.include_router(auth.router)
 app.include_router(tracks.router)
@@ -143,15 +333,17 @@ app.include_router(progress.router)
 # ---------------------------------------------------------------------------
 @app.on_event("startup")
 async def startup_event():
-    log.info("━" * 50)
-    log.info("🌱  GrowWise Backend starting ...")
+    log.info("%s\n🌱  GrowWise Backend starting ...", "━" * 50)
 
     # Create all tables that do not exist yet (schema defined in growwise_database.sql)
-    try:
-        Base.metadata.create_all(bind=engine)
-        log.info("✅  Database tables ready")
-    except Exception as exc:
-        log.error("❌  Database error: %s", exc)
+    if RUN_CREATE_ALL:
+        try:
+            Base.metadata.create_all(bind=engine)
+            log.info("✅  Database tables ready")
+        except Exception as exc:
+            log.error("❌  Database error: %s", exc)
+    else:
+        log.info("⏭️  create_all skipped (set RUN_CREATE_ALL=true to enable)")
 
     # Apply additive schema patches — safe to re-run (IF NOT EXISTS / DO NOTHING)
     _apply_schema_patches()
@@ -181,9 +373,13 @@ async def startup_event():
     finally:
         db.close()
 
+    # Keep mv_user_dashboard_rollup current (the dashboard falls back to live
+    # totals for users who wrote since the last refresh)
+    if DASHBOARD_ROLLUP_REFRESH_SECONDS > 0:
+        app.state.rollup_refresher = asyncio.create_task(run_rollup_refresher())
+
     port = os.getenv("PORT", "8001")
-    log.info("🚀  Live  →  http://localhost:%s/docs", port)
-    log.info("━" * 50)
+    log.info("🚀  Live  →  http://localhost:%s/docs\n%s", port, "━" * 50)
 
 
 # ---------------------------------------------------------------------------
@@ -191,6 +387,10 @@ async def startup_event():
 # ---------------------------------------------------------------------------
 @app.on_event("shutdown")
 async def shutdown_event():
+    refresher = getattr(app.state, "rollup_refresher", None)
+    if refresher is not None:
+        refresher.cancel()
+    await async_engine.dispose()
     log.info("👋  GrowWise Backend shutting down.")
 
 
@@ -214,7 +414,7 @@ async def global_exception_handler(request: Request, exc: Exception):
         status_code=500,
         content={
             "detail": "Internal server error",
-            "error": str(exc) if os.getenv("DEBUG", "false").lower() == "true" else "An error occurred",
+            "error": str(exc) if DEBUG else "An error occurred",
         },
     )
 
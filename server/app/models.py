@@ -3,7 +3,7 @@ SQLAlchemy models mapping to database schema
 """
 from sqlalchemy import (
     Column, Integer, String, Text, TIMESTAMP, ForeignKey,
-    CheckConstraint, UniqueConstraint, DECIMAL, Boolean, text
+    CheckConstraint, UniqueConstraint, Index, DECIMAL, Boolean, Computed, text
 )
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
@@ -53,6 +53,12 @@ class UserSession(Base):
     expires_at = Column(TIMESTAMP, nullable=False)
     last_activity = Column(TIMESTAMP, server_default=func.current_timestamp(), onupdate=func.current_timestamp())
 
+    __table_args__ = (
+        Index("idx_user_sessions_user_active", "user_id", "is_active"),
+        Index("idx_user_sessions_user_created", "user_id", "created_at"),
+        Index("idx_user_sessions_refresh_token", "refresh_token", postgresql_using="hash"),
+    )
+
     # Relationships
     user = relationship("User", back_populates="sessions")
 
@@ -116,6 +122,10 @@ class UserTrackSelection(Base):
     track_id = Column(Integer, ForeignKey("tracks.track_id", ondelete="CASCADE"), nullable=False)
     selected_at = Column(TIMESTAMP, server_default=func.current_timestamp())
 
+    __table_args__ = (
+        Index("idx_user_track_selection_user_selected", "user_id", "selected_at"),
+    )
+
     # Relationships
     user = relationship("User", back_populates="track_selections")
     track = relationship("Track", back_populates="user_selections")
@@ -132,9 +142,14 @@ class AssessmentSession(Base):
     completed_at = Column(TIMESTAMP, nullable=True)
 
     __table_args__ = (
-        CheckConstraint("status IN ('in_progress', 'completed')", name="check_assessment_status"),
+        CheckConstraint("status IN ('generating', 'in_progress', 'completed')", name="check_assessment_status"),
+        Index("idx_assessment_sessions_user_status_started", "user_id", "status", "started_at"),
     )
 
+    # Fetch server defaults (ids, timestamps) with INSERT ... RETURNING
+    # instead of a refresh() SELECT after commit
+    __mapper_args__ = {"eager_defaults": True}
+
     # Relationships
     user = relationship("User", back_populates="assessment_sessions")
     track = relationship("Track", back_populates="assessment_sessions")
@@ -177,6 +192,10 @@ class AssessmentSessionQuestion(Base):
     session_id = Column(Integer, ForeignKey("assessment_sessions.session_id", ondelete="CASCADE"), nullable=False)
     question_id = Column(Integer, ForeignKey("assessment_question_pool.question_id", ondelete="CASCADE"), nullable=False)
 
+    __table_args__ = (
+        Index("idx_assessment_session_questions_session_question", "session_id", "question_id", unique=True),
+    )
+
     # Relationships
     session = relationship("AssessmentSession", back_populates="session_questions")
     question = relationship("AssessmentQuestionPool", back_populates="session_questions")
@@ -197,6 +216,7 @@ class AssessmentResponse(Base):
 
     __table_args__ = (
         CheckConstraint("ai_score >= 0 AND ai_score <= 1", name="check_ai_score_range"),
+        Index("idx_assessment_responses_session", "session_id"),
     )
 
     # Relationships
@@ -270,6 +290,10 @@ class LearningPath(Base):
     result_id = Column(Integer, ForeignKey("assessment_results.result_id", ondelete="CASCADE"), nullable=False)
     created_at = Column(TIMESTAMP, server_default=func.current_timestamp())
 
+    __table_args__ = (
+        Index("idx_learning_paths_user_created", "user_id", "created_at"),
+    )
+
     # Relationships
     user = relationship("User", back_populates="learning_paths")
     result = relationship("AssessmentResult", back_populates="learning_paths")
@@ -373,13 +397,51 @@ class UserContentProgress(Base):
     __table_args__ = (
         CheckConstraint("completion_percentage >= 0 AND completion_percentage <= 100", name="check_completion_percentage"),
         UniqueConstraint("user_id", "content_id", name="unique_user_content"),
+        Index("idx_user_content_progress_user_started", "user_id", "started_at"),
     )
 
+    # Fetch server defaults (ids, timestamps) with INSERT ... RETURNING
+    # instead of a refresh() SELECT after commit
+    __mapper_args__ = {"eager_defaults": True}
+
     # Relationships
     user = relationship("User", back_populates="content_progress")
     content = relationship("StageContent", back_populates="user_progress")
 
 
+class LearningPathStageProgress(Base):
+    """
+    Per-user stage totals, kept current by app.services.stage_progress on
+    every progress write so progress reads don't aggregate content rows
+    """
+    __tablename__ = "learning_path_stage_progress"
+
+    user_id = Column(Integer, ForeignKey("users.user_id", ondelete="CASCADE"), primary_key=True)
+    stage_id = Column(Integer, ForeignKey("learning_path_stages.stage_id", ondelete="CASCADE"), primary_key=True)
+    total_content = Column(Integer, nullable=False, default=0)
+    completed_content = Column(Integer, nullable=False, default=0)
+    time_spent_minutes = Column(Integer, nullable=False, default=0)
+    updated_at = Column(TIMESTAMP, server_default=func.current_timestamp())
+
+
+class UserProgressSummary(Base):
+    """
+    Per-user content totals across all of the user's paths, rebuilt by
+    app.services.stage_progress whenever their progress, content or paths
+    change, so the dashboard reads one row
+    """
+    __tablename__ = "user_progress_summary"
+
+    user_id = Column(Integer, ForeignKey("users.user_id", ondelete="CASCADE"), primary_key=True)
+    total_content_items = Column(Integer, nullable=False, default=0)
+    completed_items = Column(Integer, nullable=False, default=0)
+    total_time_minutes = Column(Integer, nullable=False, default=0)
+    completion_percentage = Column(Integer, Computed(
+        "CASE WHEN total_content_items > 0 THEN completed_items * 100 / total_content_items ELSE 0 END"
+    ))
+    updated_at = Column(TIMESTAMP, server_default=func.current_timestamp())
+
+
 class KnowledgeBase(Base):
     __tablename__ = "knowledge_base"
 
@@ -387,6 +449,9 @@ class KnowledgeBase(Base):
     track_id = Column(Integer, ForeignKey("tracks.track_id", ondelete="CASCADE"), nullable=False)
     content = Column(Text, nullable=False)
     source = Column(String(500), nullable=False)
+    # Placeholder only: retrieval goes through the external RAG service, which
+    # owns the embeddings. Move to pgvector's Vector(dim) + HNSW index if
+    # similarity search is ever done in Postgres.
     embedding_vector = Column(Text, nullable=False)
 
     # Relationships
@@ -401,6 +466,14 @@ class ChatSession(Base):
     stage_id = Column(Integer, ForeignKey("learning_path_stages.stage_id", ondelete="CASCADE"), nullable=False)
     started_at = Column(TIMESTAMP, server_default=func.current_timestamp())
 
+    __table_args__ = (
+        Index("idx_chat_sessions_user_started", "user_id", "started_at"),
+    )
+
+    # Fetch server defaults (ids, timestamps) with INSERT ... RETURNING
+    # instead of a refresh() SELECT after commit
+    __mapper_args__ = {"eager_defaults": True}
+
     # Relationships
     user = relationship("User", back_populates="chat_sessions")
     stage = relationship("LearningPathStage", back_populates="chat_sessions")
@@ -418,8 +491,13 @@ class ChatMessage(Base):
 
     __table_args__ = (
         CheckConstraint("sender IN ('user', 'ai')", name="check_message_sender"),
+        Index("idx_chat_messages_chat_message", "chat_id", "message_id"),
     )
 
+    # Fetch server defaults (ids, timestamps) with INSERT ... RETURNING
+    # instead of a refresh() SELECT after commit
+    __mapper_args__ = {"eager_defaults": True}
+
     # Relationships
     chat = relationship("ChatSession", back_populates="messages")
 
@@ -433,15 +511,25 @@ class EvaluationSession(Base):
     status = Column(String(20), nullable=False)
     started_at = Column(TIMESTAMP, server_default=func.current_timestamp())
     completed_at = Column(TIMESTAMP, nullable=True)
+    # When background scoring claimed the session (status "evaluating")
+    scoring_started_at = Column(TIMESTAMP, nullable=True)
 
     __table_args__ = (
-        CheckConstraint("status IN ('in_progress', 'completed')", name="check_evaluation_status"),
+        CheckConstraint("status IN ('in_progress', 'evaluating', 'completed')", name="check_evaluation_status"),
+        Index("idx_evaluation_sessions_user_status_started", "user_id", "status", "started_at"),
     )
 
+    # Fetch server defaults (ids, timestamps) with INSERT ... RETURNING
+    # instead of a refresh() SELECT after commit
+    __mapper_args__ = {"eager_defaults": True}
+
     # Relationships
     user = relationship("User", back_populates="evaluation_sessions")
     path = relationship("LearningPath", back_populates="evaluation_sessions")
-    dialogues = relationship("EvaluationDialogue", back_populates="evaluation", cascade="all, delete-orphan")
+    dialogues = relationship(
+        "EvaluationDialogue", back_populates="evaluation", cascade="all, delete-orphan",
+        order_by="EvaluationDialogue.sequence_no"
+    )
     result = relationship("EvaluationResult", back_populates="evaluation", uselist=False, cascade="all, delete-orphan")
 
 
@@ -456,6 +544,7 @@ class EvaluationDialogue(Base):
 
     __table_args__ = (
         CheckConstraint("speaker IN ('ai', 'user')", name="check_dialogue_speaker"),
+        Index("idx_evaluation_dialogues_sequence", "evaluation_id", "sequence_no"),
     )
 
     # Relationships
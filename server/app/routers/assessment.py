@@ -1,19 +1,25 @@
 """
 Assessment router - handles AI-driven skill assessment
 """
+import asyncio
 import json
 import logging
-from collections import defaultdict
 from datetime import datetime
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, Response, status
+from sqlalchemy import Row, bindparam, delete, exists, func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, raiseload
 
-from app.database import get_db
+from app.cache import TTLCache, request_memo
+from app.database import AsyncSessionLocal, get_async_db, get_db
 from app import models, schemas
 from app.auth_middleware import get_current_user, get_admin_user
 from app.services.ai_service import ai_service
+from app.services.dashboard_cache import invalidate_user_views
+from app.services.stage_progress import refresh_user_summary
+from app.services.track_cache import get_cached_track
 from app.ai_services.assessment_question_generator import generate_assessment_questions
 from app.ai_services.answer_evaluator import evaluate_answers_batch
 from app.ai_services.learning_path_generator import generate_learning_path_stages
@@ -23,6 +29,74 @@ log = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/assessment", tags=["Assessment"])
 
+# Serialized question lists. The pool only grows (admin adds, or a new session
+# generates its set) and a session's questions never change once linked.
+_track_questions_cache = TTLCache(ttl_seconds=300, max_size=1_000)
+_session_questions_cache = TTLCache(ttl_seconds=300, max_size=10_000)
+
+
+# Columns of AssessmentQuestionResponse, for projection-only list queries
+_QUESTION_RESPONSE_COLUMNS = (
+    models.AssessmentQuestionPool.question_id,
+    models.AssessmentQuestionPool.track_id,
+    models.AssessmentQuestionPool.dimension_id,
+    models.AssessmentQuestionPool.question_text,
+    models.AssessmentQuestionPool.question_type,
+    models.AssessmentQuestionPool.difficulty,
+)
+
+# Columns of AssessmentSessionResponse; rows are serialized without ORM hydration
+_SESSION_RESPONSE_COLUMNS = (
+    models.AssessmentSession.session_id,
+    models.AssessmentSession.user_id,
+    models.AssessmentSession.track_id,
+    models.AssessmentSession.status,
+    models.AssessmentSession.started_at,
+    models.AssessmentSession.completed_at,
+)
+
+# Prebuilt track question lists; the unfiltered form is the common case
+_QUESTIONS_BY_TRACK_STMT = select(*_QUESTION_RESPONSE_COLUMNS).where(
+    models.AssessmentQuestionPool.track_id == bindparam("track_id")
+)
+_QUESTIONS_BY_TRACK_DIFFICULTY_STMT = _QUESTIONS_BY_TRACK_STMT.where(
+    models.AssessmentQuestionPool.difficulty == bindparam("difficulty")
+)
+
+# Question/dimension fields used when scoring and reporting a session
+_QUESTION_BRIEF_STMT = select(
+    models.AssessmentQuestionPool.question_text,
+    models.AssessmentQuestionPool.question_type,
+    models.AssessmentQuestionPool.dimension_id,
+).where(models.AssessmentQuestionPool.question_id == bindparam("question_id"))
+_DIMENSION_BRIEF_STMT = select(
+    models.AssessmentDimension.name,
+    models.AssessmentDimension.description,
+    models.AssessmentDimension.weight,
+).where(models.AssessmentDimension.dimension_id == bindparam("dimension_id"))
+
+
+def _invalidate_track_questions(track_id: int) -> None:
+    _track_questions_cache.invalidate(lambda key: key[0] == track_id)
+
+
+def _question_brief(request: Request, db: Session, question_id: int) -> Optional[Row]:
+    """Question text/type/dimension, loaded at most once per request"""
+    return request_memo(
+        request, ("assessment_question", question_id),
+        lambda: db.execute(_QUESTION_BRIEF_STMT, {"question_id": question_id}).first()
+    )
+
+
+def _dimension_brief(request: Request, db: Session, dimension_id: Optional[int]) -> Optional[Row]:
+    """Dimension name/description/weight, loaded at most once per request"""
+    if not dimension_id:
+        return None
+    return request_memo(
+        request, ("assessment_dimension", dimension_id),
+        lambda: db.execute(_DIMENSION_BRIEF_STMT, {"dimension_id": dimension_id}).first()
+    )
+
 
 # ============================================================================
 # Assessment Question Pool Management (Admin)
@@ -32,7 +106,7 @@ router = APIRouter(prefix="/api/assessment", tags=["Assessment"])
 def create_question(
     question_data: schemas.AssessmentQuestionCreate,
     db: Session = Depends(get_db),
-    admin_user: models.User = Depends(get_admin_user)
+    admin_user: Row = Depends(get_admin_user)
 ):
     """
     Add a question to the assessment pool (Admin only)
@@ -41,9 +115,38 @@ def create_question(
     db.add(new_question)
     db.commit()
     db.refresh(new_question)
+    _invalidate_track_questions(new_question.track_id)
     return new_question
 
 
+@router.post("/questions/bulk", response_model=List[schemas.AssessmentQuestionResponse], status_code=status.HTTP_201_CREATED)
+def create_questions_bulk(
+    questions_data: List[schemas.AssessmentQuestionCreate],
+    db: Session = Depends(get_db),
+    admin_user: Row = Depends(get_admin_user)
+):
+    """
+    Add many questions to the assessment pool in one INSERT (Admin only)
+    """
+    if not questions_data:
+        return []
+
+    new_questions = db.scalars(
+        insert(models.AssessmentQuestionPool).returning(
+            models.AssessmentQuestionPool,
+            sort_by_parameter_order=True,
+        ),
+        [q.model_dump() for q in questions_data],
+    ).all()
+    # Serialize before commit expires the returned rows
+    response = [schemas.AssessmentQuestionResponse.model_validate(q) for q in new_questions]
+    db.commit()
+
+    for track_id in {q.track_id for q in questions_data}:
+        _invalidate_track_questions(track_id)
+    return response
+
+
 @router.get("/questions/track/{track_id}", response_model=List[schemas.AssessmentQuestionResponse])
 def get_questions_by_track(
     track_id: int,
@@ -53,14 +156,22 @@ def get_questions_by_track(
     """
     Get assessment questions for a specific track
     """
-    query = db.query(models.AssessmentQuestionPool).filter(
-        models.AssessmentQuestionPool.track_id == track_id
-    )
-    
+    cache_key = (track_id, difficulty)
+    cached = _track_questions_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    # Project only the response columns; no ORM instances needed for a list
     if difficulty:
-        query = query.filter(models.AssessmentQuestionPool.difficulty == difficulty)
-    
-    questions = query.all()
+        rows = db.execute(
+            _QUESTIONS_BY_TRACK_DIFFICULTY_STMT,
+            {"track_id": track_id, "difficulty": difficulty},
+        )
+    else:
+        rows = db.execute(_QUESTIONS_BY_TRACK_STMT, {"track_id": track_id})
+
+    questions = [schemas.AssessmentQuestionResponse.model_validate(q) for q in rows]
+    _track_questions_cache.set(cache_key, questions)
     return questions
 
 
@@ -68,27 +179,137 @@ def get_questions_by_track(
 # Assessment Session Management
 # ============================================================================
 
+async def _insert_session_questions(
+    db: AsyncSession, session_id: int, track_id: int, ai_questions: List[dict]
+) -> None:
+    """
+    Store generated questions in the pool and link them to the session
+    (one multi-row INSERT ... RETURNING, then one bulk link INSERT).
+    Does not commit.
+    """
+    if not ai_questions:
+        return
+
+    question_ids = (await db.scalars(
+        insert(models.AssessmentQuestionPool).returning(
+            models.AssessmentQuestionPool.question_id,
+            sort_by_parameter_order=True,
+        ),
+        [
+            {
+                "track_id": track_id,
+                "dimension_id": None,
+                "question_text": q_data["question_text"],
+                "question_type": q_data["question_type"],
+                "difficulty": q_data["difficulty"],
+            }
+            for q_data in ai_questions
+        ],
+    )).all()
+
+    await db.execute(
+        insert(models.AssessmentSessionQuestion),
+        [
+            {"session_id": session_id, "question_id": question_id}
+            for question_id in question_ids
+        ],
+    )
+
+
+async def _generate_and_store_questions(session_id: int, track_id: int, track_name: str) -> None:
+    """
+    Background task for ?background=true sessions: generate the questions,
+    link them, then flip the session from "generating" to "in_progress".
+
+    On failure the placeholder session is deleted, so clients polling it get
+    a 404 instead of waiting forever.
+    """
+    try:
+        ai_questions = await generate_assessment_questions(
+            track_name=track_name,
+            count=10,
+        )
+        async with AsyncSessionLocal() as db:
+            await _insert_session_questions(db, session_id, track_id, ai_questions)
+            await db.execute(
+                update(models.AssessmentSession)
+                .where(models.AssessmentSession.session_id == session_id)
+                .values(status="in_progress")
+            )
+            await db.commit()
+        _invalidate_track_questions(track_id)
+    except Exception as exc:
+        log.error("Question generation failed for session %s: %s", session_id, exc, exc_info=True)
+        try:
+            async with AsyncSessionLocal() as db:
+                await db.execute(
+                    delete(models.AssessmentSession)
+                    .where(models.AssessmentSession.session_id == session_id)
+                )
+                await db.commit()
+        except Exception as cleanup_exc:
+            log.error("Could not remove session %s: %s", session_id, cleanup_exc)
+
+
 @router.post("/sessions", response_model=schemas.AssessmentSessionResponse, status_code=status.HTTP_201_CREATED)
 async def create_assessment_session(
     session_data: schemas.AssessmentSessionCreate,
-    db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user)
+    background_tasks: BackgroundTasks,
+    response: Response,
+    background: bool = False,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Row = Depends(get_current_user)
 ):
     """
     Start a new assessment session for a user
+
+    With ?background=true the session is returned immediately (202, status
+    "generating") and questions are generated after the response is sent;
+    poll GET /sessions/{id} until status is "in_progress".
     """
-    # Verify track exists
-    track = db.query(models.Track).filter(
-        models.Track.track_id == session_data.track_id
-    ).first()
+    # Verify track exists (uncached, since the session references it)
+    track = await db.get(models.Track, session_data.track_id)
     
     if not track:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Track not found"
         )
+
+    if background:
+        new_session = models.AssessmentSession(
+            user_id=current_user.user_id,
+            track_id=session_data.track_id,
+            status="generating"
+        )
+        db.add(new_session)
+        await db.commit()
+        invalidate_user_views(current_user.user_id)
+
+        background_tasks.add_task(
+            _generate_and_store_questions,
+            new_session.session_id,
+            session_data.track_id,
+            track.track_name,
+        )
+        response.status_code = status.HTTP_202_ACCEPTED
+        return new_session
     
-    # Create assessment session
+    # End the read-only transaction so no pooled connection sits idle
+    # through the AI call below
+    track_name = track.track_name
+    await db.rollback()
+
+    # ------------------------------------------------------------------
+    # Generate 10 questions (single prompt, track-only input). Done before
+    # any writes so the session and its questions land in one transaction.
+    # ------------------------------------------------------------------
+    ai_questions = await generate_assessment_questions(
+        track_name=track_name,
+        count=10,
+    )
+
+    # Create assessment session (flush only, to get its ID)
     new_session = models.AssessmentSession(
         user_id=current_user.user_id,
         track_id=session_data.track_id,
@@ -96,40 +317,14 @@ async def create_assessment_session(
     )
     
     db.add(new_session)
-    db.commit()
-    db.refresh(new_session)
-
-    # ------------------------------------------------------------------
-    # Generate 10 questions (single prompt, track-only input)
-    # ------------------------------------------------------------------
-    ai_questions = await generate_assessment_questions(
-        track_name=track.track_name,
-        count=10,
-    )
+    await db.flush()
 
-    # ------------------------------------------------------------------
-    # Store questions in the pool and link them to this session
-    # ------------------------------------------------------------------
-    for q_data in ai_questions:
-        question = models.AssessmentQuestionPool(
-            track_id=session_data.track_id,
-            dimension_id=None,
-            question_text=q_data["question_text"],
-            question_type=q_data["question_type"],
-            difficulty=q_data["difficulty"],
-        )
-        db.add(question)
-        db.flush()
+    await _insert_session_questions(db, new_session.session_id, session_data.track_id, ai_questions)
 
-        db.add(
-            models.AssessmentSessionQuestion(
-                session_id=new_session.session_id,
-                question_id=question.question_id,
-            )
-        )
-
-    db.commit()
-    db.refresh(new_session)
+    # Session and its questions are committed together (or not at all)
+    await db.commit()
+    _invalidate_track_questions(session_data.track_id)
+    invalidate_user_views(current_user.user_id)
 
     return new_session
 
@@ -138,12 +333,14 @@ async def create_assessment_session(
 def get_assessment_session(
     session_id: int,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user)
+    current_user: Row = Depends(get_current_user)
 ):
     """
     Get details of an assessment session
     """
-    session = db.query(models.AssessmentSession).filter(
+    # AssessmentSessionResponse is flat; raiseload makes any future nested
+    # field fail loudly instead of silently adding lazy SELECTs.
+    session = db.query(models.AssessmentSession).options(raiseload("*")).filter(
         models.AssessmentSession.session_id == session_id,
         models.AssessmentSession.user_id == current_user.user_id
     ).first()
@@ -161,11 +358,16 @@ def get_assessment_session(
 def get_session_questions(
     session_id: int,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user)
+    current_user: Row = Depends(get_current_user)
 ):
     """
     Get all questions for an assessment session
     """
+    cache_key = (session_id, current_user.user_id)
+    cached = _session_questions_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     # Verify session belongs to user
     session = db.query(models.AssessmentSession).filter(
         models.AssessmentSession.session_id == session_id,
@@ -178,12 +380,18 @@ def get_session_questions(
             detail="Assessment session not found"
         )
     
-    # Get questions for this session
-    session_questions = db.query(models.AssessmentSessionQuestion).filter(
+    # Get questions for this session in one JOIN (keeps the order they were linked)
+    questions = db.query(*_QUESTION_RESPONSE_COLUMNS).join(
+        models.AssessmentSessionQuestion,
+        models.AssessmentSessionQuestion.question_id == models.AssessmentQuestionPool.question_id
+    ).filter(
         models.AssessmentSessionQuestion.session_id == session_id
-    ).all()
-    
-    questions = [sq.question for sq in session_questions]
+    ).order_by(models.AssessmentSessionQuestion.id).all()
+
+    questions = [schemas.AssessmentQuestionResponse.model_validate(q) for q in questions]
+    if questions:
+        # Empty means generation is still running (?background=true)
+        _session_questions_cache.set(cache_key, questions)
     return questions
 
 
@@ -196,7 +404,7 @@ async def submit_answer(
     session_id: int,
     answer_data: schemas.AssessmentAnswerSubmit,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user)
+    current_user: Row = Depends(get_current_user)
 ):
     """
     Submit an answer for a question in the assessment
@@ -220,23 +428,20 @@ async def submit_answer(
         )
     
     # Verify question belongs to this session
-    session_question = db.query(models.AssessmentSessionQuestion).filter(
-        models.AssessmentSessionQuestion.session_id == session_id,
-        models.AssessmentSessionQuestion.question_id == answer_data.question_id
-    ).first()
+    # EXISTS only: the pool row is guaranteed by the session_questions FK and
+    # nothing from it is needed until batch evaluation on complete
+    question_in_session = db.scalar(
+        select(exists().where(
+            models.AssessmentSessionQuestion.session_id == session_id,
+            models.AssessmentSessionQuestion.question_id == answer_data.question_id
+        ))
+    )
     
-    if not session_question:
+    if not question_in_session:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Question not part of this assessment"
         )
-    
-    # Get question with its dimension and track (for validation only)
-    question = (
-        db.query(models.AssessmentQuestionPool)
-        .filter(models.AssessmentQuestionPool.question_id == answer_data.question_id)
-        .first()
-    )
 
     # ------------------------------------------------------------------
     # Store answer WITHOUT AI evaluation — batch evaluation happens on complete
@@ -252,16 +457,20 @@ async def submit_answer(
     )
 
     db.add(response)
+    # The INSERT returns response_id/submitted_at, so build the reply before
+    # commit expires the instance (no reload SELECT afterwards)
+    db.flush()
+    response_data = schemas.AssessmentResponseResponse.model_validate(response)
     db.commit()
-    db.refresh(response)
-    return response
+    return response_data
 
 
 @router.post("/sessions/{session_id}/complete", response_model=schemas.AssessmentResultResponse)
 async def complete_assessment(
     session_id: int,
+    request: Request,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user)
+    current_user: Row = Depends(get_current_user)
 ):
     """
     Complete the assessment and generate results with AI analysis
@@ -285,9 +494,7 @@ async def complete_assessment(
         )
 
     # Fetch track for context
-    track = db.query(models.Track).filter(
-        models.Track.track_id == session.track_id
-    ).first()
+    track = get_cached_track(db, session.track_id)
 
     # Get all responses for this session
     responses = db.query(models.AssessmentResponse).filter(
@@ -307,16 +514,10 @@ async def complete_assessment(
     qa_for_batch = []
     valid_indices = []
     for i, resp in enumerate(responses):
-        q = db.query(models.AssessmentQuestionPool).filter(
-            models.AssessmentQuestionPool.question_id == resp.question_id
-        ).first()
+        q = _question_brief(request, db, resp.question_id)
         if not q:
             continue
-        dim = None
-        if q.dimension_id:
-            dim = db.query(models.AssessmentDimension).filter(
-                models.AssessmentDimension.dimension_id == q.dimension_id
-            ).first()
+        dim = _dimension_brief(request, db, q.dimension_id)
         qa_for_batch.append({
             "question_text": q.question_text,
             "user_answer": resp.user_answer,
@@ -340,37 +541,48 @@ async def complete_assessment(
         resp.ai_explanation = ev.get("explanation", "") or ""
         resp.criteria_scores = json.dumps(ev.get("criteria_scores", {}))
     db.commit()
-    for r in responses:
-        db.refresh(r)
+    # Reload the committed rows in one SELECT rather than a refresh per row
+    responses = db.query(models.AssessmentResponse).filter(
+        models.AssessmentResponse.session_id == session_id
+    ).order_by(models.AssessmentResponse.response_id).all()
 
     # ------------------------------------------------------------------
-    # Aggregate per-dimension scores
+    # Aggregate per-dimension scores in SQL (unscored answers count as 0)
     # ------------------------------------------------------------------
-    dim_scores: dict = defaultdict(list)   # dimension_id -> [final_score, ...]
-    for resp in responses:
-        q = db.query(models.AssessmentQuestionPool).filter(
-            models.AssessmentQuestionPool.question_id == resp.question_id
-        ).first()
-        if q and q.dimension_id:
-            dim_scores[q.dimension_id].append(float(resp.ai_score) if resp.ai_score else 0.0)
+    dim_scores = (
+        db.query(
+            models.AssessmentQuestionPool.dimension_id,
+            func.avg(func.coalesce(models.AssessmentResponse.ai_score, 0)),
+            func.count(),
+        )
+        .join(
+            models.AssessmentQuestionPool,
+            models.AssessmentQuestionPool.question_id == models.AssessmentResponse.question_id,
+        )
+        .filter(
+            models.AssessmentResponse.session_id == session_id,
+            models.AssessmentQuestionPool.dimension_id.isnot(None),
+        )
+        .group_by(models.AssessmentQuestionPool.dimension_id)
+        .all()
+    )
 
     # Fetch dimension weights and store per-dimension result rows
-    dimension_map: dict = {}  # dimension_id -> AssessmentDimension
-    for dim_id in dim_scores:
-        dim = db.query(models.AssessmentDimension).filter(
-            models.AssessmentDimension.dimension_id == dim_id
-        ).first()
-        if dim:
-            dimension_map[dim_id] = dim
+    dimension_map: dict = {  # dimension_id -> AssessmentDimension
+        dim.dimension_id: dim
+        for dim in db.query(models.AssessmentDimension).filter(
+            models.AssessmentDimension.dimension_id.in_([dim_id for dim_id, _, _ in dim_scores])
+        )
+    }
 
     weighted_total = 0.0
     total_weight_used = 0.0
 
-    for dim_id, scores in dim_scores.items():
+    for dim_id, avg_score, questions_evaluated in dim_scores:
         dim = dimension_map.get(dim_id)
         if not dim:
             continue
-        avg_score = sum(scores) / len(scores)
+        avg_score = float(avg_score)
         weight = float(dim.weight)
         contribution = round(avg_score * weight, 4)
         weighted_total += contribution
@@ -387,7 +599,7 @@ async def complete_assessment(
                 dimension_id=dim_id,
                 dimension_score=round(avg_score, 3),
                 weighted_contribution=contribution,
-                questions_evaluated=len(scores),
+                questions_evaluated=questions_evaluated,
             ))
 
     # ------------------------------------------------------------------
@@ -397,9 +609,12 @@ async def complete_assessment(
         # Dimension-aware: weighted average normalised to [0, 100]
         overall_score = round((weighted_total / total_weight_used) * 100, 2)
     else:
-        # Fallback: plain average across all responses
-        scores_all = [float(r.ai_score) for r in responses if r.ai_score]
-        overall_score = round((sum(scores_all) / len(scores_all)) * 100, 2) if scores_all else 0.0
+        # Fallback: plain average across all scored responses
+        avg_all = db.query(func.avg(models.AssessmentResponse.ai_score)).filter(
+            models.AssessmentResponse.session_id == session_id,
+            models.AssessmentResponse.ai_score != 0,
+        ).scalar()
+        overall_score = round(float(avg_all) * 100, 2) if avg_all is not None else 0.0
 
     # Determine skill level
     if overall_score >= 80:
@@ -412,17 +627,11 @@ async def complete_assessment(
     # Build full Q&A context for comprehensive report (and later for learning path)
     questions_and_answers = []
     for resp in responses:
-        q = db.query(models.AssessmentQuestionPool).filter(
-            models.AssessmentQuestionPool.question_id == resp.question_id
-        ).first()
+        q = _question_brief(request, db, resp.question_id)
         if not q:
             continue
 
-        dim = None
-        if q.dimension_id:
-            dim = db.query(models.AssessmentDimension).filter(
-                models.AssessmentDimension.dimension_id == q.dimension_id
-            ).first()
+        dim = _dimension_brief(request, db, q.dimension_id)
 
         raw_criteria = resp.criteria_scores
         try:
@@ -439,12 +648,21 @@ async def complete_assessment(
             "ai_explanation": resp.ai_explanation or "",
         })
 
+    response_data = [{"answer": r.user_answer, "score": float(r.ai_score)} for r in responses]
+
     # Send ALL Q&A to AI for comprehensive report (used for content generation)
-    comprehensive_report = await generate_comprehensive_report(
-        track_name=track.track_name if track else "General Track",
-        questions_and_answers=questions_and_answers,
-        overall_score=overall_score,
-        detected_level=detected_level,
+    # and generate the skill profile; the two AI calls are independent
+    comprehensive_report, skill_profile_data = await asyncio.gather(
+        generate_comprehensive_report(
+            track_name=track.track_name if track else "General Track",
+            questions_and_answers=questions_and_answers,
+            overall_score=overall_score,
+            detected_level=detected_level,
+        ),
+        ai_service.analyze_skill_profile(
+            responses=response_data,
+            overall_score=overall_score
+        ),
     )
     ai_reasoning = comprehensive_report.get("executive_summary", "") or (
         f"Based on {len(responses)} responses with weighted average score {overall_score:.2f}%, "
@@ -465,14 +683,6 @@ async def complete_assessment(
     # Update session status
     session.status = "completed"
     session.completed_at = datetime.utcnow()
-
-    response_data = [{"answer": r.user_answer, "score": float(r.ai_score)} for r in responses]
-
-    # Generate skill profile
-    skill_profile_data = await ai_service.analyze_skill_profile(
-        responses=response_data,
-        overall_score=overall_score
-    )
     
     # Check if user already has a skill profile
     existing_profile = db.query(models.SkillProfile).filter(
@@ -494,8 +704,14 @@ async def complete_assessment(
         )
         db.add(skill_profile)
     
+    # Snapshot the reply before commit expires result/responses; the INSERT
+    # above returns result_id, so no refresh round-trip is needed
+    db.flush()
+    result_data = schemas.AssessmentResultResponse.model_validate(result)
+    evaluated_responses = [schemas.AssessmentResponseResponse.model_validate(r) for r in responses]
     db.commit()
-    db.refresh(result)
+
+    learning_path_id = None
 
     # ------------------------------------------------------------------
     # Auto-generate learning path stages from raw Q&A context
@@ -517,7 +733,7 @@ async def complete_assessment(
         # Create learning_paths row
         learning_path = models.LearningPath(
             user_id=current_user.user_id,
-            result_id=result.result_id,
+            result_id=result_data.result_id,
         )
         db.add(learning_path)
         db.flush()
@@ -531,25 +747,23 @@ async def complete_assessment(
                 focus_area=stage_data["focus_area"],
             ))
 
-        db.commit()
-        db.refresh(result)
-
         # Attach learning_path_id to the response (not a DB column — set dynamically)
-        result.learning_path_id = learning_path.path_id
-        log.info("✅  Learning path created for session %s: path_id=%s, stages=%s", session_id, learning_path.path_id, len(stages_data))
+        learning_path_id = learning_path.path_id
+        db.commit()
+        log.info("✅  Learning path created for session %s: path_id=%s, stages=%s", session_id, learning_path_id, len(stages_data))
 
     except Exception as exc:
         log.error("❌  Learning path generation failed for session %s: %s", session_id, exc, exc_info=True)
         # Don't fail the whole request — path can be generated later
         db.rollback()
 
+    invalidate_user_views(current_user.user_id)
+
     # Build response with evaluated_responses so client has per-question scores
-    response_data = schemas.AssessmentResultResponse.model_validate(result)
-    return response_data.model_copy(
+    return result_data.model_copy(
         update={
-            "evaluated_responses": [
-                schemas.AssessmentResponseResponse.model_validate(r) for r in responses
-            ]
+            "learning_path_id": learning_path_id,
+            "evaluated_responses": evaluated_responses,
         }
     )
 
@@ -558,7 +772,7 @@ async def complete_assessment(
 def get_assessment_result(
     session_id: int,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user)
+    current_user: Row = Depends(get_current_user)
 ):
     """
     Get the result of a completed assessment
@@ -606,7 +820,7 @@ def get_assessment_result(
 async def regenerate_learning_path(
     session_id: int,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user),
+    current_user: Row = Depends(get_current_user),
 ):
     """
     Regenerate the learning path for a completed assessment.
@@ -630,7 +844,7 @@ async def regenerate_learning_path(
     if not result:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Assessment not completed yet")
 
-    track = db.query(models.Track).filter(models.Track.track_id == session.track_id).first()
+    track = get_cached_track(db, session.track_id)
     responses = db.query(models.AssessmentResponse).filter(
         models.AssessmentResponse.session_id == session_id
     ).all()
@@ -705,8 +919,11 @@ async def regenerate_learning_path(
             focus_area=stage_data["focus_area"],
         ))
 
+    # The replaced path's content (and progress on it) is gone
+    refresh_user_summary(db, current_user.user_id)
     db.commit()
     db.refresh(learning_path)
+    invalidate_user_views(current_user.user_id)
     log.info("✅  Learning path regenerated for session %s: path_id=%s, stages=%s", session_id, learning_path.path_id, len(stages_data))
     return learning_path
 
@@ -715,7 +932,7 @@ async def regenerate_learning_path(
 def get_session_learning_path(
     session_id: int,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user),
+    current_user: Row = Depends(get_current_user),
 ):
     """
     Retrieve the AI-generated learning path (stages only) for a completed session.
@@ -748,12 +965,12 @@ def get_session_learning_path(
 @router.get("/my-sessions", response_model=List[schemas.AssessmentSessionResponse])
 def get_my_assessment_sessions(
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user)
+    current_user: Row = Depends(get_current_user)
 ):
     """
     Get all assessment sessions for the current user
     """
-    sessions = db.query(models.AssessmentSession).filter(
+    sessions = db.query(*_SESSION_RESPONSE_COLUMNS).filter(
         models.AssessmentSession.user_id == current_user.user_id
     ).order_by(models.AssessmentSession.started_at.desc()).all()
     
@@ -1,87 +1,88 @@
 """
 Authentication router - Complete auth system with sessions and password management
 """
-from fastapi import APIRouter, Depends, HTTPException, status, Request
+import asyncio
+import logging
+import os
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Request
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy import Row, func, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import timedelta, datetime
 from typing import List
 
-from app.database import get_db
+from app.database import AsyncSessionLocal, get_async_db
 from app import models, schemas
 from app.utils import (
     verify_password, get_password_hash, create_access_token, 
     create_refresh_token, decode_refresh_token, generate_session_id,
     generate_reset_token, ACCESS_TOKEN_EXPIRE_MINUTES
 )
-from app.auth_middleware import get_current_user, get_admin_user
+from app.auth_middleware import get_current_user, get_current_user_model, get_admin_user, invalidate_user
+from app.services.dashboard_cache import invalidate_user_views
+
+log = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/auth", tags=["Authentication"])
 
+# Let login respond as soon as the tokens are signed and write the
+# user_sessions row after the response. Off by default: until the row lands,
+# /refresh, /logout?session_id= and /sessions don't know the new session.
+DEFER_SESSION_WRITES = os.getenv("DEFER_SESSION_WRITES", "false").lower() == "true"
+
+# Per-user session aggregates for the detailed user responses
+_SESSION_STATS_COLUMNS = (
+    func.count(models.UserSession.session_id)
+        .filter(models.UserSession.is_active == True)
+        .label("active_sessions_count"),
+    func.max(models.UserSession.created_at).label("last_login"),
+)
+
+# Columns of UserSessionResponse / UserResponse for the list endpoints, so the
+# token strings and password hash are never fetched or hydrated
+_SESSION_LIST_COLUMNS = (
+    models.UserSession.session_id,
+    models.UserSession.user_id,
+    models.UserSession.ip_address,
+    models.UserSession.user_agent,
+    models.UserSession.is_active,
+    models.UserSession.created_at,
+    models.UserSession.expires_at,
+    models.UserSession.last_activity,
+)
+_USER_LIST_COLUMNS = (
+    models.User.user_id,
+    models.User.email,
+    models.User.full_name,
+    models.User.role,
+    models.User.created_at,
+)
+
 
 # ============================================================================
 # User Registration & Login
 # ============================================================================
 
-@router.post("/register", response_model=schemas.UserResponse, status_code=status.HTTP_201_CREATED)
-def register_user(
-    user_data: schemas.UserCreate,
-    db: Session = Depends(get_db)
-):
-    """
-    Register a new user
-    """
-    # Check if user already exists
-    # Normalize email to lowercase
-    user_data.email = user_data.email.lower()
-    
-    existing_user = db.query(models.User).filter(
-        models.User.email == user_data.email
-    ).first()
-    
-    if existing_user:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email already registered"
-        )
-    
-    # Create new user
-    hashed_password = get_password_hash(user_data.password)
-    new_user = models.User(
-        email=user_data.email,
-        full_name=user_data.full_name,
-        password_hash=hashed_password,
-        role="user"
-    )
-    
-    db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
-    
-    return new_user
+async def _persist_session(session: models.UserSession) -> None:
+    """Background task: store a login's session row in its own DB session"""
+    try:
+        async with AsyncSessionLocal() as db:
+            db.add(session)
+            await db.commit()
+    except Exception as exc:
+        log.error("Could not store session for user %s: %s", session.user_id, exc, exc_info=True)
 
 
-@router.post("/login", response_model=schemas.Token)
-def login(
-    form_data: OAuth2PasswordRequestForm = Depends(),
-    request: Request = None,
-    db: Session = Depends(get_db)
-):
+async def _start_session(
+    user: models.User,
+    request: Request,
+    db: AsyncSession,
+    background_tasks: BackgroundTasks,
+) -> dict:
     """
-    Login with email and password, returns JWT token with session tracking
+    Mint access/refresh tokens for an authenticated user and record the session
     """
-    # Find user by email (username field in OAuth2 form)
-    user = db.query(models.User).filter(
-        models.User.email == form_data.username.lower()
-    ).first()
-    
-    if not user or not verify_password(form_data.password, user.password_hash):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Incorrect email or password",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    
     # Create access and refresh tokens
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
@@ -107,8 +108,11 @@ def login(
         is_active=True
     )
     
-    db.add(session)
-    db.commit()
+    if DEFER_SESSION_WRITES:
+        background_tasks.add_task(_persist_session, session)
+    else:
+        db.add(session)
+        await db.commit()
     
     return {
         "access_token": access_token,
@@ -118,65 +122,102 @@ def login(
     }
 
 
+async def _commit_email_write(db: AsyncSession, detail: str) -> None:
+    """
+    Commit a user insert/update, turning a users.email UNIQUE violation into a 400.
+
+    Letting the constraint decide saves the pre-check SELECT and closes the
+    race where two concurrent requests both see the email as free.
+    """
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=detail
+        )
+
+
+@router.post("/register", response_model=schemas.UserResponse, status_code=status.HTTP_201_CREATED)
+async def register_user(
+    user_data: schemas.UserCreate,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Register a new user
+    """
+    # Normalize email to lowercase
+    user_data.email = user_data.email.lower()
+    
+    # Create new user; duplicates are rejected by the users.email UNIQUE constraint
+    hashed_password = await asyncio.to_thread(get_password_hash, user_data.password)
+    new_user = models.User(
+        email=user_data.email,
+        full_name=user_data.full_name,
+        password_hash=hashed_password,
+        role="user"
+    )
+    
+    db.add(new_user)
+    await _commit_email_write(db, "Email already registered")
+    
+    return new_user
+
+
+@router.post("/login", response_model=schemas.Token)
+async def login(
+    background_tasks: BackgroundTasks,
+    form_data: OAuth2PasswordRequestForm = Depends(),
+    request: Request = None,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Login with email and password, returns JWT token with session tracking
+    """
+    # Find user by email (username field in OAuth2 form)
+    user = await db.scalar(
+        select(models.User).where(models.User.email == form_data.username.lower())
+    )
+    
+    # bcrypt is CPU-bound; keep it off the event loop
+    if not user or not await asyncio.to_thread(verify_password, form_data.password, user.password_hash):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Incorrect email or password",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    
+    return await _start_session(user, request, db, background_tasks)
+
+
 @router.post("/login-json", response_model=schemas.Token)
-def login_json(
+async def login_json(
     credentials: schemas.UserLogin,
+    background_tasks: BackgroundTasks,
     request: Request = None,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Alternative login endpoint that accepts JSON instead of form data
     """
-    user = db.query(models.User).filter(
-        models.User.email == credentials.email.lower()
-    ).first()
+    user = await db.scalar(
+        select(models.User).where(models.User.email == credentials.email.lower())
+    )
     
-    if not user or not verify_password(credentials.password, user.password_hash):
+    if not user or not await asyncio.to_thread(verify_password, credentials.password, user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password"
         )
     
-    # Create tokens
-    access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-    access_token = create_access_token(
-        data={"sub": user.email, "user_id": user.user_id},
-        expires_delta=access_token_expires
-    )
-    refresh_token = create_refresh_token(
-        data={"sub": user.email, "user_id": user.user_id}
-    )
-    
-    # Create session
-    session_id = generate_session_id()
-    expires_at = datetime.utcnow() + access_token_expires
-    
-    session = models.UserSession(
-        session_id=session_id,
-        user_id=user.user_id,
-        access_token=access_token,
-        refresh_token=refresh_token,
-        ip_address=request.client.host if request else None,
-        user_agent=request.headers.get("user-agent") if request else None,
-        expires_at=expires_at,
-        is_active=True
-    )
-    
-    db.add(session)
-    db.commit()
-    
-    return {
-        "access_token": access_token,
-        "token_type": "bearer",
-        "refresh_token": refresh_token,
-        "session_id": session_id
-    }
+    return await _start_session(user, request, db, background_tasks)
 
 
 @router.post("/refresh", response_model=schemas.Token)
-def refresh_token(
+async def refresh_token(
     token_data: schemas.TokenRefresh,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Refresh access token using refresh token
@@ -192,26 +233,6 @@ def refresh_token(
     user_id = payload.get("user_id")
     email = payload.get("sub")
     
-    # Verify user exists
-    user = db.query(models.User).filter(models.User.user_id == user_id).first()
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found"
-        )
-    
-    # Verify session exists and is active
-    session = db.query(models.UserSession).filter(
-        models.UserSession.refresh_token == token_data.refresh_token,
-        models.UserSession.is_active == True
-    ).first()
-    
-    if not session:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Session not found or inactive"
-        )
-    
     # Create new access token
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     new_access_token = create_access_token(
@@ -219,26 +240,47 @@ def refresh_token(
         expires_delta=access_token_expires
     )
     
-    # Update session
-    session.access_token = new_access_token
-    session.expires_at = datetime.utcnow() + access_token_expires
-    session.last_activity = datetime.utcnow()
+    # Verify the session is active and rotate its access token in one
+    # statement. Sessions are deleted with their user (ON DELETE CASCADE),
+    # so a matching row also proves the user still exists.
+    now = datetime.utcnow()
+    session_id = await db.scalar(
+        update(models.UserSession)
+        .where(
+            models.UserSession.refresh_token == token_data.refresh_token,
+            models.UserSession.user_id == user_id,
+            models.UserSession.is_active == True
+        )
+        .values(
+            access_token=new_access_token,
+            expires_at=now + access_token_expires,
+            last_activity=now,
+        )
+        .returning(models.UserSession.session_id)
+        .execution_options(synchronize_session=False)
+    )
+    
+    if not session_id:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Session not found or inactive"
+        )
     
-    db.commit()
+    await db.commit()
     
     return {
         "access_token": new_access_token,
         "token_type": "bearer",
         "refresh_token": token_data.refresh_token,
-        "session_id": session.session_id
+        "session_id": session_id
     }
 
 
 @router.post("/logout")
-def logout(
+async def logout(
     session_id: str = None,
-    db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Row = Depends(get_current_user)
 ):
     """
     Logout user and invalidate session
@@ -247,14 +289,16 @@ def logout(
     """
     if session_id:
         # Logout specific session
-        session = db.query(models.UserSession).filter(
-            models.UserSession.session_id == session_id,
-            models.UserSession.user_id == current_user.user_id
-        ).first()
+        session = await db.scalar(
+            select(models.UserSession).where(
+                models.UserSession.session_id == session_id,
+                models.UserSession.user_id == current_user.user_id
+            )
+        )
         
         if session:
             session.is_active = False
-            db.commit()
+            await db.commit()
             return {"message": "Successfully logged out from session"}
         else:
             raise HTTPException(
@@ -263,16 +307,18 @@ def logout(
             )
     else:
         # Logout all sessions
-        sessions = db.query(models.UserSession).filter(
-            models.UserSession.user_id == current_user.user_id,
-            models.UserSession.is_active == True
-        ).all()
-        
-        for session in sessions:
-            session.is_active = False
+        result = await db.execute(
+            update(models.UserSession)
+            .where(
+                models.UserSession.user_id == current_user.user_id,
+                models.UserSession.is_active == True
+            )
+            .values(is_active=False)
+            .execution_options(synchronize_session=False)
+        )
         
-        db.commit()
-        return {"message": f"Successfully logged out from {len(sessions)} session(s)"}
+        await db.commit()
+        return {"message": f"Successfully logged out from {result.rowcount} session(s)"}
 
 
 # ============================================================================
@@ -280,36 +326,32 @@ def logout(
 # ============================================================================
 
 @router.get("/me", response_model=schemas.UserDetailedResponse)
-def get_current_user_info(
-    current_user: models.User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+async def get_current_user_info(
+    current_user: Row = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get current authenticated user information with session details
     """
-    # Count active sessions
-    active_sessions_count = db.query(models.UserSession).filter(
-        models.UserSession.user_id == current_user.user_id,
-        models.UserSession.is_active == True
-    ).count()
-    
-    # Get last login
-    last_session = db.query(models.UserSession).filter(
-        models.UserSession.user_id == current_user.user_id
-    ).order_by(models.UserSession.created_at.desc()).first()
+    # Active session count and last login in one aggregate
+    stats = (await db.execute(
+        select(*_SESSION_STATS_COLUMNS).where(
+            models.UserSession.user_id == current_user.user_id
+        )
+    )).one()
     
     user_dict = schemas.UserResponse.model_validate(current_user).model_dump()
-    user_dict["active_sessions_count"] = active_sessions_count
-    user_dict["last_login"] = last_session.created_at if last_session else None
+    user_dict["active_sessions_count"] = stats.active_sessions_count
+    user_dict["last_login"] = stats.last_login
     
     return schemas.UserDetailedResponse(**user_dict)
 
 
 @router.put("/me", response_model=schemas.UserResponse)
-def update_current_user(
+async def update_current_user(
     user_data: schemas.UserUpdate,
-    current_user: models.User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: models.User = Depends(get_current_user_model),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Update current user's profile
@@ -319,43 +361,35 @@ def update_current_user(
         current_user.full_name = user_data.full_name
     
     if user_data.email is not None:
-        # Check if email is already taken
-        normalized_email = user_data.email.lower()
-        existing_user = db.query(models.User).filter(
-            models.User.email == normalized_email,
-            models.User.user_id != current_user.user_id
-        ).first()
-        
-        if existing_user:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Email already in use"
-            )
-        
-        current_user.email = normalized_email
+        current_user.email = user_data.email.lower()
     
-    db.commit()
-    db.refresh(current_user)
+    await _commit_email_write(db, "Email already in use")
+    invalidate_user(current_user.user_id)
+    invalidate_user_views(current_user.user_id)
     
     return current_user
 
 
 @router.delete("/me", status_code=status.HTTP_204_NO_CONTENT)
-def delete_current_user(
-    current_user: models.User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+async def delete_current_user(
+    current_user: models.User = Depends(get_current_user_model),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Delete current user account (soft delete - deactivate all sessions)
     """
     # Deactivate all sessions
-    db.query(models.UserSession).filter(
-        models.UserSession.user_id == current_user.user_id
-    ).update({"is_active": False})
+    await db.execute(
+        update(models.UserSession)
+        .where(models.UserSession.user_id == current_user.user_id)
+        .values(is_active=False)
+    )
     
     # Delete user (CASCADE will handle related records)
-    db.delete(current_user)
-    db.commit()
+    user_id = current_user.user_id
+    await db.delete(current_user)
+    await db.commit()
+    invalidate_user(user_id)
     
     return None
 
@@ -365,38 +399,40 @@ def delete_current_user(
 # ============================================================================
 
 @router.get("/sessions", response_model=List[schemas.UserSessionResponse])
-def get_my_sessions(
+async def get_my_sessions(
     active_only: bool = True,
-    db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Row = Depends(get_current_user)
 ):
     """
     Get all sessions for current user
     """
-    query = db.query(models.UserSession).filter(
+    query = select(*_SESSION_LIST_COLUMNS).where(
         models.UserSession.user_id == current_user.user_id
     )
     
     if active_only:
-        query = query.filter(models.UserSession.is_active == True)
+        query = query.where(models.UserSession.is_active == True)
     
-    sessions = query.order_by(models.UserSession.created_at.desc()).all()
+    sessions = (await db.execute(query.order_by(models.UserSession.created_at.desc()))).all()
     return sessions
 
 
 @router.get("/sessions/{session_id}", response_model=schemas.UserSessionResponse)
-def get_session_details(
+async def get_session_details(
     session_id: str,
-    db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Row = Depends(get_current_user)
 ):
     """
     Get details of a specific session
     """
-    session = db.query(models.UserSession).filter(
-        models.UserSession.session_id == session_id,
-        models.UserSession.user_id == current_user.user_id
-    ).first()
+    session = await db.scalar(
+        select(models.UserSession).where(
+            models.UserSession.session_id == session_id,
+            models.UserSession.user_id == current_user.user_id
+        )
+    )
     
     if not session:
         raise HTTPException(
@@ -408,18 +444,20 @@ def get_session_details(
 
 
 @router.delete("/sessions/{session_id}", status_code=status.HTTP_204_NO_CONTENT)
-def revoke_session(
+async def revoke_session(
     session_id: str,
-    db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Row = Depends(get_current_user)
 ):
     """
     Revoke a specific session (logout from that session)
     """
-    session = db.query(models.UserSession).filter(
-        models.UserSession.session_id == session_id,
-        models.UserSession.user_id == current_user.user_id
-    ).first()
+    session = await db.scalar(
+        select(models.UserSession).where(
+            models.UserSession.session_id == session_id,
+            models.UserSession.user_id == current_user.user_id
+        )
+    )
     
     if not session:
         raise HTTPException(
@@ -428,34 +466,34 @@ def revoke_session(
         )
     
     session.is_active = False
-    db.commit()
+    await db.commit()
     
     return None
 
 
 @router.delete("/sessions", status_code=status.HTTP_204_NO_CONTENT)
-def revoke_all_sessions(
+async def revoke_all_sessions(
     except_current: bool = False,
-    db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Row = Depends(get_current_user)
 ):
     """
     Revoke all sessions for current user
     If except_current=True, keeps the current session active
     """
-    query = db.query(models.UserSession).filter(
-        models.UserSession.user_id == current_user.user_id,
-        models.UserSession.is_active == True
-    )
-    
     # TODO: If except_current, we'd need to identify current session
     # For now, revoke all
     
-    sessions = query.all()
-    for session in sessions:
-        session.is_active = False
-    
-    db.commit()
+    await db.execute(
+        update(models.UserSession)
+        .where(
+            models.UserSession.user_id == current_user.user_id,
+            models.UserSession.is_active == True
+        )
+        .values(is_active=False)
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
     
     return None
 
@@ -465,47 +503,51 @@ def revoke_all_sessions(
 # ============================================================================
 
 @router.post("/password/change")
-def change_password(
+async def change_password(
     password_data: schemas.PasswordChange,
-    db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: models.User = Depends(get_current_user_model)
 ):
     """
     Change password for current user
     """
     # Verify old password
-    if not verify_password(password_data.old_password, current_user.password_hash):
+    if not await asyncio.to_thread(verify_password, password_data.old_password, current_user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Incorrect current password"
         )
     
     # Update password
-    current_user.password_hash = get_password_hash(password_data.new_password)
+    user_id = current_user.user_id
+    current_user.password_hash = await asyncio.to_thread(get_password_hash, password_data.new_password)
     
     # Invalidate all other sessions for security
-    db.query(models.UserSession).filter(
-        models.UserSession.user_id == current_user.user_id
-    ).update({"is_active": False})
+    await db.execute(
+        update(models.UserSession)
+        .where(models.UserSession.user_id == current_user.user_id)
+        .values(is_active=False)
+    )
     
-    db.commit()
+    await db.commit()
+    invalidate_user(user_id)
     
     return {"message": "Password changed successfully. Please login again."}
 
 
 @router.post("/password/reset/request")
-def request_password_reset(
+async def request_password_reset(
     reset_request: schemas.PasswordResetRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Request password reset - generates reset token
     In production, this would send an email with reset link
     """
     # Find user
-    user = db.query(models.User).filter(
-        models.User.email == reset_request.email
-    ).first()
+    user = await db.scalar(
+        select(models.User).where(models.User.email == reset_request.email)
+    )
     
     if not user:
         # Don't reveal if email exists - security best practice
@@ -519,10 +561,14 @@ def request_password_reset(
     expires_at = datetime.utcnow() + timedelta(hours=1)  # Valid for 1 hour
     
     # Invalidate old tokens
-    db.query(models.PasswordResetToken).filter(
-        models.PasswordResetToken.user_id == user.user_id,
-        models.PasswordResetToken.is_used == False
-    ).update({"is_used": True})
+    await db.execute(
+        update(models.PasswordResetToken)
+        .where(
+            models.PasswordResetToken.user_id == user.user_id,
+            models.PasswordResetToken.is_used == False
+        )
+        .values(is_used=True)
+    )
     
     # Create new token
     token_record = models.PasswordResetToken(
@@ -532,7 +578,7 @@ def request_password_reset(
     )
     
     db.add(token_record)
-    db.commit()
+    await db.commit()
     
     # In production, send email here
     # For mock mode, return token
@@ -544,19 +590,21 @@ def request_password_reset(
 
 
 @router.post("/password/reset/confirm")
-def confirm_password_reset(
+async def confirm_password_reset(
     reset_data: schemas.PasswordResetConfirm,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Confirm password reset with token
     """
     # Find valid token
-    token_record = db.query(models.PasswordResetToken).filter(
-        models.PasswordResetToken.reset_token == reset_data.reset_token,
-        models.PasswordResetToken.is_used == False,
-        models.PasswordResetToken.expires_at > datetime.utcnow()
-    ).first()
+    token_record = await db.scalar(
+        select(models.PasswordResetToken).where(
+            models.PasswordResetToken.reset_token == reset_data.reset_token,
+            models.PasswordResetToken.is_used == False,
+            models.PasswordResetToken.expires_at > datetime.utcnow()
+        )
+    )
     
     if not token_record:
         raise HTTPException(
@@ -565,9 +613,7 @@ def confirm_password_reset(
         )
     
     # Get user
-    user = db.query(models.User).filter(
-        models.User.user_id == token_record.user_id
-    ).first()
+    user = await db.get(models.User, token_record.user_id)
     
     if not user:
         raise HTTPException(
@@ -576,17 +622,21 @@ def confirm_password_reset(
         )
     
     # Update password
-    user.password_hash = get_password_hash(reset_data.new_password)
+    user_id = user.user_id
+    user.password_hash = await asyncio.to_thread(get_password_hash, reset_data.new_password)
     
     # Mark token as used
     token_record.is_used = True
     
     # Invalidate all sessions
-    db.query(models.UserSession).filter(
-        models.UserSession.user_id == user.user_id
-    ).update({"is_active": False})
+    await db.execute(
+        update(models.UserSession)
+        .where(models.UserSession.user_id == user.user_id)
+        .values(is_active=False)
+    )
     
-    db.commit()
+    await db.commit()
+    invalidate_user(user_id)
     
     return {"message": "Password reset successful. Please login with new password."}
 
@@ -596,71 +646,66 @@ def confirm_password_reset(
 # ============================================================================
 
 @router.get("/users", response_model=List[schemas.UserResponse])
-def get_all_users(
+async def get_all_users(
     skip: int = 0,
     limit: int = 100,
     role: str = None,
-    db: Session = Depends(get_db),
-    admin_user: models.User = Depends(get_admin_user)
+    db: AsyncSession = Depends(get_async_db),
+    admin_user: Row = Depends(get_admin_user)
 ):
     """
     Get all users (Admin only)
     """
-    query = db.query(models.User)
+    query = select(*_USER_LIST_COLUMNS)
     
     if role:
-        query = query.filter(models.User.role == role)
+        query = query.where(models.User.role == role)
     
-    users = query.offset(skip).limit(limit).all()
+    users = (await db.execute(query.offset(skip).limit(limit))).all()
     return users
 
 
 @router.get("/users/{user_id}", response_model=schemas.UserDetailedResponse)
-def get_user_by_id(
+async def get_user_by_id(
     user_id: int,
-    db: Session = Depends(get_db),
-    admin_user: models.User = Depends(get_admin_user)
+    db: AsyncSession = Depends(get_async_db),
+    admin_user: Row = Depends(get_admin_user)
 ):
     """
     Get specific user by ID (Admin only)
     """
-    user = db.query(models.User).filter(models.User.user_id == user_id).first()
+    # User plus active session count and last login in one query
+    row = (await db.execute(
+        select(models.User, *_SESSION_STATS_COLUMNS)
+        .outerjoin(models.UserSession, models.UserSession.user_id == models.User.user_id)
+        .where(models.User.user_id == user_id)
+        .group_by(models.User.user_id)
+    )).first()
     
-    if not user:
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
     
-    # Count active sessions
-    active_sessions_count = db.query(models.UserSession).filter(
-        models.UserSession.user_id == user.user_id,
-        models.UserSession.is_active == True
-    ).count()
-    
-    # Get last login
-    last_session = db.query(models.UserSession).filter(
-        models.UserSession.user_id == user.user_id
-    ).order_by(models.UserSession.created_at.desc()).first()
-    
-    user_dict = schemas.UserResponse.model_validate(user).model_dump()
-    user_dict["active_sessions_count"] = active_sessions_count
-    user_dict["last_login"] = last_session.created_at if last_session else None
+    user_dict = schemas.UserResponse.model_validate(row.User).model_dump()
+    user_dict["active_sessions_count"] = row.active_sessions_count
+    user_dict["last_login"] = row.last_login
     
     return schemas.UserDetailedResponse(**user_dict)
 
 
 @router.put("/users/{user_id}", response_model=schemas.UserResponse)
-def update_user(
+async def update_user(
     user_id: int,
     user_data: schemas.UserUpdate,
-    db: Session = Depends(get_db),
-    admin_user: models.User = Depends(get_admin_user)
+    db: AsyncSession = Depends(get_async_db),
+    admin_user: Row = Depends(get_admin_user)
 ):
     """
     Update user (Admin only)
     """
-    user = db.query(models.User).filter(models.User.user_id == user_id).first()
+    user = await db.get(models.User, user_id)
     
     if not user:
         raise HTTPException(
@@ -673,35 +718,25 @@ def update_user(
         user.full_name = user_data.full_name
     
     if user_data.email is not None:
-        existing_user = db.query(models.User).filter(
-            models.User.email == user_data.email,
-            models.User.user_id != user_id
-        ).first()
-        
-        if existing_user:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Email already in use"
-            )
-        
         user.email = user_data.email
     
-    db.commit()
-    db.refresh(user)
+    await _commit_email_write(db, "Email already in use")
+    invalidate_user(user.user_id)
+    invalidate_user_views(user.user_id)
     
     return user
 
 
 @router.delete("/users/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_user(
+async def delete_user(
     user_id: int,
-    db: Session = Depends(get_db),
-    admin_user: models.User = Depends(get_admin_user)
+    db: AsyncSession = Depends(get_async_db),
+    admin_user: Row = Depends(get_admin_user)
 ):
     """
     Delete user (Admin only)
     """
-    user = db.query(models.User).filter(models.User.user_id == user_id).first()
+    user = await db.get(models.User, user_id)
     
     if not user:
         raise HTTPException(
@@ -716,8 +751,9 @@ def delete_user(
             detail="Cannot delete your own account"
         )
     
-    db.delete(user)
-    db.commit()
+    await db.delete(user)
+    await db.commit()
+    invalidate_user(user_id)
     
     return None
 
@@ -1,19 +1,77 @@
 """
 Chat router - handles AI mentor conversations with RAG
 """
+import json
 import logging
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Row, bindparam, exists, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, defer, joinedload
+from typing import List, Optional, Tuple
 
-from app.database import get_db
+from app.cache import TTLCache
+from app.database import AsyncSessionLocal, get_async_db, get_db
 from app import models, schemas
-from app.auth_middleware import get_current_user, get_admin_user
+from app.auth_middleware import get_admin_user, get_current_user, get_owned_stage
 from app.services.ai_service import ai_service
+from app.services.track_cache import get_cached_track_async
 
 router = APIRouter(prefix="/api/chat", tags=["AI Mentor Chat"])
 log = logging.getLogger("growwise")
 
+# Statements on the per-message path, built once at import with bound
+# parameters so each request only binds values (compiled forms are reused
+# from the engine's query cache)
+_LATEST_SELECTED_TRACK = (
+    select(models.UserTrackSelection.track_id)
+    .where(models.UserTrackSelection.user_id == bindparam("user_id"))
+    .order_by(models.UserTrackSelection.selected_at.desc())
+    .limit(1)
+    .scalar_subquery()
+)
+_CHAT_CONTEXT_STMT = (
+    select(models.ChatSession, _LATEST_SELECTED_TRACK)
+    .options(joinedload(models.ChatSession.stage))
+    .where(
+        models.ChatSession.chat_id == bindparam("chat_id"),
+        models.ChatSession.user_id == bindparam("user_id")
+    )
+)
+# stage → path → result → assessment session in one JOIN
+_PATH_TRACK_STMT = (
+    select(models.AssessmentSession.track_id)
+    .join(models.AssessmentResult, models.AssessmentResult.session_id == models.AssessmentSession.session_id)
+    .join(models.LearningPath, models.LearningPath.result_id == models.AssessmentResult.result_id)
+    .where(models.LearningPath.path_id == bindparam("path_id"))
+    .limit(1)
+)
+_RECENT_HISTORY_STMT = (
+    select(models.ChatMessage.sender, models.ChatMessage.message_text)
+    .where(models.ChatMessage.chat_id == bindparam("chat_id"))
+    .order_by(models.ChatMessage.message_id.desc())
+    .limit(bindparam("limit"))
+)
+_OWNS_CHAT_STMT = select(exists().where(
+    models.ChatSession.chat_id == bindparam("chat_id"),
+    models.ChatSession.user_id == bindparam("user_id")
+))
+# One page of messages; after_id=0 and skip=0 make those bounds no-ops
+_MESSAGES_PAGE_STMT = (
+    select(models.ChatMessage)
+    .where(
+        models.ChatMessage.chat_id == bindparam("chat_id"),
+        models.ChatMessage.message_id > bindparam("after_id")
+    )
+    .order_by(models.ChatMessage.message_id.asc())
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+)
+
+# Serialized knowledge base entries per track; admin-curated, and add_knowledge
+# drops the track's entry (other workers converge within the TTL)
+_knowledge_cache = TTLCache(ttl_seconds=300, max_size=1_000)
+
 
 # ============================================================================
 # Knowledge Base Management (Admin)
@@ -23,16 +81,19 @@ log = logging.getLogger("growwise")
 def add_knowledge(
     knowledge_data: schemas.KnowledgeBaseCreate,
     db: Session = Depends(get_db),
-    admin_user: models.User = Depends(get_admin_user)
+    admin_user: Row = Depends(get_admin_user)
 ):
     """
     Add content to knowledge base with embeddings (Admin only)
     """
     new_knowledge = models.KnowledgeBase(**knowledge_data.model_dump())
     db.add(new_knowledge)
+    db.flush()  # assigns kb_id
+    # Serialize before commit, which would expire the object and force a reload
+    response = schemas.KnowledgeBaseResponse.model_validate(new_knowledge)
     db.commit()
-    db.refresh(new_knowledge)
-    return new_knowledge
+    _knowledge_cache.pop(response.track_id)
+    return response
 
 
 @router.get("/knowledge/track/{track_id}", response_model=List[schemas.KnowledgeBaseResponse])
@@ -43,9 +104,20 @@ def get_knowledge_by_track(
     """
     Get all knowledge base entries for a track
     """
-    knowledge = db.query(models.KnowledgeBase).filter(
-        models.KnowledgeBase.track_id == track_id
-    ).all()
+    cached = _knowledge_cache.get(track_id)
+    if cached is not None:
+        return cached
+
+    knowledge = [
+        schemas.KnowledgeBaseResponse.model_validate(kb)
+        for kb in db.query(models.KnowledgeBase).options(
+            # The embedding blob is not part of the response
+            defer(models.KnowledgeBase.embedding_vector)
+        ).filter(
+            models.KnowledgeBase.track_id == track_id
+        ).all()
+    ]
+    _knowledge_cache.set(track_id, knowledge)
     return knowledge
 
 
@@ -57,33 +129,13 @@ def get_knowledge_by_track(
 def create_chat_session(
     session_data: schemas.ChatSessionCreate,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user)
+    current_user: Row = Depends(get_current_user)
 ):
     """
     Start a new chat session for a learning stage
     """
-    # Verify stage exists and belongs to user
-    stage = db.query(models.LearningPathStage).filter(
-        models.LearningPathStage.stage_id == session_data.stage_id
-    ).first()
-    
-    if not stage:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Learning stage not found"
-        )
-    
-    # Verify stage belongs to user's learning path
-    path = db.query(models.LearningPath).filter(
-        models.LearningPath.path_id == stage.path_id,
-        models.LearningPath.user_id == current_user.user_id
-    ).first()
-    
-    if not path:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Learning stage does not belong to you"
-        )
+    # Verify stage exists and belongs to user's learning path (one query)
+    stage, _ = get_owned_stage(db, session_data.stage_id, current_user.user_id)
     
     # Create chat session
     new_session = models.ChatSession(
@@ -92,8 +144,7 @@ def create_chat_session(
     )
     
     db.add(new_session)
-    db.commit()
-    db.refresh(new_session)
+    db.flush()  # assigns chat_id; session and welcome message commit together
     
     # Send welcome message from AI
     welcome_message = models.ChatMessage(
@@ -102,16 +153,19 @@ def create_chat_session(
         message_text=f"Welcome! I'm your AI mentor for {stage.stage_name}. I'm here to help you with {stage.focus_area}. What would you like to learn?"
     )
     db.add(welcome_message)
+    # chat_id/started_at came back from the INSERT (eager_defaults); serialize
+    # before commit expires them
+    response = schemas.ChatSessionResponse.model_validate(new_session)
     db.commit()
     
-    return new_session
+    return response
 
 
 @router.get("/sessions/{chat_id}", response_model=schemas.ChatSessionResponse)
 def get_chat_session(
     chat_id: int,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user)
+    current_user: Row = Depends(get_current_user)
 ):
     """
     Get details of a chat session
@@ -133,7 +187,7 @@ def get_chat_session(
 @router.get("/my-sessions", response_model=List[schemas.ChatSessionResponse])
 def get_my_chat_sessions(
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user),
+    current_user: Row = Depends(get_current_user),
     stage_id: int = None
 ):
     """
@@ -154,75 +208,59 @@ def get_my_chat_sessions(
 # Chat Messages
 # ============================================================================
 
-@router.post("/sessions/{chat_id}/messages", response_model=schemas.ChatMessageResponse)
-async def send_message(
+async def _recent_chat_history(db: AsyncSession, chat_id: int, limit: int) -> List[dict]:
+    """Oldest-first sender/text of a chat's latest messages"""
+    rows = (await db.execute(
+        _RECENT_HISTORY_STMT, {"chat_id": chat_id, "limit": limit}
+    )).all()
+    return [{"sender": row.sender, "text": row.message_text} for row in reversed(rows)]
+
+
+async def _resolve_chat_context(
+    db: AsyncSession,
     chat_id: int,
-    message_data: schemas.ChatMessageCreate,
-    db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user)
-):
+    current_user: Row,
+    message_text: str
+) -> Tuple[models.LearningPathStage, schemas.TrackResponse, List[dict]]:
     """
-    Send a message in a chat session and get AI mentor response
+    Load what the mentor needs for a new message: the chat's stage, the track
+    (used as RAG category) and the recent history ending with this message
     """
-    # Verify chat session belongs to user
-    session = db.query(models.ChatSession).filter(
-        models.ChatSession.chat_id == chat_id,
-        models.ChatSession.user_id == current_user.user_id
-    ).first()
+    # Verify chat session belongs to user, joining its stage and the user's
+    # most recent track selection
+    row = (await db.execute(
+        _CHAT_CONTEXT_STMT,
+        {"chat_id": chat_id, "user_id": current_user.user_id}
+    )).first()
     
-    if not session:
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Chat session not found"
         )
     
-    # Save user message
-    user_message = models.ChatMessage(
-        chat_id=chat_id,
-        sender="user",
-        message_text=message_data.message_text
-    )
-    db.add(user_message)
-    db.commit()
-    db.refresh(user_message)
+    session, selected_track_id = row
+    
+    # Only read the history of a chat the user owns (the last 9 stored
+    # messages, plus this one below)
+    chat_history = await _recent_chat_history(db, chat_id, limit=9)
     
     # Get stage context
-    stage = db.query(models.LearningPathStage).filter(
-        models.LearningPathStage.stage_id == session.stage_id
-    ).first()
+    stage = session.stage
     
     # Get track: prefer user's most recent track selection (what they chose on skill selection)
     # Fallback: track from path (stage → path → assessment → track)
     track = None
     track_source = "path"
-    latest_selection = (
-        db.query(models.UserTrackSelection)
-        .filter(models.UserTrackSelection.user_id == current_user.user_id)
-        .order_by(models.UserTrackSelection.selected_at.desc())
-        .first()
-    )
-    if latest_selection:
-        track = db.query(models.Track).filter(
-            models.Track.track_id == latest_selection.track_id
-        ).first()
+    if selected_track_id is not None:
+        track = await get_cached_track_async(db, selected_track_id)
         if track:
             track_source = "user_track_selection"
 
     if not track:
-        path = db.query(models.LearningPath).filter(
-            models.LearningPath.path_id == stage.path_id
-        ).first()
-        if path:
-            assessment_session = (
-                db.query(models.AssessmentSession)
-                .join(models.AssessmentResult)
-                .filter(models.AssessmentResult.result_id == path.result_id)
-                .first()
-            )
-            if assessment_session:
-                track = db.query(models.Track).filter(
-                    models.Track.track_id == assessment_session.track_id
-                ).first()
+        path_track_id = await db.scalar(_PATH_TRACK_STMT, {"path_id": stage.path_id})
+        if path_track_id is not None:
+            track = await get_cached_track_async(db, path_track_id)
 
     if not track:
         raise HTTPException(
@@ -232,15 +270,27 @@ async def send_message(
 
     log.info("Chat RAG: track=%r (from %s)", track.track_name, track_source)
     
-    # Get chat history for context
-    previous_messages = db.query(models.ChatMessage).filter(
-        models.ChatMessage.chat_id == chat_id
-    ).order_by(models.ChatMessage.created_at.desc()).limit(10).all()
+    chat_history.append({"sender": "user", "text": message_text})
+    return stage, track, chat_history
+
+
+@router.post("/sessions/{chat_id}/messages", response_model=schemas.ChatMessageResponse)
+async def send_message(
+    chat_id: int,
+    message_data: schemas.ChatMessageCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Row = Depends(get_current_user)
+):
+    """
+    Send a message in a chat session and get AI mentor response
+    """
+    stage, track, chat_history = await _resolve_chat_context(
+        db, chat_id, current_user, message_data.message_text
+    )
     
-    chat_history = [
-        {"sender": msg.sender, "text": msg.message_text}
-        for msg in reversed(previous_messages)
-    ]
+    # End the read transaction so the pooled connection isn't held while
+    # waiting on the mentor response
+    await db.commit()
     
     # Generate AI mentor response via RAG API — category = user's chosen track (from path → assessment → track)
     ai_response_text = await ai_service.get_mentor_response(
@@ -250,46 +300,116 @@ async def send_message(
         chat_history=chat_history,
     )
     
-    # Save AI response
+    # Save the user message and AI response in one transaction
+    db.add(models.ChatMessage(
+        chat_id=chat_id,
+        sender="user",
+        message_text=message_data.message_text
+    ))
     ai_message = models.ChatMessage(
         chat_id=chat_id,
         sender="ai",
         message_text=ai_response_text
     )
     db.add(ai_message)
-    db.commit()
-    db.refresh(ai_message)
+    await db.commit()
     
     return ai_message
 
 
+async def _persist_ai_message(chat_id: int, chunks: List[str]) -> None:
+    """Store a streamed mentor response once the stream has finished"""
+    message_text = "".join(chunks)
+    if not message_text:
+        return
+    async with AsyncSessionLocal() as db:
+        db.add(models.ChatMessage(chat_id=chat_id, sender="ai", message_text=message_text))
+        await db.commit()
+
+
+@router.post("/sessions/{chat_id}/messages/stream")
+async def stream_message(
+    chat_id: int,
+    message_data: schemas.ChatMessageCreate,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Row = Depends(get_current_user)
+):
+    """
+    Send a message and stream the AI mentor response as Server-Sent Events.
+
+    Each chunk arrives as `data: {"t": "<text>"}`, followed by a final
+    `event: done`. The user message is stored before streaming starts and the
+    AI response once the stream completes.
+    """
+    stage, track, chat_history = await _resolve_chat_context(
+        db, chat_id, current_user, message_data.message_text
+    )
+    
+    db.add(models.ChatMessage(
+        chat_id=chat_id,
+        sender="user",
+        message_text=message_data.message_text
+    ))
+    await db.commit()
+    # Hand the connection back to the pool before the (long) generation
+    await db.close()
+    
+    chunks: List[str] = []
+    
+    async def event_stream():
+        async for token in ai_service.stream_mentor_response(
+            user_message=message_data.message_text,
+            stage_context=stage.focus_area,
+            track_name=track.track_name,
+            chat_history=chat_history,
+        ):
+            chunks.append(token)
+            yield f"data: {json.dumps({'t': token})}\n\n"
+        yield "event: done\ndata: {}\n\n"
+    
+    background_tasks.add_task(_persist_ai_message, chat_id, chunks)
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("/sessions/{chat_id}/messages", response_model=List[schemas.ChatMessageResponse])
 def get_chat_messages(
     chat_id: int,
+    response: Response,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user),
+    current_user: Row = Depends(get_current_user),
     skip: int = 0,
-    limit: int = 100
+    limit: int = 100,
+    after_id: Optional[int] = None
 ):
     """
     Get all messages in a chat session
+
+    Pass the X-Next-Cursor header of a full page as after_id to fetch the next
+    one; this seeks on (chat_id, message_id) instead of scanning skip rows.
     """
     # Verify chat session belongs to user
-    session = db.query(models.ChatSession).filter(
-        models.ChatSession.chat_id == chat_id,
-        models.ChatSession.user_id == current_user.user_id
-    ).first()
-    
-    if not session:
+    if not db.scalar(_OWNS_CHAT_STMT, {"chat_id": chat_id, "user_id": current_user.user_id}):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Chat session not found"
         )
     
-    messages = db.query(models.ChatMessage).filter(
-        models.ChatMessage.chat_id == chat_id
-    ).order_by(models.ChatMessage.created_at.asc()).offset(skip).limit(limit).all()
+    # message_id is assigned in insertion order, so it orders like created_at;
+    # the cursor replaces skip when given
+    messages = db.scalars(_MESSAGES_PAGE_STMT, {
+        "chat_id": chat_id,
+        "after_id": after_id or 0,
+        "skip": 0 if after_id is not None else skip,
+        "limit": limit,
+    }).all()
     
+    if messages and len(messages) == limit:
+        response.headers["X-Next-Cursor"] = str(messages[-1].message_id)
     return messages
 
 
@@ -297,7 +417,7 @@ def get_chat_messages(
 def delete_chat_session(
     chat_id: int,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user)
+    current_user: Row = Depends(get_current_user)
 ):
     """
     Delete a chat session and all its messages
@@ -3,19 +3,65 @@ Content router - handles learning content and user progress
 """
 import logging
 import json
+from datetime import datetime
 from typing import Any, Dict, List
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from pydantic import TypeAdapter
+from sqlalchemy import Row, and_, exists, func, insert, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, aliased, raiseload
 
 from app import models, schemas
-from app.auth_middleware import get_current_user
+from app.auth_middleware import get_current_user, get_owned_stage
 from app.database import get_db
+from app.services.dashboard_cache import invalidate_user_views
+from app.services.track_cache import get_cached_track
+from app.services.stage_progress import (
+    refresh_content_progress,
+    refresh_stage_content_total,
+    refresh_user_summary,
+)
 
 log = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/content", tags=["Learning Content"])
 
+# Columns of UserContentProgressResponse minus the free-text notes, which the
+# progress list only returns on request
+_PROGRESS_LIST_COLUMNS = (
+    models.UserContentProgress.progress_id,
+    models.UserContentProgress.user_id,
+    models.UserContentProgress.content_id,
+    models.UserContentProgress.is_completed,
+    models.UserContentProgress.completion_percentage,
+    models.UserContentProgress.time_spent_minutes,
+    models.UserContentProgress.started_at,
+    models.UserContentProgress.completed_at,
+)
+_PROGRESS_RESPONSE_COLUMNS = _PROGRESS_LIST_COLUMNS + (models.UserContentProgress.notes,)
+
+_STAGE_CONTENT_LIST = TypeAdapter(List[schemas.StageContentWithProgress])
+# The user's progress on an item, keyed "progress" in stage content rows
+_stage_item_progress = aliased(models.UserContentProgress, name="progress")
+
+
+# Namespace for the (namespace, stage_id) advisory lock key of content generation
+_GENERATION_LOCK_NAMESPACE = 4201
+
+
+def _try_lock_stage_generation(db: Session, stage_id: int) -> bool:
+    """
+    Take a transaction-scoped Postgres advisory lock for generating a stage's
+    content, without waiting. Returns False if another request holds it.
+    """
+    if db.get_bind().dialect.name != "postgresql":
+        return True
+    return bool(db.scalar(
+        select(func.pg_try_advisory_xact_lock(_GENERATION_LOCK_NAMESPACE, stage_id))
+    ))
+
 
 def _map_source_type_to_content_type(source_type: str) -> str:
     """Map content_search source_type to stage_content content_type."""
@@ -105,41 +151,26 @@ def _content_search_to_stage_items(
 async def generate_content_for_stage(
     request: schemas.GenerateStageContentRequest,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user)
+    current_user: Row = Depends(get_current_user)
 ):
     """
     Generate AI-powered learning content for a stage
     This endpoint automatically creates videos, docs, exercises, etc.
     """
-    # Verify stage exists and belongs to user's learning path
-    stage = db.query(models.LearningPathStage).filter(
-        models.LearningPathStage.stage_id == request.stage_id
-    ).first()
+    # Verify stage exists and belongs to user's learning path (one query)
+    stage, path = get_owned_stage(db, request.stage_id, current_user.user_id)
     
-    if not stage:
+    # Only one generation per stage at a time (across workers); the lock is
+    # held until this request's transaction ends
+    if not _try_lock_stage_generation(db, request.stage_id):
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Learning stage not found"
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Content generation already in progress for this stage"
         )
     
-    # Verify stage belongs to user's learning path
-    path = db.query(models.LearningPath).filter(
-        models.LearningPath.path_id == stage.path_id,
-        models.LearningPath.user_id == current_user.user_id
-    ).first()
-    
-    if not path:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Learning stage does not belong to you"
-        )
-    
-    # Check if content already exists for this stage
-    existing_content = db.query(models.StageContent).filter(
-        models.StageContent.stage_id == request.stage_id
-    ).first()
-    
-    if existing_content:
+    # Check if content already exists for this stage (under the lock, so a
+    # generation that just finished is seen)
+    if db.query(exists().where(models.StageContent.stage_id == request.stage_id)).scalar():
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Content already generated for this stage. Use GET to retrieve it."
@@ -155,9 +186,7 @@ async def generate_content_for_stage(
         models.AssessmentSession.session_id == result.session_id
     ).first()
     
-    track = db.query(models.Track).filter(
-        models.Track.track_id == session.track_id
-    ).first()
+    track = get_cached_track(db, session.track_id)
 
     # Build a concise learner profile context from the assessment report (profile-focused content).
     # This does NOT change any DB schema or request payload — it only enriches the generation prompt.
@@ -255,31 +284,33 @@ async def generate_content_for_stage(
             detail="No content could be generated for this stage. Please try again.",
         )
     
-    # Save content to database
-    created_content = []
-    for idx, item in enumerate(content_items, start=1):
-        content = models.StageContent(
-            stage_id=request.stage_id,
-            content_type=item["content_type"],
-            title=item["title"],
-            description=item["description"],
-            url=item.get("url"),
-            content_text=item.get("content_text"),
-            difficulty_level=item["difficulty_level"],
-            order_index=idx,
-            estimated_duration=item.get("estimated_duration"),
-            source_platform=item.get("source_platform"),
-            tags=item.get("tags")
-        )
-        db.add(content)
-        created_content.append(content)
-    
+    # Save content to database (one batched multi-row INSERT; no IDs needed)
+    rows = [
+        {
+            "stage_id": request.stage_id,
+            "content_type": item["content_type"],
+            "title": item["title"],
+            "description": item["description"],
+            "url": item.get("url"),
+            "content_text": item.get("content_text"),
+            "difficulty_level": item["difficulty_level"],
+            "order_index": idx,
+            "estimated_duration": item.get("estimated_duration"),
+            "source_platform": item.get("source_platform"),
+            "tags": item.get("tags"),
+        }
+        for idx, item in enumerate(content_items, start=1)
+    ]
+    db.execute(insert(models.StageContent), rows)
+    refresh_stage_content_total(db, request.stage_id)
+    refresh_user_summary(db, current_user.user_id)
     db.commit()
+    invalidate_user_views(current_user.user_id)
     
     return {
-        "message": f"Successfully generated {len(created_content)} content items",
+        "message": f"Successfully generated {len(rows)} content items",
         "stage_id": request.stage_id,
-        "content_count": len(created_content)
+        "content_count": len(rows)
     }
 
 
@@ -291,52 +322,33 @@ async def generate_content_for_stage(
 def get_stage_content(
     stage_id: int,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user)
+    current_user: Row = Depends(get_current_user)
 ):
     """
     Get all learning content for a stage with user's progress
     """
-    # Verify stage exists and belongs to user
-    stage = db.query(models.LearningPathStage).filter(
-        models.LearningPathStage.stage_id == stage_id
-    ).first()
-    
-    if not stage:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Learning stage not found"
-        )
-    
-    # Verify stage belongs to user's learning path
-    path = db.query(models.LearningPath).filter(
-        models.LearningPath.path_id == stage.path_id,
-        models.LearningPath.user_id == current_user.user_id
-    ).first()
-    
-    if not path:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Learning stage does not belong to you"
+    # Verify stage exists and belongs to user's learning path (one query)
+    get_owned_stage(db, stage_id, current_user.user_id)
+    
+    # Get all content columns for this stage together with the user's progress
+    # on each item in one LEFT JOIN (progress is None where the user hasn't
+    # started); each row carries the response's fields as attributes, so the
+    # whole list is validated in one pass
+    rows = db.execute(
+        select(*models.StageContent.__table__.c, _stage_item_progress)
+        .outerjoin(
+            _stage_item_progress,
+            and_(
+                _stage_item_progress.content_id == models.StageContent.content_id,
+                _stage_item_progress.user_id == current_user.user_id
+            )
         )
+        .options(raiseload("*"))
+        .where(models.StageContent.stage_id == stage_id)
+        .order_by(models.StageContent.order_index)
+    ).all()
     
-    # Get all content for this stage
-    content_items = db.query(models.StageContent).filter(
-        models.StageContent.stage_id == stage_id
-    ).order_by(models.StageContent.order_index).all()
-    
-    # Get user's progress for each content item
-    result = []
-    for content in content_items:
-        progress = db.query(models.UserContentProgress).filter(
-            models.UserContentProgress.user_id == current_user.user_id,
-            models.UserContentProgress.content_id == content.content_id
-        ).first()
-        
-        content_dict = schemas.StageContentResponse.model_validate(content).model_dump()
-        content_dict["progress"] = schemas.UserContentProgressResponse.model_validate(progress).model_dump() if progress else None
-        result.append(schemas.StageContentWithProgress(**content_dict))
-    
-    return result
+    return _STAGE_CONTENT_LIST.validate_python(rows, from_attributes=True)
 
 
 # ============================================================================
@@ -347,7 +359,7 @@ def get_stage_content(
 def start_content(
     progress_data: schemas.UserContentProgressCreate,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user)
+    current_user: Row = Depends(get_current_user)
 ):
     """
     Start tracking progress for a content item
@@ -385,10 +397,13 @@ def start_content(
     )
     
     db.add(progress)
+    db.flush()  # INSERT ... RETURNING fills progress_id/started_at
+    response = schemas.UserContentProgressResponse.model_validate(progress)
+    refresh_content_progress(db, current_user.user_id, progress_data.content_id)
     db.commit()
-    db.refresh(progress)
+    invalidate_user_views(current_user.user_id)
     
-    return progress
+    return response
 
 
 @router.put("/progress/{content_id}", response_model=schemas.UserContentProgressResponse)
@@ -396,15 +411,35 @@ def update_content_progress(
     content_id: int,
     progress_data: schemas.UserContentProgressUpdate,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user)
+    current_user: Row = Depends(get_current_user)
 ):
     """
     Update progress for a content item
     """
-    progress = db.query(models.UserContentProgress).filter(
+    owned_row = and_(
         models.UserContentProgress.user_id == current_user.user_id,
         models.UserContentProgress.content_id == content_id
-    ).first()
+    )
+    
+    # Only the fields that were sent are written; completed_at keeps its
+    # first value
+    values = progress_data.model_dump(exclude_none=True)
+    if values.get("is_completed"):
+        values["completed_at"] = func.coalesce(
+            models.UserContentProgress.completed_at, datetime.utcnow()
+        )
+    
+    if values:
+        # One UPDATE ... RETURNING instead of SELECT, then UPDATE, then refresh
+        progress = db.execute(
+            update(models.UserContentProgress)
+            .where(owned_row)
+            .values(**values)
+            .returning(*_PROGRESS_RESPONSE_COLUMNS)
+            .execution_options(synchronize_session=False)
+        ).first()
+    else:
+        progress = db.execute(select(*_PROGRESS_RESPONSE_COLUMNS).where(owned_row)).first()
     
     if not progress:
         raise HTTPException(
@@ -412,24 +447,11 @@ def update_content_progress(
             detail="Progress not found. Use POST to start tracking."
         )
     
-    # Update fields
-    if progress_data.is_completed is not None:
-        progress.is_completed = progress_data.is_completed
-        if progress_data.is_completed and not progress.completed_at:
-            from datetime import datetime
-            progress.completed_at = datetime.utcnow()
-    
-    if progress_data.completion_percentage is not None:
-        progress.completion_percentage = progress_data.completion_percentage
-    
-    if progress_data.time_spent_minutes is not None:
-        progress.time_spent_minutes = progress_data.time_spent_minutes
-    
-    if progress_data.notes is not None:
-        progress.notes = progress_data.notes
-    
+    if values:
+        refresh_content_progress(db, current_user.user_id, content_id)
     db.commit()
-    db.refresh(progress)
+    if values:
+        invalidate_user_views(current_user.user_id)
     
     return progress
 
@@ -438,45 +460,38 @@ def update_content_progress(
 def mark_content_complete(
     content_id: int,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user)
+    current_user: Row = Depends(get_current_user)
 ):
     """
     Mark a content item as completed
     """
-    # Check if progress exists
-    progress = db.query(models.UserContentProgress).filter(
-        models.UserContentProgress.user_id == current_user.user_id,
-        models.UserContentProgress.content_id == content_id
-    ).first()
+    # Create or complete the progress row in one race-free upsert; an unknown
+    # content_id fails the foreign key instead of needing a lookup first
+    completed = {
+        "is_completed": True,
+        "completion_percentage": 100,
+        "completed_at": datetime.utcnow(),
+    }
+    stmt = pg_insert(models.UserContentProgress).values(
+        user_id=current_user.user_id,
+        content_id=content_id,
+        **completed
+    ).on_conflict_do_update(
+        index_elements=["user_id", "content_id"],
+        set_=completed
+    ).returning(*_PROGRESS_RESPONSE_COLUMNS)
     
-    if not progress:
-        # Create progress if it doesn't exist
-        content = db.query(models.StageContent).filter(
-            models.StageContent.content_id == content_id
-        ).first()
-        
-        if not content:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Content not found"
-            )
-        
-        progress = models.UserContentProgress(
-            user_id=current_user.user_id,
-            content_id=content_id,
-            is_completed=True,
-            completion_percentage=100
+    try:
+        progress = db.execute(stmt).one()
+        refresh_content_progress(db, current_user.user_id, content_id)
+        db.commit()
+        invalidate_user_views(current_user.user_id)
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Content not found"
         )
-        db.add(progress)
-    else:
-        progress.is_completed = True
-        progress.completion_percentage = 100
-    
-    from datetime import datetime
-    progress.completed_at = datetime.utcnow()
-    
-    db.commit()
-    db.refresh(progress)
     
     return progress
 
@@ -485,71 +500,32 @@ def mark_content_complete(
 def get_stage_progress(
     stage_id: int,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user)
+    current_user: Row = Depends(get_current_user)
 ):
     """
     Get user's progress summary for a stage
     """
-    # Verify stage exists and belongs to user
-    stage = db.query(models.LearningPathStage).filter(
-        models.LearningPathStage.stage_id == stage_id
-    ).first()
-    
-    if not stage:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Learning stage not found"
+    # Verify stage exists and belongs to user's learning path (one query)
+    stage, _ = get_owned_stage(db, stage_id, current_user.user_id)
+    
+    # Count content, completions, time spent and estimated time for the stage
+    # in one aggregate over content LEFT JOIN the user's progress
+    total_content, completed_count, total_time_spent, total_estimated_time = db.query(
+        func.count(models.StageContent.content_id),
+        func.count(models.UserContentProgress.progress_id).filter(
+            models.UserContentProgress.is_completed == True
+        ),
+        func.coalesce(func.sum(models.UserContentProgress.time_spent_minutes), 0),
+        func.coalesce(func.sum(models.StageContent.estimated_duration), 0),
+    ).select_from(models.StageContent).outerjoin(
+        models.UserContentProgress,
+        and_(
+            models.UserContentProgress.content_id == models.StageContent.content_id,
+            models.UserContentProgress.user_id == current_user.user_id
         )
-    
-    # Verify stage belongs to user's learning path
-    path = db.query(models.LearningPath).filter(
-        models.LearningPath.path_id == stage.path_id,
-        models.LearningPath.user_id == current_user.user_id
-    ).first()
-    
-    if not path:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Learning stage does not belong to you"
-        )
-    
-    # Get all content for this stage
-    content_items = db.query(models.StageContent).filter(
+    ).filter(
         models.StageContent.stage_id == stage_id
-    ).all()
-    
-    total_content = len(content_items)
-    
-    if total_content == 0:
-        return schemas.StageProgressSummary(
-            stage_id=stage_id,
-            stage_name=stage.stage_name,
-            total_content_items=0,
-            completed_items=0,
-            completion_percentage=0,
-            total_time_spent_minutes=0,
-            estimated_time_remaining=0
-        )
-    
-    # Get user's progress
-    completed_count = 0
-    total_time_spent = 0
-    total_estimated_time = 0
-    
-    for content in content_items:
-        progress = db.query(models.UserContentProgress).filter(
-            models.UserContentProgress.user_id == current_user.user_id,
-            models.UserContentProgress.content_id == content.content_id
-        ).first()
-        
-        if progress and progress.is_completed:
-            completed_count += 1
-        
-        if progress:
-            total_time_spent += progress.time_spent_minutes
-        
-        if content.estimated_duration:
-            total_estimated_time += content.estimated_duration
+    ).one()
     
     completion_percentage = int((completed_count / total_content) * 100) if total_content > 0 else 0
     estimated_remaining = max(0, total_estimated_time - total_time_spent)
@@ -568,13 +544,16 @@ def get_stage_progress(
 @router.get("/my-progress", response_model=List[schemas.UserContentProgressResponse])
 def get_my_content_progress(
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user),
-    completed_only: bool = False
+    current_user: Row = Depends(get_current_user),
+    completed_only: bool = False,
+    verbose: bool = False
 ):
     """
-    Get all content progress for current user
+    Get all content progress for current user.
+    Free-text notes are only returned when verbose=true.
     """
-    query = db.query(models.UserContentProgress).filter(
+    columns = _PROGRESS_LIST_COLUMNS + ((models.UserContentProgress.notes,) if verbose else ())
+    query = db.query(*columns).filter(
         models.UserContentProgress.user_id == current_user.user_id
     )
     
@@ -590,7 +569,7 @@ def get_my_content_progress(
 def get_content_item(
     content_id: int,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user)
+    current_user: Row = Depends(get_current_user)
 ):
     """
     Get a specific content item
@@ -606,16 +585,13 @@ def get_content_item(
         )
     
     # Verify content belongs to user's learning path
-    stage = db.query(models.LearningPathStage).filter(
-        models.LearningPathStage.stage_id == content.stage_id
-    ).first()
-    
-    path = db.query(models.LearningPath).filter(
-        models.LearningPath.path_id == stage.path_id,
+    owned = db.query(exists().where(
+        models.LearningPathStage.stage_id == content.stage_id,
+        models.LearningPath.path_id == models.LearningPathStage.path_id,
         models.LearningPath.user_id == current_user.user_id
-    ).first()
+    )).scalar()
     
-    if not path:
+    if not owned:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Content does not belong to your learning path"
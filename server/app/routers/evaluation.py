@@ -1,17 +1,97 @@
 """
 Evaluation router - handles conversation-based skill evaluation
 """
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+import logging
+import os
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Response, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlalchemy import Row, and_, bindparam, delete, distinct, exists, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload, selectinload
 from typing import Any, Dict, List
-from datetime import datetime
+from datetime import datetime, timedelta
 
-from app.database import get_db
+from app.database import AsyncSessionLocal, get_async_db, get_db
 from app import models, schemas
 from app.auth_middleware import get_current_user
 from app.services.ai_service import ai_service
+from app.services.dashboard_cache import invalidate_user_views
+from app.services.stage_progress import load_path_stages
+from app.services.track_cache import get_cached_track, get_cached_track_async
 
 router = APIRouter(prefix="/api/evaluation", tags=["Skill Evaluation"])
+log = logging.getLogger("growwise")
+
+# A session still "evaluating" after this long lost its scoring task (e.g. to
+# a worker restart) and may be completed again
+EVALUATION_SCORING_TIMEOUT_SECONDS = int(os.getenv("EVALUATION_SCORING_TIMEOUT_SECONDS", "600"))
+
+# Lookups shared by the session routes, built once with bound parameters so
+# each request only binds values and reuses the compiled SQL
+_OWNED_EVALUATION_STMT = select(models.EvaluationSession).where(
+    models.EvaluationSession.evaluation_id == bindparam("evaluation_id"),
+    models.EvaluationSession.user_id == bindparam("user_id")
+)
+_OWNS_EVALUATION_STMT = select(exists().where(
+    models.EvaluationSession.evaluation_id == bindparam("evaluation_id"),
+    models.EvaluationSession.user_id == bindparam("user_id")
+))
+# ... with its dialogues (in sequence order), joined into the same round-trip
+_OWNED_EVALUATION_WITH_DIALOGUES_STMT = _OWNED_EVALUATION_STMT.options(
+    joinedload(models.EvaluationSession.dialogues)
+)
+# ... with its dialogues and learning path, for completion
+_EVALUATION_TO_COMPLETE_STMT = _OWNED_EVALUATION_STMT.options(
+    joinedload(models.EvaluationSession.path),
+    selectinload(models.EvaluationSession.dialogues),
+)
+# Columns of EvaluationSessionResponse, for the session list
+_EVALUATION_LIST_COLUMNS = (
+    models.EvaluationSession.evaluation_id,
+    models.EvaluationSession.user_id,
+    models.EvaluationSession.path_id,
+    models.EvaluationSession.status,
+    models.EvaluationSession.started_at,
+    models.EvaluationSession.completed_at,
+)
+_MY_EVALUATIONS_STMT = select(*_EVALUATION_LIST_COLUMNS).where(
+    models.EvaluationSession.user_id == bindparam("user_id")
+).order_by(models.EvaluationSession.started_at.desc())
+_EVALUATION_DIALOGUES_STMT = select(models.EvaluationDialogue).where(
+    models.EvaluationDialogue.evaluation_id == bindparam("evaluation_id")
+).order_by(models.EvaluationDialogue.sequence_no)
+# Sequence numbering for new dialogues, under a lock on the session row
+_LOCK_EVALUATION_STATUS_STMT = select(models.EvaluationSession.status).where(
+    models.EvaluationSession.evaluation_id == bindparam("evaluation_id")
+).with_for_update()
+_LAST_DIALOGUE_SEQ_STMT = select(func.max(models.EvaluationDialogue.sequence_no)).where(
+    models.EvaluationDialogue.evaluation_id == bindparam("evaluation_id")
+)
+_EVALUATION_RESULT_STMT = select(models.EvaluationResult).where(
+    models.EvaluationResult.evaluation_id == bindparam("evaluation_id")
+)
+
+
+def _scoring_cutoff() -> datetime:
+    return datetime.utcnow() - timedelta(seconds=EVALUATION_SCORING_TIMEOUT_SECONDS)
+
+
+def _completable(evaluation_id: int):
+    """Criteria for a session that may be completed: in progress, or a stale scoring claim"""
+    return and_(
+        models.EvaluationSession.evaluation_id == evaluation_id,
+        or_(
+            models.EvaluationSession.status == "in_progress",
+            and_(
+                models.EvaluationSession.status == "evaluating",
+                or_(
+                    models.EvaluationSession.scoring_started_at.is_(None),
+                    models.EvaluationSession.scoring_started_at < _scoring_cutoff()
+                )
+            )
+        )
+    )
 
 
 def _get_full_context_for_path(
@@ -39,15 +119,11 @@ def _get_full_context_for_path(
     if not result:
         return {}
 
-    stages = db.query(models.LearningPathStage).filter(
-        models.LearningPathStage.path_id == path_id
-    ).order_by(models.LearningPathStage.stage_order).all()
+    stages = load_path_stages(db, path_id, user_id)
     assessment_session = db.query(models.AssessmentSession).filter(
         models.AssessmentSession.session_id == result.session_id
     ).first()
-    track = db.query(models.Track).filter(
-        models.Track.track_id == assessment_session.track_id
-    ).first() if assessment_session else None
+    track = get_cached_track(db, assessment_session.track_id) if assessment_session else None
     if not track:
         return {}
 
@@ -81,17 +157,10 @@ def _get_full_context_for_path(
     stages_data = []
     content_consumed = []
     for stage in stages:
-        sc = db.query(models.StageContent).filter(
-            models.StageContent.stage_id == stage.stage_id
-        ).all()
         consumed = []
-        for c in sc:
-            p = db.query(models.UserContentProgress).filter(
-                models.UserContentProgress.user_id == user_id,
-                models.UserContentProgress.content_id == c.content_id,
-                models.UserContentProgress.is_completed == True,
-            ).first()
-            if p:
+        for c in stage.content_items:
+            # user_progress holds at most this user's one row
+            if any(p.is_completed for p in c.user_progress):
                 item = {
                     "content_id": c.content_id,
                     "title": c.title,
@@ -120,11 +189,107 @@ def _get_full_context_for_path(
     }
 
 
+async def _write_evaluation_intro(evaluation_id: int, context: Dict[str, Any]) -> None:
+    """
+    Background task for ?background=true sessions: generate the interviewer's
+    opening message and store it as the first dialogue.
+
+    On failure the session is deleted, so clients polling its dialogues get a
+    404 instead of waiting forever.
+    """
+    try:
+        initial_message = await ai_service.generate_evaluation_intro(context)
+        async with AsyncSessionLocal() as db:
+            db.add(models.EvaluationDialogue(
+                evaluation_id=evaluation_id,
+                speaker="ai",
+                message_text=initial_message,
+                sequence_no=1
+            ))
+            await db.commit()
+    except Exception as exc:
+        log.error("Evaluation intro failed for session %s: %s", evaluation_id, exc, exc_info=True)
+        try:
+            async with AsyncSessionLocal() as db:
+                await db.execute(
+                    delete(models.EvaluationSession)
+                    .where(models.EvaluationSession.evaluation_id == evaluation_id)
+                )
+                await db.commit()
+        except Exception as cleanup_exc:
+            log.error("Could not remove evaluation session %s: %s", evaluation_id, cleanup_exc)
+
+
+async def _score_evaluation(
+    evaluation_id: int,
+    user_id: int,
+    claimed_at: datetime,
+    dialogue_data: List[Dict[str, Any]],
+    path_info: Dict[str, Any]
+) -> None:
+    """
+    Background task for ?background=true completion: score the conversation
+    and store the result, moving the session from "evaluating" to "completed".
+
+    On failure the session goes back to "in_progress" so it can be completed
+    again. If the task is lost altogether, the session can be completed again
+    once EVALUATION_SCORING_TIMEOUT_SECONDS have passed; claimed_at then no
+    longer matches and this task's late writes are skipped.
+    """
+    try:
+        evaluation_results = await ai_service.evaluate_conversation(
+            dialogues=dialogue_data,
+            path_info=path_info
+        )
+        async with AsyncSessionLocal() as db:
+            completed = await db.execute(
+                update(models.EvaluationSession)
+                .where(
+                    models.EvaluationSession.evaluation_id == evaluation_id,
+                    models.EvaluationSession.status == "evaluating",
+                    models.EvaluationSession.scoring_started_at == claimed_at
+                )
+                .values(status="completed", completed_at=datetime.utcnow())
+            )
+            if completed.rowcount == 0:
+                # Retaken by a later claim after this one went stale
+                log.warning("Evaluation session %s was claimed again; dropping score", evaluation_id)
+                return
+            db.add(models.EvaluationResult(
+                evaluation_id=evaluation_id,
+                reasoning_score=evaluation_results["reasoning_score"],
+                problem_solving=evaluation_results["problem_solving"],
+                final_feedback=evaluation_results["final_feedback"],
+                readiness_level=evaluation_results["readiness_level"]
+            ))
+            await db.commit()
+        invalidate_user_views(user_id)
+    except Exception as exc:
+        log.error("Evaluation scoring failed for session %s: %s", evaluation_id, exc, exc_info=True)
+        try:
+            async with AsyncSessionLocal() as db:
+                await db.execute(
+                    update(models.EvaluationSession)
+                    .where(
+                        models.EvaluationSession.evaluation_id == evaluation_id,
+                        models.EvaluationSession.status == "evaluating",
+                        models.EvaluationSession.scoring_started_at == claimed_at
+                    )
+                    .values(status="in_progress")
+                )
+                await db.commit()
+        except Exception as cleanup_exc:
+            log.error("Could not reset evaluation session %s: %s", evaluation_id, cleanup_exc)
+
+
 @router.post("/sessions", response_model=schemas.EvaluationSessionResponse, status_code=status.HTTP_201_CREATED)
 async def create_evaluation_session(
     session_data: schemas.EvaluationSessionCreate,
-    db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user)
+    background_tasks: BackgroundTasks,
+    response: Response,
+    background: bool = False,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Row = Depends(get_current_user)
 ):
     """
     Start a new AI interview evaluation session with full user context
@@ -133,84 +298,101 @@ async def create_evaluation_session(
     - Learning path progress
     - Content completion status
     - Previous evaluation attempts
+
+    With ?background=true the session is returned immediately (202) and the
+    interviewer's opening message is generated after the response is sent;
+    poll GET /sessions/{id}/dialogues until it appears.
     """
-    # Verify learning path exists and belongs to user
-    path = db.query(models.LearningPath).filter(
-        models.LearningPath.path_id == session_data.path_id,
-        models.LearningPath.user_id == current_user.user_id
-    ).first()
+    # Verify learning path exists and belongs to user, loading the
+    # path → result → assessment session chain and the user's skill profile
+    # columns in the same round-trip (joined on user_id, so the users row
+    # itself is never loaded)
+    row = (await db.execute(
+        select(
+            models.LearningPath,
+            models.SkillProfile.strengths,
+            models.SkillProfile.weaknesses,
+        ).options(
+            joinedload(models.LearningPath.result)
+                .joinedload(models.AssessmentResult.session),
+        ).outerjoin(
+            models.SkillProfile,
+            models.SkillProfile.user_id == models.LearningPath.user_id
+        ).where(
+            models.LearningPath.path_id == session_data.path_id,
+            models.LearningPath.user_id == current_user.user_id
+        )
+    )).first()
     
-    if not path:
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Learning path not found"
         )
+    path, strengths, weaknesses = row
     
     # Get assessment result to understand user's baseline
-    result = db.query(models.AssessmentResult).filter(
-        models.AssessmentResult.result_id == path.result_id
-    ).first()
+    result = path.result
     if not result:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Assessment result not found for this path"
         )
     # Get assessment session for track info
-    assessment_session = db.query(models.AssessmentSession).filter(
-        models.AssessmentSession.session_id == result.session_id
-    ).first()
+    assessment_session = result.session
     if not assessment_session:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Assessment session not found for this path"
         )
     # Get track info
-    track = db.query(models.Track).filter(
-        models.Track.track_id == assessment_session.track_id
-    ).first()
+    track = await get_cached_track_async(db, assessment_session.track_id)
     if not track:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Track not found for this path"
         )
     
-    # Get user's skill profile
-    skill_profile = db.query(models.SkillProfile).filter(
-        models.SkillProfile.user_id == current_user.user_id
-    ).first()
-    
-    # Get learning path stages for context
-    stages = db.query(models.LearningPathStage).filter(
-        models.LearningPathStage.path_id == session_data.path_id
-    ).order_by(models.LearningPathStage.stage_order).all()
-    
-    # Get content completion rate
-    total_content = 0
-    completed_content = 0
-    for stage in stages:
-        stage_content = db.query(models.StageContent).filter(
-            models.StageContent.stage_id == stage.stage_id
-        ).all()
-        total_content += len(stage_content)
-        
-        for content in stage_content:
-            progress = db.query(models.UserContentProgress).filter(
-                models.UserContentProgress.user_id == current_user.user_id,
-                models.UserContentProgress.content_id == content.content_id,
+    # Count the path's stages, their content and the user's completed content
+    # in one aggregate (stages without content still count as stages)
+    stages_count, total_content, completed_content = (await db.execute(
+        select(
+            func.count(distinct(models.LearningPathStage.stage_id)),
+            func.count(models.StageContent.content_id),
+            func.count(models.UserContentProgress.progress_id).filter(
                 models.UserContentProgress.is_completed == True
-            ).first()
-            if progress:
-                completed_content += 1
+            ),
+        ).select_from(models.LearningPathStage).outerjoin(
+            models.StageContent,
+            models.StageContent.stage_id == models.LearningPathStage.stage_id
+        ).outerjoin(
+            models.UserContentProgress,
+            and_(
+                models.UserContentProgress.content_id == models.StageContent.content_id,
+                models.UserContentProgress.user_id == current_user.user_id
+            )
+        ).where(
+            models.LearningPathStage.path_id == session_data.path_id
+        )
+    )).one()
     
     completion_rate = int((completed_content / total_content * 100)) if total_content > 0 else 0
 
     # Load PathCompletionReport for learning_summary (if path is 100% complete)
-    completion_report = db.query(models.PathCompletionReport).filter(
-        models.PathCompletionReport.path_id == session_data.path_id
-    ).first()
+    completion_report = await db.scalar(
+        select(models.PathCompletionReport).where(
+            models.PathCompletionReport.path_id == session_data.path_id
+        )
+    )
 
-    # Get full_context: from PathCompletionReport or build from DB
-    full_context = _get_full_context_for_path(db, session_data.path_id, current_user.user_id)
+    # Get full_context: from PathCompletionReport or build from DB (the
+    # builder is shared with the sync routes, so it runs via run_sync)
+    if completion_report:
+        full_context = completion_report.full_context
+    else:
+        full_context = await db.run_sync(
+            _get_full_context_for_path, session_data.path_id, current_user.user_id
+        )
 
     # Create evaluation session
     new_session = models.EvaluationSession(
@@ -220,23 +402,28 @@ async def create_evaluation_session(
     )
     
     db.add(new_session)
-    db.commit()
-    db.refresh(new_session)
+    await db.commit()
+    invalidate_user_views(current_user.user_id)
     
     # Generate context-aware initial message from AI
     context = {
         "track_name": track.track_name,
         "detected_level": result.detected_level,
         "overall_score": float(result.overall_score),
-        "strengths": skill_profile.strengths if skill_profile else "",
-        "weaknesses": skill_profile.weaknesses if skill_profile else "",
+        "strengths": strengths or "",
+        "weaknesses": weaknesses or "",
         "completion_rate": completion_rate,
-        "stages_count": len(stages)
+        "stages_count": stages_count
     }
     if completion_report:
         context["learning_summary"] = completion_report.learning_summary
     context["full_context"] = full_context
 
+    if background:
+        background_tasks.add_task(_write_evaluation_intro, new_session.evaluation_id, context)
+        response.status_code = status.HTTP_202_ACCEPTED
+        return new_session
+
     initial_message = await ai_service.generate_evaluation_intro(context)
     
     # Add initial AI dialogue with context
@@ -247,24 +434,23 @@ async def create_evaluation_session(
         sequence_no=1
     )
     db.add(initial_dialogue)
-    db.commit()
+    await db.commit()
     
     return new_session
 
 
 @router.get("/sessions/{evaluation_id}", response_model=schemas.EvaluationSessionResponse)
-def get_evaluation_session(
+async def get_evaluation_session(
     evaluation_id: int,
-    db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Row = Depends(get_current_user)
 ):
     """
     Get details of an evaluation session
     """
-    session = db.query(models.EvaluationSession).filter(
-        models.EvaluationSession.evaluation_id == evaluation_id,
-        models.EvaluationSession.user_id == current_user.user_id
-    ).first()
+    session = await db.scalar(_OWNED_EVALUATION_STMT, {
+        "evaluation_id": evaluation_id, "user_id": current_user.user_id
+    })
     
     if not session:
         raise HTTPException(
@@ -276,16 +462,14 @@ def get_evaluation_session(
 
 
 @router.get("/my-sessions", response_model=List[schemas.EvaluationSessionResponse])
-def get_my_evaluation_sessions(
-    db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user)
+async def get_my_evaluation_sessions(
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Row = Depends(get_current_user)
 ):
     """
     Get all evaluation sessions for current user
     """
-    sessions = db.query(models.EvaluationSession).filter(
-        models.EvaluationSession.user_id == current_user.user_id
-    ).order_by(models.EvaluationSession.started_at.desc()).all()
+    sessions = (await db.execute(_MY_EVALUATIONS_STMT, {"user_id": current_user.user_id})).all()
     
     return sessions
 
@@ -299,16 +483,16 @@ async def respond_to_evaluation(
     evaluation_id: int,
     dialogue_data: schemas.EvaluationDialogueCreate,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user)
+    current_user: Row = Depends(get_current_user)
 ):
     """
     Submit a response in the evaluation conversation
     """
-    # Verify evaluation session
-    session = db.query(models.EvaluationSession).filter(
-        models.EvaluationSession.evaluation_id == evaluation_id,
-        models.EvaluationSession.user_id == current_user.user_id
-    ).first()
+    # Verify evaluation session, loading its dialogues (in sequence order)
+    # in the same query
+    session = db.scalars(_OWNED_EVALUATION_WITH_DIALOGUES_STMT, {
+        "evaluation_id": evaluation_id, "user_id": current_user.user_id
+    }).unique().first()
     
     if not session:
         raise HTTPException(
@@ -316,107 +500,125 @@ async def respond_to_evaluation(
             detail="Evaluation session not found"
         )
     
-    if session.status == "completed":
+    if session.status != "in_progress":
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Evaluation already completed"
         )
-    
-    # Get current dialogue count for sequence number
-    dialogue_count = db.query(models.EvaluationDialogue).filter(
-        models.EvaluationDialogue.evaluation_id == evaluation_id
-    ).count()
-    
-    # Save user response
-    user_dialogue = models.EvaluationDialogue(
-        evaluation_id=evaluation_id,
-        speaker="user",
-        message_text=dialogue_data.message_text,
-        sequence_no=dialogue_count + 1
-    )
-    db.add(user_dialogue)
-    db.commit()
-    db.refresh(user_dialogue)
-    
-    # Generate AI follow-up question or feedback
-    # Get previous dialogues for context
-    previous_dialogues = db.query(models.EvaluationDialogue).filter(
-        models.EvaluationDialogue.evaluation_id == evaluation_id
-    ).order_by(models.EvaluationDialogue.sequence_no.asc()).all()
-    
+
+    # A ?background=true session has no dialogues until its intro is stored;
+    # the intro must be sequence 1 and the follow-up needs it as context
+    if not session.dialogues:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Evaluation is still starting. Retry once the first message is available."
+        )
+
+    # Previous dialogues for context, plus this response
     dialogue_history = [
         {"speaker": d.speaker, "text": d.message_text}
-        for d in previous_dialogues
+        for d in session.dialogues
     ]
-
+    dialogue_history.append({"speaker": "user", "text": dialogue_data.message_text})
+    
     # Get full context for AI follow-up (from PathCompletionReport or build from DB)
     full_context = _get_full_context_for_path(db, session.path_id, current_user.user_id)
+    
+    # End the read transaction so no connection sits idle in it during the
+    # AI call
+    db.commit()
 
+    # Generate AI follow-up question or feedback
     ai_response_text = await ai_service.generate_evaluation_followup(
         dialogue_history=dialogue_history,
         full_context=full_context
     )
     
-    # Save AI response
+    # Save the user response and AI follow-up in one transaction. The session
+    # row is locked first so concurrent replies take sequence numbers one
+    # after the other (gaps are possible, so use the highest number rather
+    # than the count)
+    locked_status = db.scalar(_LOCK_EVALUATION_STATUS_STMT, {"evaluation_id": evaluation_id})
+    if locked_status != "in_progress":
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Evaluation already completed"
+        )
+    next_seq = (db.scalar(_LAST_DIALOGUE_SEQ_STMT, {"evaluation_id": evaluation_id}) or 0) + 1
+    user_dialogue = models.EvaluationDialogue(
+        evaluation_id=evaluation_id,
+        speaker="user",
+        message_text=dialogue_data.message_text,
+        sequence_no=next_seq
+    )
     ai_dialogue = models.EvaluationDialogue(
         evaluation_id=evaluation_id,
         speaker="ai",
         message_text=ai_response_text,
-        sequence_no=dialogue_count + 2
+        sequence_no=next_seq + 1
     )
-    db.add(ai_dialogue)
+    db.add_all([user_dialogue, ai_dialogue])
+    db.flush()  # assigns dialogue_id
+    # Serialize before commit, which would expire the object and force a reload
+    response = schemas.EvaluationDialogueResponse.model_validate(ai_dialogue)
     db.commit()
-    db.refresh(ai_dialogue)
     
-    return ai_dialogue
+    return response
 
 
 @router.get("/sessions/{evaluation_id}/dialogues", response_model=List[schemas.EvaluationDialogueResponse])
-def get_evaluation_dialogues(
+async def get_evaluation_dialogues(
     evaluation_id: int,
-    db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Row = Depends(get_current_user)
 ):
     """
     Get all dialogues in an evaluation session
     """
     # Verify evaluation session belongs to user
-    session = db.query(models.EvaluationSession).filter(
-        models.EvaluationSession.evaluation_id == evaluation_id,
-        models.EvaluationSession.user_id == current_user.user_id
-    ).first()
+    owns_session = await db.scalar(_OWNS_EVALUATION_STMT, {
+        "evaluation_id": evaluation_id, "user_id": current_user.user_id
+    })
     
-    if not session:
+    if not owns_session:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Evaluation session not found"
         )
     
-    dialogues = db.query(models.EvaluationDialogue).filter(
-        models.EvaluationDialogue.evaluation_id == evaluation_id
-    ).order_by(models.EvaluationDialogue.sequence_no.asc()).all()
-    
-    return dialogues
+    return (await db.scalars(_EVALUATION_DIALOGUES_STMT, {"evaluation_id": evaluation_id})).all()
 
 
 # ============================================================================
 # Complete Evaluation and Generate Results
 # ============================================================================
 
-@router.post("/sessions/{evaluation_id}/complete", response_model=schemas.EvaluationResultResponse)
+@router.post(
+    "/sessions/{evaluation_id}/complete",
+    response_model=schemas.EvaluationResultResponse,
+    responses={status.HTTP_202_ACCEPTED: {"model": schemas.EvaluationSessionResponse}}
+)
 async def complete_evaluation(
     evaluation_id: int,
+    background_tasks: BackgroundTasks,
+    background: bool = False,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user)
+    current_user: Row = Depends(get_current_user)
 ):
     """
     Complete the evaluation and generate AI-powered results
+
+    With ?background=true the session is returned immediately (202) with
+    status "evaluating" and the conversation is scored after the response is
+    sent; poll GET /sessions/{id}/result until it is available. A session
+    left "evaluating" for longer than EVALUATION_SCORING_TIMEOUT_SECONDS is
+    treated as in progress again.
     """
-    # Verify evaluation session
-    session = db.query(models.EvaluationSession).filter(
-        models.EvaluationSession.evaluation_id == evaluation_id,
-        models.EvaluationSession.user_id == current_user.user_id
-    ).first()
+    # Verify evaluation session, loading its path and dialogues with it
+    session = db.scalar(_EVALUATION_TO_COMPLETE_STMT, {
+        "evaluation_id": evaluation_id, "user_id": current_user.user_id
+    })
     
     if not session:
         raise HTTPException(
@@ -430,10 +632,15 @@ async def complete_evaluation(
             detail="Evaluation already completed"
         )
     
-    # Get all dialogues
-    dialogues = db.query(models.EvaluationDialogue).filter(
-        models.EvaluationDialogue.evaluation_id == evaluation_id
-    ).order_by(models.EvaluationDialogue.sequence_no.asc()).all()
+    if session.status == "evaluating" and (
+        session.scoring_started_at is not None and session.scoring_started_at >= _scoring_cutoff()
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Evaluation is already being scored"
+        )
+    
+    dialogues = session.dialogues
     
     if len(dialogues) < 3:
         raise HTTPException(
@@ -441,10 +648,7 @@ async def complete_evaluation(
             detail="Not enough conversation to evaluate. Continue the discussion."
         )
     
-    # Get learning path info
-    path = db.query(models.LearningPath).filter(
-        models.LearningPath.path_id == session.path_id
-    ).first()
+    path = session.path
     
     # Prepare dialogue data for AI evaluation
     dialogue_data = [
@@ -465,12 +669,56 @@ async def complete_evaluation(
     if completion_report:
         path_info["learning_summary"] = completion_report.learning_summary
 
+    if background:
+        # Claim the session so concurrent completions and responses are refused
+        claimed_at = datetime.utcnow()
+        claimed = db.execute(
+            update(models.EvaluationSession)
+            .where(_completable(evaluation_id))
+            .values(status="evaluating", scoring_started_at=claimed_at)
+        )
+        if claimed.rowcount == 0:
+            db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Evaluation is already being scored"
+            )
+        accepted = schemas.EvaluationSessionResponse.model_validate(session).model_copy(
+            update={"status": "evaluating"}
+        )
+        db.commit()
+        background_tasks.add_task(
+            _score_evaluation, evaluation_id, current_user.user_id, claimed_at, dialogue_data, path_info
+        )
+        return JSONResponse(
+            status_code=status.HTTP_202_ACCEPTED,
+            content=jsonable_encoder(accepted)
+        )
+
+    # Return the connection to the pool for the (long) AI call; the session
+    # checks out a fresh one for the write below
+    db.close()
+
     # AI evaluates conversation with full context
     evaluation_results = await ai_service.evaluate_conversation(
         dialogues=dialogue_data,
         path_info=path_info
     )
     
+    # Update session status, unless a concurrent request completed it
+    # while the AI call was running
+    completed = db.execute(
+        update(models.EvaluationSession)
+        .where(_completable(evaluation_id))
+        .values(status="completed", completed_at=datetime.utcnow())
+    )
+    if completed.rowcount == 0:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Evaluation already completed"
+        )
+    
     # Create evaluation result
     result = models.EvaluationResult(
         evaluation_id=evaluation_id,
@@ -481,41 +729,34 @@ async def complete_evaluation(
     )
     
     db.add(result)
-    
-    # Update session status
-    session.status = "completed"
-    session.completed_at = datetime.utcnow()
-    
     db.commit()
     db.refresh(result)
+    invalidate_user_views(current_user.user_id)
     
     return result
 
 
 @router.get("/sessions/{evaluation_id}/result", response_model=schemas.EvaluationResultResponse)
-def get_evaluation_result(
+async def get_evaluation_result(
     evaluation_id: int,
-    db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Row = Depends(get_current_user)
 ):
     """
     Get the result of a completed evaluation
     """
     # Verify evaluation session belongs to user
-    session = db.query(models.EvaluationSession).filter(
-        models.EvaluationSession.evaluation_id == evaluation_id,
-        models.EvaluationSession.user_id == current_user.user_id
-    ).first()
+    owns_session = await db.scalar(_OWNS_EVALUATION_STMT, {
+        "evaluation_id": evaluation_id, "user_id": current_user.user_id
+    })
     
-    if not session:
+    if not owns_session:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Evaluation session not found"
         )
     
-    result = db.query(models.EvaluationResult).filter(
-        models.EvaluationResult.evaluation_id == evaluation_id
-    ).first()
+    result = await db.scalar(_EVALUATION_RESULT_STMT, {"evaluation_id": evaluation_id})
     
     if not result:
         raise HTTPException(
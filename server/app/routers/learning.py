@@ -2,24 +2,50 @@
 Learning router - handles AI-generated learning paths and stages
 """
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import Row, bindparam, exists, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload
 from typing import List
 
-from app.database import get_db
+from app.database import get_async_db, get_db
 from app import models, schemas
-from app.auth_middleware import get_current_user
+from app.auth_middleware import get_current_user, get_owned_stage
 from app.services.learning_service import learning_service
 from app.services.ai_service import ai_service
+from app.services.dashboard_cache import invalidate_user_views
+from app.services.track_cache import get_cached_track
 
 router = APIRouter(prefix="/api/learning", tags=["Learning Paths"])
 
+# Read statements built once with bound parameters, so each request only
+# binds values and reuses the compiled SQL
+_USER_PATHS_STMT = select(models.LearningPath).options(
+    selectinload(models.LearningPath.stages)
+).where(models.LearningPath.user_id == bindparam("user_id"))
+_OWNED_PATH_STMT = _USER_PATHS_STMT.where(models.LearningPath.path_id == bindparam("path_id"))
+_MY_PATHS_STMT = _USER_PATHS_STMT.order_by(models.LearningPath.created_at.desc())
+_MY_CURRENT_PATH_STMT = _MY_PATHS_STMT.limit(1)
+_OWNS_PATH_STMT = select(exists().where(
+    models.LearningPath.path_id == bindparam("path_id"),
+    models.LearningPath.user_id == bindparam("user_id")
+))
+_SKILL_PROFILE_STMT = select(models.SkillProfile).where(
+    models.SkillProfile.user_id == bindparam("user_id")
+)
+# The profile fields handed to the path generator, as a plain row
+_SKILL_PROFILE_FIELDS_STMT = select(
+    models.SkillProfile.strengths,
+    models.SkillProfile.weaknesses,
+    models.SkillProfile.thinking_pattern,
+).where(models.SkillProfile.user_id == bindparam("user_id"))
+
 
 @router.post("/paths", response_model=schemas.LearningPathResponse, status_code=status.HTTP_201_CREATED)
 async def create_learning_path(
     path_data: schemas.LearningPathCreate,
     auto_generate_content: bool = True,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user)
+    current_user: Row = Depends(get_current_user)
 ):
     """
     Generate AI-powered personalized learning path based on assessment results
@@ -49,13 +75,11 @@ async def create_learning_path(
         )
     
     # Get track info
-    track = db.query(models.Track).filter(
-        models.Track.track_id == session.track_id
-    ).first()
+    track = get_cached_track(db, session.track_id)
     
     # Get user's skill profile
-    skill_profile = db.query(models.SkillProfile).filter(
-        models.SkillProfile.user_id == current_user.user_id
+    skill_profile = db.execute(
+        _SKILL_PROFILE_FIELDS_STMT, {"user_id": current_user.user_id}
     ).first()
     
     if not skill_profile:
@@ -64,11 +88,7 @@ async def create_learning_path(
             detail="Skill profile not found. Complete assessment first."
         )
     
-    profile_dict = {
-        "strengths": skill_profile.strengths,
-        "weaknesses": skill_profile.weaknesses,
-        "thinking_pattern": skill_profile.thinking_pattern
-    }
+    profile_dict = skill_profile._asdict()
     
     # Generate AI-powered learning path with stages (and optionally content)
     learning_path = await learning_service.create_learning_path_with_stages(
@@ -80,23 +100,23 @@ async def create_learning_path(
         skill_profile=profile_dict,
         auto_generate_content=auto_generate_content
     )
+    invalidate_user_views(current_user.user_id)
     
     return learning_path
 
 
 @router.get("/paths/{path_id}", response_model=schemas.LearningPathResponse)
-def get_learning_path(
+async def get_learning_path(
     path_id: int,
-    db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Row = Depends(get_current_user)
 ):
     """
     Get a specific learning path with all stages
     """
-    learning_path = db.query(models.LearningPath).filter(
-        models.LearningPath.path_id == path_id,
-        models.LearningPath.user_id == current_user.user_id
-    ).first()
+    learning_path = await db.scalar(_OWNED_PATH_STMT, {
+        "path_id": path_id, "user_id": current_user.user_id
+    })
     
     if not learning_path:
         raise HTTPException(
@@ -108,31 +128,27 @@ def get_learning_path(
 
 
 @router.get("/my-paths", response_model=List[schemas.LearningPathResponse])
-def get_my_learning_paths(
-    db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user)
+async def get_my_learning_paths(
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Row = Depends(get_current_user)
 ):
     """
     Get all learning paths for current user
     """
-    paths = db.query(models.LearningPath).filter(
-        models.LearningPath.user_id == current_user.user_id
-    ).order_by(models.LearningPath.created_at.desc()).all()
+    paths = (await db.scalars(_MY_PATHS_STMT, {"user_id": current_user.user_id})).all()
     
     return paths
 
 
 @router.get("/my-current-path", response_model=schemas.LearningPathResponse)
-def get_my_current_path(
-    db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user)
+async def get_my_current_path(
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Row = Depends(get_current_user)
 ):
     """
     Get user's most recent learning path
     """
-    path = db.query(models.LearningPath).filter(
-        models.LearningPath.user_id == current_user.user_id
-    ).order_by(models.LearningPath.created_at.desc()).first()
+    path = await db.scalar(_MY_CURRENT_PATH_STMT, {"user_id": current_user.user_id})
     
     if not path:
         raise HTTPException(
@@ -144,75 +160,56 @@ def get_my_current_path(
 
 
 @router.get("/stages/{stage_id}", response_model=schemas.LearningPathStageResponse)
-def get_stage(
+async def get_stage(
     stage_id: int,
-    db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Row = Depends(get_current_user)
 ):
     """
     Get details of a specific learning stage
     """
-    stage = db.query(models.LearningPathStage).filter(
-        models.LearningPathStage.stage_id == stage_id
-    ).first()
-    
-    if not stage:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Learning stage not found"
-        )
-    
-    # Verify the stage belongs to user's path
-    path = db.query(models.LearningPath).filter(
-        models.LearningPath.path_id == stage.path_id,
-        models.LearningPath.user_id == current_user.user_id
-    ).first()
-    
-    if not path:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Stage does not belong to your learning path"
-        )
+    # Verify the stage exists and belongs to user's path (one query)
+    stage, _ = await db.run_sync(
+        get_owned_stage, stage_id, current_user.user_id,
+        forbidden_detail="Stage does not belong to your learning path"
+    )
     
     return stage
 
 
 @router.get("/paths/{path_id}/stages", response_model=List[schemas.LearningPathStageResponse])
-def get_path_stages(
+async def get_path_stages(
     path_id: int,
-    db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Row = Depends(get_current_user)
 ):
     """
     Get all stages for a learning path in order
     """
     # Verify path belongs to user
-    path = db.query(models.LearningPath).filter(
-        models.LearningPath.path_id == path_id,
-        models.LearningPath.user_id == current_user.user_id
-    ).first()
+    path_exists = await db.scalar(_OWNS_PATH_STMT, {
+        "path_id": path_id, "user_id": current_user.user_id
+    })
     
-    if not path:
+    if not path_exists:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Learning path not found"
         )
     
-    stages = learning_service.get_all_stages_for_path(db, path_id)
+    stages = await db.run_sync(learning_service.get_all_stages_for_path, path_id)
     return stages
 
 
 @router.get("/skill-profile", response_model=schemas.SkillProfileResponse)
-def get_my_skill_profile(
-    db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user)
+async def get_my_skill_profile(
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Row = Depends(get_current_user)
 ):
     """
     Get current user's skill profile
     """
-    profile = db.query(models.SkillProfile).filter(
-        models.SkillProfile.user_id == current_user.user_id
-    ).first()
+    profile = await db.scalar(_SKILL_PROFILE_STMT, {"user_id": current_user.user_id})
     
     if not profile:
         raise HTTPException(
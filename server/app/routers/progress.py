@@ -1,15 +1,25 @@
 """
 Progress & Dashboard router - Complete progress tracking and analytics
 """
+import asyncio
+import os
+from contextlib import asynccontextmanager
+
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import Row, and_, bindparam, func, literal, select, union_all
+from sqlalchemy.dialects.postgresql import JSONB
 from typing import Any, Dict, List, Optional
 from datetime import datetime, timedelta
 
-from app.database import get_db
+from app.database import AsyncSessionLocal, get_async_db, get_db
 from app import models, schemas
 from app.auth_middleware import get_current_user
+from app.services.dashboard_cache import get_user_view, remember_user_view
+from app.services.dashboard_rollup import get_user_rollup
+from app.services.stage_progress import ensure_path_progress, ensure_user_summary, load_path_stages
+from app.services.track_cache import get_cached_track
 from app.ai_services.path_completion_report_module import generate_path_completion_report
 from app.ai_services.improvement_analysis_generator import generate_detailed_analysis, generate_structured_report
 
@@ -20,62 +30,72 @@ router = APIRouter(prefix="/api/progress", tags=["Progress & Dashboard"])
 # Assessment Progress Tracking
 # ============================================================================
 
+def _assessment_history_entry(row: Any) -> schemas.AssessmentHistoryItem:
+    # Values come straight from typed columns, so validation is skipped
+    return schemas.AssessmentHistoryItem.model_construct(
+        session_id=row.session_id,
+        track_id=row.track_id,
+        track_name=row.track_name or "",
+        attempt_date=row.started_at,
+        completed_date=row.completed_at,
+        score=float(row.overall_score or 0),
+        detected_level=row.detected_level,
+        ai_reasoning=row.ai_reasoning
+    )
+
+
 @router.get("/assessments/history")
-def get_assessment_history(
+async def get_assessment_history(
     track_id: Optional[int] = None,
-    db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Row = Depends(get_current_user)
 ):
     """
     Get complete assessment history with scores over time
     Shows improvement progression across multiple attempts
     """
-    query = db.query(models.AssessmentSession).filter(
+    # Sessions without a result are skipped, so the result join is inner;
+    # the track name comes along in the same row
+    query = select(
+        models.AssessmentSession.session_id,
+        models.AssessmentSession.track_id,
+        models.AssessmentSession.started_at,
+        models.AssessmentSession.completed_at,
+        models.AssessmentResult.overall_score,
+        models.AssessmentResult.detected_level,
+        models.AssessmentResult.ai_reasoning,
+        models.Track.track_name,
+    ).join(
+        models.AssessmentResult,
+        models.AssessmentResult.session_id == models.AssessmentSession.session_id
+    ).outerjoin(
+        models.Track,
+        models.Track.track_id == models.AssessmentSession.track_id
+    ).where(
         models.AssessmentSession.user_id == current_user.user_id,
         models.AssessmentSession.status == "completed"
     )
     
     if track_id:
-        query = query.filter(models.AssessmentSession.track_id == track_id)
+        query = query.where(models.AssessmentSession.track_id == track_id)
     
-    sessions = query.order_by(models.AssessmentSession.started_at.asc()).all()
-    
-    history = []
-    for session in sessions:
-        result = db.query(models.AssessmentResult).filter(
-            models.AssessmentResult.session_id == session.session_id
-        ).first()
-        
-        if result:
-            track = db.query(models.Track).filter(
-                models.Track.track_id == session.track_id
-            ).first()
-            
-            history.append({
-                "session_id": session.session_id,
-                "track_id": session.track_id,
-                "track_name": track.track_name if track else "",
-                "attempt_date": session.started_at,
-                "completed_date": session.completed_at,
-                "score": float(result.overall_score),
-                "detected_level": result.detected_level,
-                "ai_reasoning": result.ai_reasoning
-            })
+    rows = (await db.execute(query.order_by(models.AssessmentSession.started_at.asc()))).all()
+    history = [_assessment_history_entry(row) for row in rows]
     
     return {
         "total_attempts": len(history),
         "history": history,
-        "improvement": _calculate_improvement(history) if len(history) > 1 else None
+        "improvement": _calculate_improvement(history)
     }
 
 
-def _calculate_improvement(history: List) -> dict:
+def _calculate_improvement(history: List[schemas.AssessmentHistoryItem]) -> Optional[dict]:
     """Calculate improvement metrics"""
     if len(history) < 2:
         return None
 
-    first_score = history[0]["score"]
-    latest_score = history[-1]["score"]
+    first_score = history[0].score
+    latest_score = history[-1].score
 
     # Avoid division by zero when first_score is 0
     if first_score is None or first_score == 0:
@@ -87,83 +107,86 @@ def _calculate_improvement(history: List) -> dict:
         "first_attempt_score": first_score,
         "latest_attempt_score": latest_score,
         "improvement_percentage": round(improvement_percentage, 2),
-        "level_progression": f"{history[0]['detected_level']} → {history[-1]['detected_level']}",
+        "level_progression": f"{history[0].detected_level} → {history[-1].detected_level}",
     }
 
 
 @router.get("/assessments/compare/{session_id_1}/{session_id_2}")
-def compare_assessments(
+async def compare_assessments(
     session_id_1: int,
     session_id_2: int,
-    db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Row = Depends(get_current_user)
 ):
     """
     Compare two assessment attempts to see improvement
     """
-    # Get both sessions
-    session1 = db.query(models.AssessmentSession).filter(
-        models.AssessmentSession.session_id == session_id_1,
-        models.AssessmentSession.user_id == current_user.user_id
-    ).first()
-    
-    session2 = db.query(models.AssessmentSession).filter(
-        models.AssessmentSession.session_id == session_id_2,
-        models.AssessmentSession.user_id == current_user.user_id
-    ).first()
+    # Both sessions with their results (if any) as plain rows
+    rows = {
+        row.session_id: row
+        for row in (await db.execute(
+            select(
+                models.AssessmentSession.session_id,
+                models.AssessmentSession.started_at,
+                models.AssessmentResult.overall_score,
+                models.AssessmentResult.detected_level,
+            ).outerjoin(
+                models.AssessmentResult,
+                models.AssessmentResult.session_id == models.AssessmentSession.session_id
+            ).where(
+                models.AssessmentSession.session_id.in_((session_id_1, session_id_2)),
+                models.AssessmentSession.user_id == current_user.user_id
+            )
+        )).all()
+    }
+    attempt1 = rows.get(session_id_1)
+    attempt2 = rows.get(session_id_2)
     
-    if not session1 or not session2:
+    if not attempt1 or not attempt2:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="One or both assessment sessions not found"
         )
     
-    # Get results
-    result1 = db.query(models.AssessmentResult).filter(
-        models.AssessmentResult.session_id == session_id_1
-    ).first()
-    
-    result2 = db.query(models.AssessmentResult).filter(
-        models.AssessmentResult.session_id == session_id_2
-    ).first()
-    
-    if not result1 or not result2:
+    # The result columns are NULL for a session that has no result yet
+    if attempt1.overall_score is None or attempt2.overall_score is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Both assessments must be completed"
         )
     
-    # Get responses for detailed comparison
-    responses1 = db.query(models.AssessmentResponse).filter(
-        models.AssessmentResponse.session_id == session_id_1
-    ).all()
-    
-    responses2 = db.query(models.AssessmentResponse).filter(
-        models.AssessmentResponse.session_id == session_id_2
-    ).all()
+    # Count answered questions for both sessions in one GROUP BY
+    answered = dict((await db.execute(
+        select(
+            models.AssessmentResponse.session_id,
+            func.count(),
+        ).where(
+            models.AssessmentResponse.session_id.in_((session_id_1, session_id_2))
+        ).group_by(models.AssessmentResponse.session_id)
+    )).all())
     
     return {
         "attempt_1": {
-            "date": session1.started_at,
-            "overall_score": float(result1.overall_score),
-            "detected_level": result1.detected_level,
-            "questions_answered": len(responses1),
-            "average_question_score": float(result1.overall_score) / 100
+            "date": attempt1.started_at,
+            "overall_score": float(attempt1.overall_score),
+            "detected_level": attempt1.detected_level,
+            "questions_answered": answered.get(session_id_1, 0),
+            "average_question_score": float(attempt1.overall_score) / 100
         },
         "attempt_2": {
-            "date": session2.started_at,
-            "overall_score": float(result2.overall_score),
-            "detected_level": result2.detected_level,
-            "questions_answered": len(responses2),
-            "average_question_score": float(result2.overall_score) / 100
+            "date": attempt2.started_at,
+            "overall_score": float(attempt2.overall_score),
+            "detected_level": attempt2.detected_level,
+            "questions_answered": answered.get(session_id_2, 0),
+            "average_question_score": float(attempt2.overall_score) / 100
         },
         "improvement": {
-            "score_change": float(result2.overall_score) - float(result1.overall_score),
+            "score_change": float(attempt2.overall_score) - float(attempt1.overall_score),
             "percentage_improvement": round(
-                ((float(result2.overall_score) - float(result1.overall_score)) / float(result1.overall_score)) * 100, 2
+                ((float(attempt2.overall_score) - float(attempt1.overall_score)) / float(attempt1.overall_score)) * 100, 2
             ),
-            "level_change": f"{result1.detected_level} → {result2.detected_level}",
-            "time_between_attempts": str(session2.started_at - session1.started_at)
+            "level_change": f"{attempt1.detected_level} → {attempt2.detected_level}",
+            "time_between_attempts": str(attempt2.started_at - attempt1.started_at)
         }
     }
 
@@ -173,19 +196,21 @@ def compare_assessments(
 # ============================================================================
 
 @router.get("/learning-path/{path_id}")
-def get_learning_path_progress(
+async def get_learning_path_progress(
     path_id: int,
-    db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Row = Depends(get_current_user)
 ):
     """
     Get detailed progress for a learning path
     """
-    # Verify path belongs to user
-    path = db.query(models.LearningPath).filter(
-        models.LearningPath.path_id == path_id,
-        models.LearningPath.user_id == current_user.user_id
-    ).first()
+    # Verify path belongs to user; created_at is the only column needed
+    path = (await db.execute(
+        select(models.LearningPath.created_at).where(
+            models.LearningPath.path_id == path_id,
+            models.LearningPath.user_id == current_user.user_id
+        )
+    )).first()
     
     if not path:
         raise HTTPException(
@@ -193,45 +218,45 @@ def get_learning_path_progress(
             detail="Learning path not found"
         )
     
-    # Get all stages
-    stages = db.query(models.LearningPathStage).filter(
+    # Per-stage totals come from the summary table; stages the user hasn't
+    # touched yet get their row built on first read
+    stage_query = select(
+        models.LearningPathStage.stage_id,
+        models.LearningPathStage.stage_name,
+        models.LearningPathStage.stage_order,
+        models.LearningPathStageProgress.total_content,
+        models.LearningPathStageProgress.completed_content,
+        models.LearningPathStageProgress.time_spent_minutes,
+    ).outerjoin(
+        models.LearningPathStageProgress,
+        and_(
+            models.LearningPathStageProgress.stage_id == models.LearningPathStage.stage_id,
+            models.LearningPathStageProgress.user_id == current_user.user_id
+        )
+    ).where(
         models.LearningPathStage.path_id == path_id
-    ).order_by(models.LearningPathStage.stage_order).all()
+    ).order_by(models.LearningPathStage.stage_order)
+    
+    stage_rows = (await db.execute(stage_query)).all()
+    if any(row.total_content is None for row in stage_rows):
+        await ensure_path_progress(db, current_user.user_id, path_id)
+        await db.commit()
+        stage_rows = (await db.execute(stage_query)).all()
     
     stages_progress = []
     total_content = 0
     total_completed = 0
     total_time = 0
     
-    for stage in stages:
-        # Get all content for this stage
-        content_items = db.query(models.StageContent).filter(
-            models.StageContent.stage_id == stage.stage_id
-        ).all()
-        
-        stage_total = len(content_items)
-        stage_completed = 0
-        stage_time = 0
-        
-        for content in content_items:
-            progress = db.query(models.UserContentProgress).filter(
-                models.UserContentProgress.user_id == current_user.user_id,
-                models.UserContentProgress.content_id == content.content_id
-            ).first()
-            
-            if progress:
-                if progress.is_completed:
-                    stage_completed += 1
-                stage_time += progress.time_spent_minutes
-        
+    for stage_id, stage_name, stage_order, stage_total, stage_completed, stage_time in stage_rows:
         total_content += stage_total
         total_completed += stage_completed
         total_time += stage_time
         
         stages_progress.append({
-            "stage_id": stage.stage_id,
-            "stage_name": stage.stage_name,
-            "stage_order": stage.stage_order,
+            "stage_id": stage_id,
+            "stage_name": stage_name,
+            "stage_order": stage_order,
             "total_content": stage_total,
             "completed_content": stage_completed,
             "completion_percentage": int((stage_completed / stage_total * 100)) if stage_total > 0 else 0,
@@ -258,7 +283,7 @@ def get_learning_path_progress(
 async def create_path_completion_report(
     path_id: int,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user)
+    current_user: Row = Depends(get_current_user)
 ):
     """
     Generate and store path completion report when path is 100% complete.
@@ -285,23 +310,27 @@ async def create_path_completion_report(
 
 
 @router.get("/path/{path_id}/report", response_model=schemas.PathCompletionReportResponse)
-def get_path_completion_report(
+async def get_path_completion_report(
     path_id: int,
-    db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Row = Depends(get_current_user)
 ):
     """Retrieve path completion report for a path."""
-    path = db.query(models.LearningPath).filter(
-        models.LearningPath.path_id == path_id,
-        models.LearningPath.user_id == current_user.user_id
-    ).first()
+    path = await db.scalar(
+        select(models.LearningPath).where(
+            models.LearningPath.path_id == path_id,
+            models.LearningPath.user_id == current_user.user_id
+        )
+    )
 
     if not path:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Learning path not found")
 
-    report = db.query(models.PathCompletionReport).filter(
-        models.PathCompletionReport.path_id == path_id
-    ).first()
+    report = await db.scalar(
+        select(models.PathCompletionReport).where(
+            models.PathCompletionReport.path_id == path_id
+        )
+    )
 
     if not report:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Path completion report not found")
@@ -382,22 +411,12 @@ def _build_after_context_from_db(
             })
             content_consumed.extend(consumed)
     else:
-        stages = db.query(models.LearningPathStage).filter(
-            models.LearningPathStage.path_id == path_id
-        ).order_by(models.LearningPathStage.stage_order).all()
-        for stage in stages:
-            sc = db.query(models.StageContent).filter(
-                models.StageContent.stage_id == stage.stage_id
-            ).all()
-            titles = []
-            for c in sc:
-                p = db.query(models.UserContentProgress).filter(
-                    models.UserContentProgress.user_id == user_id,
-                    models.UserContentProgress.content_id == c.content_id,
-                    models.UserContentProgress.is_completed == True,
-                ).first()
-                if p:
-                    titles.append(c.title or "")
+        for stage in load_path_stages(db, path_id, user_id):
+            titles = [
+                c.title or ""
+                for c in stage.content_items
+                if any(p.is_completed for p in c.user_progress)
+            ]
             stages_data.append({
                 "stage_name": stage.stage_name,
                 "focus_area": stage.focus_area or "",
@@ -489,21 +508,14 @@ def _build_chart_data(
             "score": round(float(dr.dimension_score) * 100) if dr.dimension_score is not None else 0,
         })
 
-    stages = db.query(models.LearningPathStage).filter(
-        models.LearningPathStage.path_id == path_id
-    ).order_by(models.LearningPathStage.stage_order).all()
+    # Stages, their content and this user's progress rows in three queries;
+    # both loops below walk the loaded objects
+    stages = load_path_stages(db, path_id, user_id)
     for stage in stages:
-        content_items = db.query(models.StageContent).filter(
-            models.StageContent.stage_id == stage.stage_id
-        ).all()
         total_minutes = 0
         completed = 0
-        for c in content_items:
-            prog = db.query(models.UserContentProgress).filter(
-                models.UserContentProgress.user_id == user_id,
-                models.UserContentProgress.content_id == c.content_id,
-            ).first()
-            if prog:
+        for c in stage.content_items:
+            for prog in c.user_progress:
                 total_minutes += prog.time_spent_minutes or 0
                 if prog.is_completed:
                     completed += 1
@@ -524,13 +536,10 @@ def _build_chart_data(
         })
 
     for stage in stages:
-        for c in db.query(models.StageContent).filter(models.StageContent.stage_id == stage.stage_id).all():
-            prog = db.query(models.UserContentProgress).filter(
-                models.UserContentProgress.user_id == user_id,
-                models.UserContentProgress.content_id == c.content_id,
-                models.UserContentProgress.is_completed == True,
-            ).first()
-            if prog and prog.completed_at:
+        for c in stage.content_items:
+            for prog in c.user_progress:
+                if not (prog.is_completed and prog.completed_at):
+                    continue
                 chart_data["activity_timeline"].append({
                     "date": prog.completed_at.isoformat() if hasattr(prog.completed_at, "isoformat") else str(prog.completed_at),
                     "event_type": "content",
@@ -558,7 +567,7 @@ def _build_chart_data(
 async def get_improvement_analysis(
     path_id: int,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user)
+    current_user: Row = Depends(get_current_user)
 ):
     """Compare before (assessment) vs after (evaluation) for a path. Rich before/after context and AI detailed analysis."""
     path = db.query(models.LearningPath).filter(
@@ -582,9 +591,7 @@ async def get_improvement_analysis(
     track = None
     track_name = None
     if assessment_session:
-        track = db.query(models.Track).filter(
-            models.Track.track_id == assessment_session.track_id
-        ).first()
+        track = get_cached_track(db, assessment_session.track_id)
         track_name = track.track_name if track else None
 
     before_dict, before_context_list = _build_before_context(db, result)
@@ -738,62 +745,68 @@ async def get_improvement_analysis(
 # ============================================================================
 
 @router.get("/evaluations/history")
-def get_evaluation_history(
-    db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user)
+async def get_evaluation_history(
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Row = Depends(get_current_user)
 ):
     """
     Get all evaluation attempts with scores over time
     """
-    sessions = db.query(models.EvaluationSession).filter(
-        models.EvaluationSession.user_id == current_user.user_id,
-        models.EvaluationSession.status == "completed"
-    ).order_by(models.EvaluationSession.started_at.asc()).all()
+    # Completed sessions with their result and the track reached through
+    # path → assessment result → assessment session, as one row each
+    rows = (await db.execute(
+        select(
+            models.EvaluationSession.evaluation_id,
+            models.EvaluationSession.started_at,
+            models.EvaluationSession.completed_at,
+            models.EvaluationResult.reasoning_score,
+            models.EvaluationResult.problem_solving,
+            models.EvaluationResult.readiness_level,
+            models.EvaluationResult.final_feedback,
+            models.Track.track_name,
+        ).join(
+            models.EvaluationResult,
+            models.EvaluationResult.evaluation_id == models.EvaluationSession.evaluation_id
+        ).join(
+            models.LearningPath,
+            models.LearningPath.path_id == models.EvaluationSession.path_id
+        ).join(
+            models.AssessmentResult,
+            models.AssessmentResult.result_id == models.LearningPath.result_id
+        ).join(
+            models.AssessmentSession,
+            models.AssessmentSession.session_id == models.AssessmentResult.session_id
+        ).outerjoin(
+            models.Track,
+            models.Track.track_id == models.AssessmentSession.track_id
+        ).where(
+            models.EvaluationSession.user_id == current_user.user_id,
+            models.EvaluationSession.status == "completed"
+        ).order_by(models.EvaluationSession.started_at.asc())
+    )).all()
     
-    history = []
-    for session in sessions:
-        result = db.query(models.EvaluationResult).filter(
-            models.EvaluationResult.evaluation_id == session.evaluation_id
-        ).first()
-        
-        if result:
-            # Get path info
-            path = db.query(models.LearningPath).filter(
-                models.LearningPath.path_id == session.path_id
-            ).first()
-            
-            # Get track via assessment result
-            assessment_result = db.query(models.AssessmentResult).filter(
-                models.AssessmentResult.result_id == path.result_id
-            ).first()
-            
-            assessment_session = db.query(models.AssessmentSession).filter(
-                models.AssessmentSession.session_id == assessment_result.session_id
-            ).first()
-            
-            track = db.query(models.Track).filter(
-                models.Track.track_id == assessment_session.track_id
-            ).first()
-            
-            history.append({
-                "evaluation_id": session.evaluation_id,
-                "track_name": track.track_name if track else "",
-                "attempt_date": session.started_at,
-                "completed_date": session.completed_at,
-                "reasoning_score": float(result.reasoning_score),
-                "problem_solving_score": float(result.problem_solving),
-                "readiness_level": result.readiness_level,
-                "final_feedback": result.final_feedback
-            })
+    history = [
+        {
+            "evaluation_id": row.evaluation_id,
+            "track_name": row.track_name or "",
+            "attempt_date": row.started_at,
+            "completed_date": row.completed_at,
+            "reasoning_score": float(row.reasoning_score),
+            "problem_solving_score": float(row.problem_solving),
+            "readiness_level": row.readiness_level,
+            "final_feedback": row.final_feedback
+        }
+        for row in rows
+    ]
     
     return {
         "total_evaluations": len(history),
         "history": history,
-        "progression": _calculate_evaluation_progression(history) if len(history) > 1 else None
+        "progression": _calculate_evaluation_progression(history)
     }
 
 
-def _calculate_evaluation_progression(history: List) -> dict:
+def _calculate_evaluation_progression(history: List) -> Optional[dict]:
     """Calculate evaluation progression"""
     if len(history) < 2:
         return None
@@ -826,107 +839,173 @@ def _calculate_evaluation_progression(history: List) -> dict:
 # Complete Dashboard Summary
 # ============================================================================
 
+async def _live_dashboard_totals(db: AsyncSession, user_id: int) -> Any:
+    """
+    The mv_user_dashboard_rollup columns the dashboard uses (content totals
+    come from user_progress_summary), computed on the spot
+    """
+    def owned_count(model, *criteria):
+        return select(func.count()).select_from(model).where(
+            model.user_id == user_id, *criteria
+        ).scalar_subquery()
+    
+    return (await db.execute(
+        select(
+            owned_count(models.LearningPath).label("total_paths"),
+            owned_count(
+                models.AssessmentSession, models.AssessmentSession.status == "completed"
+            ).label("completed_assessments"),
+            owned_count(
+                models.EvaluationSession, models.EvaluationSession.status == "completed"
+            ).label("completed_evaluations"),
+            func.now().label("refreshed_at"),
+        )
+    )).one()
+
+
+# The dashboard's independent reads; each runs on its own session so they
+# can be awaited together. A miss would otherwise take six pooled async
+# connections at once, so the reads of all dashboards in this process share
+# DASHBOARD_MAX_CONCURRENT_READS connections and queue beyond that.
+DASHBOARD_MAX_CONCURRENT_READS = int(os.getenv("DASHBOARD_MAX_CONCURRENT_READS", "8"))
+_dashboard_read_slots = asyncio.Semaphore(DASHBOARD_MAX_CONCURRENT_READS)
+_DASHBOARD_TRACKS_STMT = select(
+    models.UserTrackSelection.track_id,
+    models.UserTrackSelection.selected_at,
+).where(models.UserTrackSelection.user_id == bindparam("user_id"))
+
+# Latest completed session and its result in one round-trip; the outer join
+# keeps a result-less latest session from falling back to an older one
+_LATEST_ASSESSMENT_STMT = select(
+    models.AssessmentSession.started_at,
+    models.AssessmentResult.result_id,
+    models.AssessmentResult.overall_score,
+    models.AssessmentResult.detected_level,
+).outerjoin(
+    models.AssessmentResult,
+    models.AssessmentResult.session_id == models.AssessmentSession.session_id
+).where(
+    models.AssessmentSession.user_id == bindparam("user_id"),
+    models.AssessmentSession.status == "completed"
+).order_by(models.AssessmentSession.started_at.desc()).limit(1)
+
+_LATEST_EVALUATION_STMT = select(
+    models.EvaluationSession.started_at,
+    models.EvaluationResult.result_id,
+    models.EvaluationResult.reasoning_score,
+    models.EvaluationResult.problem_solving,
+    models.EvaluationResult.readiness_level,
+).outerjoin(
+    models.EvaluationResult,
+    models.EvaluationResult.evaluation_id == models.EvaluationSession.evaluation_id
+).where(
+    models.EvaluationSession.user_id == bindparam("user_id"),
+    models.EvaluationSession.status == "completed"
+).order_by(models.EvaluationSession.started_at.desc()).limit(1)
+
+_DASHBOARD_SKILL_PROFILE_STMT = select(
+    models.SkillProfile.strengths,
+    models.SkillProfile.weaknesses,
+    models.SkillProfile.thinking_pattern,
+).where(models.SkillProfile.user_id == bindparam("user_id"))
+
+
+@asynccontextmanager
+async def _dashboard_session():
+    """A separate session for one dashboard read, once a read slot is free"""
+    async with _dashboard_read_slots:
+        async with AsyncSessionLocal() as db:
+            yield db
+
+
+async def _read_rows(stmt, params: Dict[str, Any]) -> List[Any]:
+    """All rows of stmt, read on a separate session"""
+    async with _dashboard_session() as db:
+        return (await db.execute(stmt, params)).all()
+
+
+async def _read_first(stmt, params: Dict[str, Any]) -> Any:
+    """First row of stmt (or None), read on a separate session"""
+    async with _dashboard_session() as db:
+        return (await db.execute(stmt, params)).first()
+
+
+async def _learning_summary(user_id: int) -> models.UserProgressSummary:
+    """
+    The user's user_progress_summary row, created on first read for users
+    with no tracked writes yet (read on a separate session)
+    """
+    async with _dashboard_session() as db:
+        summary = await db.get(models.UserProgressSummary, user_id)
+        if summary is None:
+            await ensure_user_summary(db, user_id)
+            await db.commit()
+            summary = await db.get(models.UserProgressSummary, user_id)
+        return summary
+
+
+async def _dashboard_totals(user_id: int) -> Any:
+    """
+    Totals from the periodically refreshed rollup, or live when the user
+    joined or wrote after its last refresh (read on a separate session)
+    """
+    async with _dashboard_session() as db:
+        totals = await get_user_rollup(db, user_id)
+        if totals is None or totals.written_since_refresh:
+            totals = await _live_dashboard_totals(db, user_id)
+        return totals
+
+
 @router.get("/dashboard")
-def get_user_dashboard(
-    db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user)
+async def get_user_dashboard(
+    current_user: Row = Depends(get_current_user)
 ):
     """
     Complete dashboard with all progress metrics
+
+    Served from a short-lived per-user cache that the writing routes clear
+    (per worker, so another worker's writes can take up to
+    DASHBOARD_CACHE_TTL_SECONDS to show).
+    as_of is when the path and session counts were aggregated (see
+    mv_user_dashboard_rollup); content totals are always current.
+    The six reads behind it run concurrently, each on its own connection,
+    within the process-wide DASHBOARD_MAX_CONCURRENT_READS limit.
     """
-    # Get all track selections
-    track_selections = db.query(models.UserTrackSelection).filter(
-        models.UserTrackSelection.user_id == current_user.user_id
-    ).all()
-    
-    # Get assessment stats
-    total_assessments = db.query(models.AssessmentSession).filter(
-        models.AssessmentSession.user_id == current_user.user_id,
-        models.AssessmentSession.status == "completed"
-    ).count()
+    cached = get_user_view(current_user.user_id, "dashboard")
+    if cached is not None:
+        return cached
     
-    # Get latest assessment result
-    latest_assessment = db.query(models.AssessmentSession).filter(
-        models.AssessmentSession.user_id == current_user.user_id,
-        models.AssessmentSession.status == "completed"
-    ).order_by(models.AssessmentSession.started_at.desc()).first()
+    params = {"user_id": current_user.user_id}
+    (
+        track_selections, totals, learning, latest_assessment, latest_evaluation_row, skill_profile
+    ) = await asyncio.gather(
+        _read_rows(_DASHBOARD_TRACKS_STMT, params),
+        _dashboard_totals(current_user.user_id),
+        _learning_summary(current_user.user_id),
+        _read_first(_LATEST_ASSESSMENT_STMT, params),
+        _read_first(_LATEST_EVALUATION_STMT, params),
+        _read_first(_DASHBOARD_SKILL_PROFILE_STMT, params),
+    )
     
     latest_result = None
-    if latest_assessment:
-        result = db.query(models.AssessmentResult).filter(
-            models.AssessmentResult.session_id == latest_assessment.session_id
-        ).first()
-        if result:
-            latest_result = {
-                "score": float(result.overall_score),
-                "level": result.detected_level,
-                "date": latest_assessment.started_at
-            }
-    
-    # Get learning paths
-    learning_paths = db.query(models.LearningPath).filter(
-        models.LearningPath.user_id == current_user.user_id
-    ).all()
-    
-    # Calculate total content completion
-    total_content_items = 0
-    completed_content_items = 0
-    total_learning_time = 0
-    
-    for path in learning_paths:
-        stages = db.query(models.LearningPathStage).filter(
-            models.LearningPathStage.path_id == path.path_id
-        ).all()
-        
-        for stage in stages:
-            content_items = db.query(models.StageContent).filter(
-                models.StageContent.stage_id == stage.stage_id
-            ).all()
-            
-            total_content_items += len(content_items)
-            
-            for content in content_items:
-                progress = db.query(models.UserContentProgress).filter(
-                    models.UserContentProgress.user_id == current_user.user_id,
-                    models.UserContentProgress.content_id == content.content_id
-                ).first()
-                
-                if progress:
-                    if progress.is_completed:
-                        completed_content_items += 1
-                    total_learning_time += progress.time_spent_minutes
-    
-    # Get evaluation stats
-    total_evaluations = db.query(models.EvaluationSession).filter(
-        models.EvaluationSession.user_id == current_user.user_id,
-        models.EvaluationSession.status == "completed"
-    ).count()
-    
-    # Get latest evaluation
-    latest_evaluation_session = db.query(models.EvaluationSession).filter(
-        models.EvaluationSession.user_id == current_user.user_id,
-        models.EvaluationSession.status == "completed"
-    ).order_by(models.EvaluationSession.started_at.desc()).first()
+    if latest_assessment and latest_assessment.result_id is not None:
+        latest_result = {
+            "score": float(latest_assessment.overall_score),
+            "level": latest_assessment.detected_level,
+            "date": latest_assessment.started_at
+        }
     
     latest_evaluation = None
-    if latest_evaluation_session:
-        eval_result = db.query(models.EvaluationResult).filter(
-            models.EvaluationResult.evaluation_id == latest_evaluation_session.evaluation_id
-        ).first()
-        if eval_result:
-            latest_evaluation = {
-                "reasoning_score": float(eval_result.reasoning_score),
-                "problem_solving": float(eval_result.problem_solving),
-                "readiness_level": eval_result.readiness_level,
-                "date": latest_evaluation_session.started_at
-            }
-    
-    # Get skill profile
-    skill_profile = db.query(models.SkillProfile).filter(
-        models.SkillProfile.user_id == current_user.user_id
-    ).first()
+    if latest_evaluation_row and latest_evaluation_row.result_id is not None:
+        latest_evaluation = {
+            "reasoning_score": float(latest_evaluation_row.reasoning_score),
+            "problem_solving": float(latest_evaluation_row.problem_solving),
+            "readiness_level": latest_evaluation_row.readiness_level,
+            "date": latest_evaluation_row.started_at
+        }
     
-    return {
+    return remember_user_view(current_user.user_id, "dashboard", payload={
+        "as_of": totals.refreshed_at,
         "user": {
             "user_id": current_user.user_id,
             "full_name": current_user.full_name,
@@ -935,29 +1014,25 @@ def get_user_dashboard(
         },
         "tracks": {
             "total_selected": len(track_selections),
-            "tracks": [{"track_id": ts.track_id, "selected_at": ts.selected_at} for ts in track_selections]
+            "tracks": [ts._asdict() for ts in track_selections]
         },
         "assessments": {
-            "total_completed": total_assessments,
+            "total_completed": totals.completed_assessments,
             "latest_result": latest_result
         },
         "learning": {
-            "total_learning_paths": len(learning_paths),
-            "total_content_items": total_content_items,
-            "completed_items": completed_content_items,
-            "completion_percentage": int((completed_content_items / total_content_items * 100)) if total_content_items > 0 else 0,
-            "total_time_hours": round(total_learning_time / 60, 2)
+            "total_learning_paths": totals.total_paths,
+            "total_content_items": learning.total_content_items,
+            "completed_items": learning.completed_items,
+            "completion_percentage": learning.completion_percentage,
+            "total_time_hours": round(learning.total_time_minutes / 60, 2)
         },
         "evaluations": {
-            "total_completed": total_evaluations,
+            "total_completed": totals.completed_evaluations,
             "latest_result": latest_evaluation
         },
-        "skill_profile": {
-            "strengths": skill_profile.strengths if skill_profile else "",
-            "weaknesses": skill_profile.weaknesses if skill_profile else "",
-            "thinking_pattern": skill_profile.thinking_pattern if skill_profile else ""
-        } if skill_profile else None
-    }
+        "skill_profile": skill_profile._asdict() if skill_profile else None
+    })
 
 
 # ============================================================================
@@ -965,91 +1040,84 @@ def get_user_dashboard(
 # ============================================================================
 
 @router.get("/analytics/timeline")
-def get_timeline_analytics(
+async def get_timeline_analytics(
     days: int = 30,
-    db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Row = Depends(get_current_user)
 ):
     """
     Get timeline of learning activity
     """
+    cached = get_user_view(current_user.user_id, "timeline", days)
+    if cached is not None:
+        return cached
+    
     start_date = datetime.utcnow() - timedelta(days=days)
     
-    # Get content completion timeline
-    content_progress = db.query(models.UserContentProgress).filter(
+    # The three event kinds share one (type, date, details) shape, so the
+    # database merges and orders them and each row is already an event
+    content_events = select(
+        literal("content_progress").label("type"),
+        models.UserContentProgress.started_at.label("date"),
+        func.jsonb_build_object(
+            "content_id", models.UserContentProgress.content_id,
+            "completed", models.UserContentProgress.is_completed,
+            "time_spent", models.UserContentProgress.time_spent_minutes,
+            type_=JSONB
+        ).label("details"),
+    ).where(
         models.UserContentProgress.user_id == current_user.user_id,
         models.UserContentProgress.started_at >= start_date
-    ).order_by(models.UserContentProgress.started_at.asc()).all()
-    
-    # Get assessment timeline
-    assessments = db.query(models.AssessmentSession).filter(
+    )
+    assessment_events = select(
+        literal("assessment").label("type"),
+        models.AssessmentSession.started_at.label("date"),
+        func.jsonb_build_object(
+            "session_id", models.AssessmentSession.session_id,
+            "track_id", models.AssessmentSession.track_id,
+            "score", models.AssessmentResult.overall_score,
+            "level", models.AssessmentResult.detected_level,
+            type_=JSONB
+        ).label("details"),
+    ).outerjoin(
+        models.AssessmentResult,
+        models.AssessmentResult.session_id == models.AssessmentSession.session_id
+    ).where(
         models.AssessmentSession.user_id == current_user.user_id,
         models.AssessmentSession.started_at >= start_date
-    ).order_by(models.AssessmentSession.started_at.asc()).all()
-    
-    # Get evaluation timeline
-    evaluations = db.query(models.EvaluationSession).filter(
+    )
+    evaluation_events = select(
+        literal("evaluation").label("type"),
+        models.EvaluationSession.started_at.label("date"),
+        func.jsonb_build_object(
+            "evaluation_id", models.EvaluationSession.evaluation_id,
+            "reasoning_score", models.EvaluationResult.reasoning_score,
+            "readiness_level", models.EvaluationResult.readiness_level,
+            type_=JSONB
+        ).label("details"),
+    ).outerjoin(
+        models.EvaluationResult,
+        models.EvaluationResult.evaluation_id == models.EvaluationSession.evaluation_id
+    ).where(
         models.EvaluationSession.user_id == current_user.user_id,
         models.EvaluationSession.started_at >= start_date
-    ).order_by(models.EvaluationSession.started_at.asc()).all()
-    
-    timeline = []
-    
-    # Add content events
-    for progress in content_progress:
-        timeline.append({
-            "type": "content_progress",
-            "date": progress.started_at,
-            "details": {
-                "content_id": progress.content_id,
-                "completed": progress.is_completed,
-                "time_spent": progress.time_spent_minutes
-            }
-        })
-    
-    # Add assessment events
-    for assessment in assessments:
-        result = db.query(models.AssessmentResult).filter(
-            models.AssessmentResult.session_id == assessment.session_id
-        ).first()
-        
-        timeline.append({
-            "type": "assessment",
-            "date": assessment.started_at,
-            "details": {
-                "session_id": assessment.session_id,
-                "track_id": assessment.track_id,
-                "score": float(result.overall_score) if result else None,
-                "level": result.detected_level if result else None
-            }
-        })
-    
-    # Add evaluation events
-    for evaluation in evaluations:
-        eval_result = db.query(models.EvaluationResult).filter(
-            models.EvaluationResult.evaluation_id == evaluation.evaluation_id
-        ).first()
-        
-        timeline.append({
-            "type": "evaluation",
-            "date": evaluation.started_at,
-            "details": {
-                "evaluation_id": evaluation.evaluation_id,
-                "reasoning_score": float(eval_result.reasoning_score) if eval_result else None,
-                "readiness_level": eval_result.readiness_level if eval_result else None
-            }
-        })
+    )
+    events = union_all(content_events, assessment_events, evaluation_events).subquery()
     
-    # Sort by date
-    timeline.sort(key=lambda x: x['date'])
+    timeline = [
+        dict(event)
+        for event in (await db.execute(
+            select(events).order_by(events.c.date, events.c.type)
+        )).mappings()
+    ]
     
-    return {
+    return remember_user_view(current_user.user_id, "timeline", days, payload={
         "period_days": days,
         "start_date": start_date,
         "end_date": datetime.utcnow(),
         "total_events": len(timeline),
         "timeline": timeline
-    }
+    })
 
 
 
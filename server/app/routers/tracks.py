@@ -2,12 +2,21 @@
 Tracks router - handles learning track management and user selections
 """
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+from sqlalchemy import Row
 from sqlalchemy.orm import Session
 from typing import List
 
 from app.database import SessionLocal, get_db
 from app import models, schemas
 from app.auth_middleware import get_current_user, get_admin_user
+from app.services.dashboard_cache import invalidate_user_views
+from app.services.stage_progress import refresh_user_summary
+from app.services.track_cache import (
+    get_cached_track,
+    get_cached_track_list,
+    invalidate_track,
+    invalidate_track_list,
+)
 from app.ai_services.assessment_dimensions_generator import (
     generate_assessment_dimensions,
     _make_code,
@@ -67,7 +76,7 @@ async def create_track(
     track_data: schemas.TrackCreate,
     background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
-    admin_user: models.User = Depends(get_admin_user),
+    admin_user: Row = Depends(get_admin_user),
 ):
     """
     Create a new learning track (Admin only).
@@ -90,6 +99,7 @@ async def create_track(
     db.add(new_track)
     db.commit()
     db.refresh(new_track)
+    invalidate_track_list()
 
     # Fire-and-forget: generate + store dimensions without blocking the caller
     background_tasks.add_task(
@@ -108,10 +118,9 @@ def get_all_tracks(
     limit: int = 100
 ):
     """
-    Get all available learning tracks
+    Get all available learning tracks (cached; track writes clear it)
     """
-    tracks = db.query(models.Track).offset(skip).limit(limit).all()
-    return tracks
+    return get_cached_track_list(db, skip, limit)
 
 
 # ============================================================================
@@ -128,14 +137,16 @@ def create_track_dimension(
     track_id: int,
     dimension_data: schemas.AssessmentDimensionCreate,
     db: Session = Depends(get_db),
-    admin_user: models.User = Depends(get_admin_user),
+    admin_user: Row = Depends(get_admin_user),
 ):
     """
     Create a new assessment dimension for a specific track (Admin only).
     Dimensions model different perspectives such as theory, problem solving,
     practical skills, communication, etc.
     """
-    track = db.query(models.Track).filter(models.Track.track_id == track_id).first()
+    # Not the cache: it is per worker and may still hold a track deleted
+    # elsewhere, which would fail the insert below on its foreign key
+    track = db.get(models.Track, track_id)
     if not track:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -174,7 +185,7 @@ def get_track_dimensions(
     """
     Get all assessment dimensions configured for a track.
     """
-    track = db.query(models.Track).filter(models.Track.track_id == track_id).first()
+    track = db.get(models.Track, track_id)
     if not track:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -195,7 +206,7 @@ def update_track_dimension(
     dimension_id: int,
     dimension_data: schemas.AssessmentDimensionCreate,
     db: Session = Depends(get_db),
-    admin_user: models.User = Depends(get_admin_user),
+    admin_user: Row = Depends(get_admin_user),
 ):
     """
     Update an existing assessment dimension for a track (Admin only).
@@ -236,7 +247,7 @@ def update_track_dimension(
 def delete_track_dimension(
     dimension_id: int,
     db: Session = Depends(get_db),
-    admin_user: models.User = Depends(get_admin_user),
+    admin_user: Row = Depends(get_admin_user),
 ):
     """
     Delete an assessment dimension from a track (Admin only).
@@ -263,15 +274,13 @@ def delete_track_dimension(
 def select_track(
     selection_data: schemas.UserTrackSelectionCreate,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user)
+    current_user: Row = Depends(get_current_user)
 ):
     """
     User selects a learning track
     """
-    # Verify track exists
-    track = db.query(models.Track).filter(
-        models.Track.track_id == selection_data.track_id
-    ).first()
+    # Verify track exists (uncached, since the selection references it)
+    track = db.get(models.Track, selection_data.track_id)
     
     if not track:
         raise HTTPException(
@@ -299,6 +308,7 @@ def select_track(
     db.add(new_selection)
     db.commit()
     db.refresh(new_selection)
+    invalidate_user_views(current_user.user_id)
     
     return new_selection
 
@@ -306,7 +316,7 @@ def select_track(
 @router.get("/my-selections", response_model=List[schemas.UserTrackSelectionResponse])
 def get_my_track_selections(
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user)
+    current_user: Row = Depends(get_current_user)
 ):
     """
     Get current user's track selections
@@ -320,7 +330,7 @@ def get_my_track_selections(
 @router.get("/my-current-track", response_model=schemas.TrackResponse)
 def get_my_current_track(
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user)
+    current_user: Row = Depends(get_current_user)
 ):
     """
     Get user's most recently selected track
@@ -350,7 +360,7 @@ def get_track(
     """
     Get a specific track by ID
     """
-    track = db.query(models.Track).filter(models.Track.track_id == track_id).first()
+    track = get_cached_track(db, track_id)
     if not track:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -364,7 +374,7 @@ def update_track(
     track_id: int,
     track_data: schemas.TrackCreate,
     db: Session = Depends(get_db),
-    admin_user: models.User = Depends(get_admin_user)
+    admin_user: Row = Depends(get_admin_user)
 ):
     """
     Update a track (Admin only)
@@ -381,6 +391,7 @@ def update_track(
     
     db.commit()
     db.refresh(track)
+    invalidate_track(track_id)
     return track
 
 
@@ -388,7 +399,7 @@ def update_track(
 def delete_track(
     track_id: int,
     db: Session = Depends(get_db),
-    admin_user: models.User = Depends(get_admin_user)
+    admin_user: Row = Depends(get_admin_user)
 ):
     """
     Delete a track (Admin only)
@@ -400,7 +411,23 @@ def delete_track(
             detail="Track not found"
         )
     
+    # Users whose learning paths go with the track's assessment sessions
+    affected_user_ids = [
+        user_id for (user_id,) in db.query(models.LearningPath.user_id).distinct().join(
+            models.AssessmentResult,
+            models.AssessmentResult.result_id == models.LearningPath.result_id
+        ).join(
+            models.AssessmentSession,
+            models.AssessmentSession.session_id == models.AssessmentResult.session_id
+        ).filter(models.AssessmentSession.track_id == track_id)
+    ]
+    
     db.delete(track)
+    for user_id in affected_user_ids:
+        refresh_user_summary(db, user_id)
     db.commit()
+    invalidate_track(track_id)
+    for user_id in affected_user_ids:
+        invalidate_user_views(user_id)
     return None
 
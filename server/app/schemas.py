@@ -1,7 +1,7 @@
 """
 Pydantic schemas for request/response validation
 """
-from pydantic import BaseModel, EmailStr, Field, validator
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, validator
 from typing import Optional, List, Literal
 from datetime import datetime
 from decimal import Decimal
@@ -32,8 +32,7 @@ class UserResponse(UserBase):
     role: Literal["user", "admin"]
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class Token(BaseModel):
@@ -66,8 +65,7 @@ class UserSessionResponse(BaseModel):
     expires_at: datetime
     last_activity: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ============================================================================
@@ -95,8 +93,7 @@ class PasswordResetTokenResponse(BaseModel):
     created_at: datetime
     expires_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ============================================================================
@@ -130,8 +127,7 @@ class TrackCreate(TrackBase):
 class TrackResponse(TrackBase):
     track_id: int
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UserTrackSelectionCreate(BaseModel):
@@ -145,8 +141,7 @@ class UserTrackSelectionResponse(BaseModel):
     selected_at: datetime
     track: TrackResponse
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ============================================================================
@@ -168,8 +163,7 @@ class AssessmentQuestionResponse(BaseModel):
     question_type: str
     difficulty: str
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class AssessmentSessionCreate(BaseModel):
@@ -184,8 +178,7 @@ class AssessmentSessionResponse(BaseModel):
     started_at: datetime
     completed_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class AssessmentAnswerSubmit(BaseModel):
@@ -203,8 +196,7 @@ class AssessmentResponseResponse(BaseModel):
     criteria_scores: Optional[dict] = None
     submitted_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
     @validator("criteria_scores", pre=True, always=True)
     @classmethod
@@ -226,8 +218,7 @@ class AssessmentDimensionResultResponse(BaseModel):
     weighted_contribution: Decimal
     questions_evaluated: int
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class AssessmentResultResponse(BaseModel):
@@ -243,8 +234,7 @@ class AssessmentResultResponse(BaseModel):
     # Evaluated responses (scores populated after batch evaluation at completion)
     evaluated_responses: Optional[List[AssessmentResponseResponse]] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
     @validator("comprehensive_report", pre=True, always=True)
     @classmethod
@@ -277,8 +267,18 @@ class AssessmentDimensionResponse(AssessmentDimensionBase):
     track_id: int
     code: str
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+class AssessmentHistoryItem(BaseModel):
+    session_id: int
+    track_id: int
+    track_name: str
+    attempt_date: Optional[datetime] = None
+    completed_date: Optional[datetime] = None
+    score: float
+    detected_level: str
+    ai_reasoning: Optional[str] = None
 
 
 # ============================================================================
@@ -298,8 +298,7 @@ class SkillProfileResponse(BaseModel):
     weaknesses: str
     thinking_pattern: str
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ============================================================================
@@ -319,8 +318,7 @@ class LearningPathStageResponse(BaseModel):
     stage_order: int
     focus_area: str
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class LearningPathCreate(BaseModel):
@@ -334,8 +332,7 @@ class LearningPathResponse(BaseModel):
     created_at: datetime
     stages: List[LearningPathStageResponse] = []
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ============================================================================
@@ -370,8 +367,7 @@ class StageContentResponse(BaseModel):
     tags: Optional[str] = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class StageContentWithProgress(StageContentResponse):
@@ -414,8 +410,7 @@ class UserContentProgressResponse(BaseModel):
     completed_at: Optional[datetime] = None
     notes: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class StageProgressSummary(BaseModel):
@@ -446,8 +441,7 @@ class KnowledgeBaseResponse(BaseModel):
     content: str
     source: str
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ============================================================================
@@ -464,8 +458,7 @@ class ChatSessionResponse(BaseModel):
     stage_id: int
     started_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ChatMessageCreate(BaseModel):
@@ -479,8 +472,7 @@ class ChatMessageResponse(BaseModel):
     message_text: str
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ============================================================================
@@ -499,8 +491,7 @@ class EvaluationSessionResponse(BaseModel):
     started_at: datetime
     completed_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class EvaluationDialogueCreate(BaseModel):
@@ -514,8 +505,7 @@ class EvaluationDialogueResponse(BaseModel):
     message_text: str
     sequence_no: int
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class EvaluationResultResponse(BaseModel):
@@ -526,8 +516,7 @@ class EvaluationResultResponse(BaseModel):
     final_feedback: str
     readiness_level: str
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ============================================================================
@@ -542,8 +531,7 @@ class PathCompletionReportResponse(BaseModel):
     full_context: dict
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PathCompletionReportCreateResponse(BaseModel):
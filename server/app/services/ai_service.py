@@ -3,16 +3,24 @@ AI Service for assessment, profiling, and evaluation
 This can integrate with OpenAI, Anthropic, or custom AI models
 """
 import os
-from typing import List, Dict, Tuple
+from typing import AsyncIterator, List, Dict, Tuple
 import random
 import json
 from dotenv import load_dotenv
 
+from app.cache import TTLCache
+
 load_dotenv()
 
 # Toggle between mock and real AI
 USE_MOCK_AI = os.getenv("USE_MOCK_AI", "true").lower() == "true"
 
+# Mentor answers from the RAG service, keyed by (category, normalised question).
+# The RAG call sees only those two inputs, so the same question on the same
+# track gets the same answer for every user. Set to 0 to disable.
+MENTOR_CACHE_TTL_SECONDS = int(os.getenv("MENTOR_CACHE_TTL_SECONDS", "1800"))
+_mentor_cache = TTLCache(ttl_seconds=MENTOR_CACHE_TTL_SECONDS, max_size=10_000)
+
 
 class AIService:
     """
@@ -258,8 +266,13 @@ This evaluation considers:
         category = track_name_to_rag_category(track_name)
         _log.info("Mentor: track_name=%r -> RAG category=%r (user's chosen track)", track_name, category)
         if category:
+            cache_key = (category, " ".join(user_message.lower().split()))
+            answer = _mentor_cache.get(cache_key)
+            if answer:
+                return answer
             answer = await chat_by_category(category=category, query=user_message)
             if answer:
+                _mentor_cache.set(cache_key, answer)
                 return answer
             # RAG returned 404 or failed → no documents for this category. Tell user.
             return (
@@ -272,6 +285,26 @@ This evaluation considers:
 
         return self._mock_mentor_response(user_message, stage_context)
     
+    async def stream_mentor_response(
+        self,
+        user_message: str,
+        stage_context: str,
+        track_name: str,
+        chat_history: List[Dict] = None
+    ) -> AsyncIterator[str]:
+        """
+        Yield the mentor response in chunks as they become available.
+        The RAG API answers in one piece, so this currently yields a single
+        chunk; the streaming route doesn't change if a token-streaming
+        backend is added here.
+        """
+        yield await self.get_mentor_response(
+            user_message=user_message,
+            stage_context=stage_context,
+            track_name=track_name,
+            chat_history=chat_history,
+        )
+    
     def _mock_mentor_response(self, user_message: str, stage_context: str) -> str:
         """Mock mentor response"""
         responses = [
@@ -0,0 +1,36 @@
+"""
+Per-user cache for the dashboard and timeline views
+
+Both views aggregate across most of a user's tables, yet change only when
+that user does something. Entries are keyed (user_id, view, *args) and the
+routes that write progress, selections, assessments, evaluations or the
+profile drop all of a user's entries with invalidate_user_views.
+
+The cache and its invalidation are local to the worker process. A write
+handled by one worker does not clear the others, so with several workers a
+view may lag a write by up to DASHBOARD_CACHE_TTL_SECONDS; set it to 0 to
+turn the cache off where that is not acceptable.
+"""
+import os
+from typing import Any, Hashable
+
+from app.cache import TTLCache
+
+DASHBOARD_CACHE_TTL_SECONDS = int(os.getenv("DASHBOARD_CACHE_TTL_SECONDS", "60"))
+_view_cache = TTLCache(ttl_seconds=DASHBOARD_CACHE_TTL_SECONDS, max_size=10_000)
+
+
+def get_user_view(user_id: int, view: str, *args: Hashable) -> Any:
+    """Return a cached view payload, or None on miss"""
+    return _view_cache.get((user_id, view, *args))
+
+
+def remember_user_view(user_id: int, view: str, *args: Hashable, payload: Any) -> Any:
+    """Cache a view payload and return it"""
+    _view_cache.set((user_id, view, *args), payload)
+    return payload
+
+
+def invalidate_user_views(user_id: int) -> None:
+    """Drop every cached view of a user in this process. Call after writing their data."""
+    _view_cache.invalidate(lambda key: key[0] == user_id)
@@ -0,0 +1,94 @@
+"""
+Pre-aggregated dashboard totals
+
+mv_user_dashboard_rollup (created by the schema patches in app.main) holds
+per-user path and completed-session counts; content totals are kept current
+in user_progress_summary instead (see app.services.stage_progress). The
+server refreshes the view every DASHBOARD_ROLLUP_REFRESH_SECONDS; the
+dashboard reads a user's row and falls back to the live aggregate when the
+row is missing or the database shows a write for the user since the last
+refresh.
+"""
+import asyncio
+import logging
+import os
+from typing import Optional
+
+from sqlalchemy import Row, bindparam, column, exists, func, or_, select, table, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import models
+from app.database import AsyncSessionLocal
+
+log = logging.getLogger(__name__)
+
+# 0 disables the background refresh
+DASHBOARD_ROLLUP_REFRESH_SECONDS = int(os.getenv("DASHBOARD_ROLLUP_REFRESH_SECONDS", "300"))
+
+mv_user_dashboard_rollup = table(
+    "mv_user_dashboard_rollup",
+    column("user_id"),
+    column("total_paths"),
+    column("completed_assessments"),
+    column("completed_evaluations"),
+    column("refreshed_at"),
+)
+
+_rollup = mv_user_dashboard_rollup.c
+# refreshed_at is timestamptz; completed_at holds naive UTC (datetime.utcnow)
+# while created_at holds the server's local time, like refreshed_at's cast
+_WRITTEN_SINCE_REFRESH = or_(
+    exists().where(
+        models.LearningPath.user_id == _rollup.user_id,
+        models.LearningPath.created_at > _rollup.refreshed_at
+    ),
+    exists().where(
+        models.AssessmentSession.user_id == _rollup.user_id,
+        models.AssessmentSession.completed_at > func.timezone("UTC", _rollup.refreshed_at)
+    ),
+    exists().where(
+        models.EvaluationSession.user_id == _rollup.user_id,
+        models.EvaluationSession.completed_at > func.timezone("UTC", _rollup.refreshed_at)
+    ),
+)
+_USER_ROLLUP_STMT = select(
+    mv_user_dashboard_rollup,
+    _WRITTEN_SINCE_REFRESH.label("written_since_refresh"),
+).where(_rollup.user_id == bindparam("user_id"))
+
+# Every worker runs the refresher; the advisory lock lets one refresh at a
+# time, and a refresh another worker made recently is not repeated
+_TRY_REFRESH_LOCK_SQL = text("SELECT pg_try_advisory_xact_lock(hashtext('mv_user_dashboard_rollup'))")
+_LAST_REFRESH_AGE_SQL = text(
+    "SELECT EXTRACT(EPOCH FROM now() - refreshed_at) FROM mv_user_dashboard_rollup LIMIT 1"
+)
+_REFRESH_ROLLUP_SQL = text("REFRESH MATERIALIZED VIEW CONCURRENTLY mv_user_dashboard_rollup")
+
+
+async def get_user_rollup(db: AsyncSession, user_id: int) -> Optional[Row]:
+    """
+    Return the user's rollup row, or None if they joined after the last
+    refresh. written_since_refresh is true when a path was created or a
+    session completed after the row was computed.
+    """
+    return (await db.execute(_USER_ROLLUP_STMT, {"user_id": user_id})).first()
+
+
+async def refresh_dashboard_rollup() -> None:
+    """Recompute the rollup without blocking readers, unless another worker just did"""
+    async with AsyncSessionLocal() as db:
+        if await db.scalar(_TRY_REFRESH_LOCK_SQL):
+            age = await db.scalar(_LAST_REFRESH_AGE_SQL)
+            if age is None or age >= DASHBOARD_ROLLUP_REFRESH_SECONDS / 2:
+                await db.execute(_REFRESH_ROLLUP_SQL)
+        await db.commit()
+
+
+async def run_rollup_refresher() -> None:
+    """Refresh the rollup forever; started as a task on app startup"""
+    while True:
+        await asyncio.sleep(DASHBOARD_ROLLUP_REFRESH_SECONDS)
+        try:
+            await refresh_dashboard_rollup()
+        except Exception as exc:
+            log.warning("Dashboard rollup refresh failed: %s", exc)
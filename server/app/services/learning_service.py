@@ -5,6 +5,7 @@ from sqlalchemy.orm import Session
 from typing import List, Optional
 from app import models
 from app.services.ai_service import ai_service
+from app.services.stage_progress import refresh_user_summary
 
 
 class LearningService:
@@ -82,6 +83,7 @@ class LearningService:
                     )
                     db.add(content)
         
+        refresh_user_summary(db, user_id)
         db.commit()
         db.refresh(learning_path)
         return learning_path
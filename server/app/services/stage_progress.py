@@ -0,0 +1,177 @@
+"""
+Per-user stage progress summary
+
+learning_path_stage_progress holds, for each (user, stage), the stage's
+content count plus the user's completed items and minutes spent. Progress
+writers rebuild the affected row in the same transaction; readers fill in
+rows for stages the user has not touched yet with ensure_path_progress.
+user_progress_summary holds the same totals across all of a user's paths;
+it is rebuilt alongside, and after path and content writes with
+refresh_user_summary. Reports that need the items themselves walk
+load_path_stages instead.
+"""
+from typing import List
+
+from sqlalchemy import Integer, and_, exists, func, literal, select, text, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload
+
+from app import models
+
+# Per-user transaction lock taken before a rebuild: two writers that each
+# aggregate without the other's uncommitted write would otherwise leave the
+# later upsert short. Aggregates run after the lock see the other's commit.
+_LOCK_USER_PROGRESS_SQL = text("SELECT pg_advisory_xact_lock(hashtext('user_progress'), :user_id)")
+_SUMMARY_COLUMNS = ("user_id", "stage_id", "total_content", "completed_content", "time_spent_minutes")
+_USER_SUMMARY_COLUMNS = ("user_id", "total_content_items", "completed_items", "total_time_minutes")
+
+
+def _lock_user_progress(db: Session, user_id: int) -> None:
+    """Serialize this user's summary rebuilds until the transaction ends"""
+    db.execute(_LOCK_USER_PROGRESS_SQL, {"user_id": user_id})
+
+
+def _stage_totals(user_id: int, *criteria):
+    """Aggregate (user, stage, totals) rows for the stages matching criteria"""
+    return select(
+        literal(user_id, Integer),
+        models.LearningPathStage.stage_id,
+        func.count(models.StageContent.content_id),
+        func.count(models.UserContentProgress.progress_id).filter(
+            models.UserContentProgress.is_completed == True
+        ),
+        func.coalesce(func.sum(models.UserContentProgress.time_spent_minutes), 0),
+    ).outerjoin(
+        models.StageContent,
+        models.StageContent.stage_id == models.LearningPathStage.stage_id
+    ).outerjoin(
+        models.UserContentProgress,
+        and_(
+            models.UserContentProgress.content_id == models.StageContent.content_id,
+            models.UserContentProgress.user_id == user_id
+        )
+    ).where(*criteria).group_by(models.LearningPathStage.stage_id)
+
+
+def _upsert(totals):
+    stmt = pg_insert(models.LearningPathStageProgress).from_select(_SUMMARY_COLUMNS, totals)
+    return stmt.on_conflict_do_update(
+        index_elements=["user_id", "stage_id"],
+        set_={
+            "total_content": stmt.excluded.total_content,
+            "completed_content": stmt.excluded.completed_content,
+            "time_spent_minutes": stmt.excluded.time_spent_minutes,
+            "updated_at": func.current_timestamp(),
+        }
+    )
+
+
+def _user_totals(user_id: int):
+    """Aggregate (user, totals) row over every path the user owns"""
+    return select(
+        literal(user_id, Integer),
+        func.count(models.StageContent.content_id),
+        func.count(models.UserContentProgress.progress_id).filter(
+            models.UserContentProgress.is_completed == True
+        ),
+        func.coalesce(func.sum(models.UserContentProgress.time_spent_minutes), 0),
+    ).select_from(models.LearningPath).join(
+        models.LearningPathStage,
+        models.LearningPathStage.path_id == models.LearningPath.path_id
+    ).join(
+        models.StageContent,
+        models.StageContent.stage_id == models.LearningPathStage.stage_id
+    ).outerjoin(
+        models.UserContentProgress,
+        and_(
+            models.UserContentProgress.content_id == models.StageContent.content_id,
+            models.UserContentProgress.user_id == user_id
+        )
+    ).where(models.LearningPath.user_id == user_id)
+
+
+def _user_summary_insert(user_id: int):
+    return pg_insert(models.UserProgressSummary).from_select(_USER_SUMMARY_COLUMNS, _user_totals(user_id))
+
+
+def refresh_user_summary(db: Session, user_id: int) -> None:
+    """Rebuild the user's summary row. Call after creating paths or adding content to them."""
+    stmt = _user_summary_insert(user_id)
+    # Pending paths/content must be visible to the aggregate
+    db.flush()
+    _lock_user_progress(db, user_id)
+    db.execute(stmt.on_conflict_do_update(
+        index_elements=["user_id"],
+        set_={
+            "total_content_items": stmt.excluded.total_content_items,
+            "completed_items": stmt.excluded.completed_items,
+            "total_time_minutes": stmt.excluded.total_time_minutes,
+            "updated_at": func.current_timestamp(),
+        }
+    ))
+
+
+def refresh_content_progress(db: Session, user_id: int, content_id: int) -> None:
+    """
+    Rebuild the user's row for the stage holding content_id, and their
+    summary row. Call after any progress write.
+    """
+    stage_id = select(models.StageContent.stage_id).where(
+        models.StageContent.content_id == content_id
+    ).scalar_subquery()
+    _lock_user_progress(db, user_id)
+    db.execute(_upsert(_stage_totals(user_id, models.LearningPathStage.stage_id == stage_id)))
+    refresh_user_summary(db, user_id)
+
+
+def refresh_stage_content_total(db: Session, stage_id: int) -> None:
+    """Recount a stage's content for every user row. Call after adding content to a stage."""
+    db.execute(
+        update(models.LearningPathStageProgress)
+        .where(models.LearningPathStageProgress.stage_id == stage_id)
+        .values(
+            total_content=select(func.count(models.StageContent.content_id))
+            .where(models.StageContent.stage_id == stage_id)
+            .scalar_subquery(),
+            updated_at=func.current_timestamp(),
+        )
+    )
+
+
+async def ensure_path_progress(db: AsyncSession, user_id: int, path_id: int) -> None:
+    """Create the missing summary rows for a path's stages (existing rows are left alone)"""
+    missing = ~exists().where(
+        models.LearningPathStageProgress.user_id == user_id,
+        models.LearningPathStageProgress.stage_id == models.LearningPathStage.stage_id
+    )
+    await db.execute(
+        pg_insert(models.LearningPathStageProgress)
+        .from_select(_SUMMARY_COLUMNS, _stage_totals(user_id, models.LearningPathStage.path_id == path_id, missing))
+        .on_conflict_do_nothing(index_elements=["user_id", "stage_id"])
+    )
+
+
+async def ensure_user_summary(db: AsyncSession, user_id: int) -> None:
+    """Create the user's summary row if it is missing (an existing row is left alone)"""
+    await db.execute(_LOCK_USER_PROGRESS_SQL, {"user_id": user_id})
+    await db.execute(_user_summary_insert(user_id).on_conflict_do_nothing(index_elements=["user_id"]))
+
+
+def load_path_stages(db: Session, path_id: int, user_id: int) -> List[models.LearningPathStage]:
+    """
+    A path's stages in order with their content_items and, on each item,
+    only this user's user_progress row eager-loaded: three queries however
+    many stages and items the path has.
+    """
+    return db.scalars(
+        select(models.LearningPathStage)
+        .where(models.LearningPathStage.path_id == path_id)
+        .order_by(models.LearningPathStage.stage_order)
+        .options(
+            selectinload(models.LearningPathStage.content_items)
+            .selectinload(models.StageContent.user_progress.and_(
+                models.UserContentProgress.user_id == user_id
+            ))
+        )
+    ).all()
@@ -0,0 +1,71 @@
+"""
+Cached Track lookups
+
+Tracks are admin-curated and change rarely, but the chat, evaluation and
+content routes resolve one on nearly every request. Entries are plain
+TrackResponse snapshots (track_id, track_name, description), safe to share
+across requests and sessions. Pages of the public track list are cached the
+same way, for a shorter time since a new track should reach every worker.
+"""
+import os
+from typing import List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app import models, schemas
+from app.cache import TTLCache
+
+TRACK_CACHE_TTL_SECONDS = int(os.getenv("TRACK_CACHE_TTL_SECONDS", "3600"))
+_track_cache = TTLCache(ttl_seconds=TRACK_CACHE_TTL_SECONDS, max_size=1_000)
+TRACK_LIST_CACHE_TTL_SECONDS = int(os.getenv("TRACK_LIST_CACHE_TTL_SECONDS", "300"))
+_track_list_cache = TTLCache(ttl_seconds=TRACK_LIST_CACHE_TTL_SECONDS, max_size=100)
+
+
+def invalidate_track(track_id: int) -> None:
+    """Drop a track from the cache. Call after updating or deleting it."""
+    _track_cache.pop(track_id)
+    _track_list_cache.clear()
+
+
+def invalidate_track_list() -> None:
+    """Drop the cached track list pages. Call after creating a track."""
+    _track_list_cache.clear()
+
+
+def _remember(track: Optional[models.Track]) -> Optional[schemas.TrackResponse]:
+    if track is None:
+        return None
+    snapshot = schemas.TrackResponse.model_validate(track)
+    _track_cache.set(track.track_id, snapshot)
+    return snapshot
+
+
+def get_cached_track(db: Session, track_id: int) -> Optional[schemas.TrackResponse]:
+    """Return the track, from cache when possible (sync session)"""
+    cached = _track_cache.get(track_id)
+    if cached is not None:
+        return cached
+    return _remember(db.get(models.Track, track_id))
+
+
+async def get_cached_track_async(db: AsyncSession, track_id: int) -> Optional[schemas.TrackResponse]:
+    """Return the track, from cache when possible (async session)"""
+    cached = _track_cache.get(track_id)
+    if cached is not None:
+        return cached
+    return _remember(await db.get(models.Track, track_id))
+
+
+def get_cached_track_list(db: Session, skip: int, limit: int) -> List[schemas.TrackResponse]:
+    """Return one page of the track list, from cache when possible (sync session)"""
+    key = (skip, limit)
+    cached = _track_list_cache.get(key)
+    if cached is not None:
+        return cached
+    tracks = [
+        schemas.TrackResponse.model_validate(track)
+        for track in db.query(models.Track).offset(skip).limit(limit).all()
+    ]
+    _track_list_cache.set(key, tracks)
+    return tracks
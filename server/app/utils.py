@@ -7,23 +7,41 @@ from datetime import datetime, timedelta
 import os
 import secrets
 import hashlib
+import time
 from dotenv import load_dotenv
 
+from app.cache import TTLCache
+
 load_dotenv()
 
 # Password hashing
 # Note: bcrypt has a 72-byte limit; we disable truncate_error so very long
 # passwords are automatically truncated instead of raising an exception.
+# Each +1 round doubles hash time (12 is roughly 200ms, 10 roughly 50ms). The
+# cost is stored in each hash, so changing it only affects new passwords.
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+
 pwd_context = CryptContext(
     schemes=["bcrypt"],
     deprecated="auto",
+    bcrypt__rounds=BCRYPT_ROUNDS,
 )
 
 # JWT configuration
 SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key-change-in-production")
-ALGORITHM = os.getenv("ALGORITHM", "HS256")
+ALGORITHM = os.getenv("ALGORITHM", "HS256").strip().upper()
+
+# Tokens are signed with the shared SECRET_KEY, so only HMAC algorithms apply.
+# They are also far cheaper to verify on every request than RSA signatures.
+if ALGORITHM not in ("HS256", "HS384", "HS512"):
+    raise ValueError(f"Unsupported JWT ALGORITHM '{ALGORITHM}'; use HS256, HS384 or HS512")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
 
+# Verified access-token payloads keyed by a hash of the token, so repeat
+# requests with the same token skip signature verification. Entries are
+# dropped once the token's own "exp" has passed.
+_decoded_token_cache = TTLCache(ttl_seconds=ACCESS_TOKEN_EXPIRE_MINUTES * 60, max_size=20_000)
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a plain password against a hashed password"""
@@ -50,25 +68,34 @@ def create_access_token(data: dict, expires_delta: timedelta = None) -> str:
     else:
         expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     
-    to_encode.update({"exp": expire})
+    # jti makes every token unique, even for two logins in the same second
+    to_encode.update({"exp": expire, "jti": secrets.token_urlsafe(16)})
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
 
 def decode_access_token(token: str) -> dict:
-    """Decode and verify a JWT token"""
+    """Decode and verify a JWT token (cached until the token expires)"""
+    cache_key = hashlib.blake2s(token.encode(), digest_size=16).digest()
+    payload = _decoded_token_cache.get(cache_key)
+    if payload is not None:
+        return payload
+
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        return payload
     except JWTError:
         return None
 
+    if isinstance(payload.get("exp"), (int, float)):
+        _decoded_token_cache.set(cache_key, payload, ttl_seconds=payload["exp"] - time.time())
+    return payload
+
 
 def create_refresh_token(data: dict) -> str:
     """Create a JWT refresh token (longer expiration)"""
     to_encode = data.copy()
     expire = datetime.utcnow() + timedelta(days=7)  # Refresh token valid for 7 days
-    to_encode.update({"exp": expire, "type": "refresh"})
+    to_encode.update({"exp": expire, "type": "refresh", "jti": secrets.token_urlsafe(16)})
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
@@ -5,6 +5,7 @@
 -- ============================================================================
 
 -- Drop tables if they exist (in reverse dependency order)
+DROP MATERIALIZED VIEW IF EXISTS mv_user_dashboard_rollup;
 DROP TABLE IF EXISTS progress_analysis_reports CASCADE;
 DROP TABLE IF EXISTS path_completion_reports CASCADE;
 DROP TABLE IF EXISTS evaluation_results CASCADE;
@@ -13,6 +14,8 @@ DROP TABLE IF EXISTS evaluation_sessions CASCADE;
 DROP TABLE IF EXISTS chat_messages CASCADE;
 DROP TABLE IF EXISTS chat_sessions CASCADE;
 DROP TABLE IF EXISTS knowledge_base CASCADE;
+DROP TABLE IF EXISTS user_progress_summary CASCADE;
+DROP TABLE IF EXISTS learning_path_stage_progress CASCADE;
 DROP TABLE IF EXISTS user_content_progress CASCADE;
 DROP TABLE IF EXISTS stage_content CASCADE;
 DROP TABLE IF EXISTS learning_path_stages CASCADE;
@@ -67,6 +70,9 @@ CREATE INDEX idx_user_sessions_user ON user_sessions(user_id);
 CREATE INDEX idx_user_sessions_active ON user_sessions(is_active);
 CREATE INDEX idx_user_sessions_expires ON user_sessions(expires_at);
 CREATE INDEX idx_user_sessions_token ON user_sessions USING hash (access_token);
+CREATE INDEX idx_user_sessions_refresh_token ON user_sessions USING hash (refresh_token);
+CREATE INDEX idx_user_sessions_user_active ON user_sessions(user_id, is_active);
+CREATE INDEX idx_user_sessions_user_created ON user_sessions(user_id, created_at);
 
 CREATE TABLE password_reset_tokens (
     token_id SERIAL PRIMARY KEY,
@@ -115,6 +121,7 @@ CREATE TABLE user_track_selection (
 -- Index for faster user track lookups
 CREATE INDEX idx_user_track_selection_user ON user_track_selection(user_id);
 CREATE INDEX idx_user_track_selection_track ON user_track_selection(track_id);
+CREATE INDEX idx_user_track_selection_user_selected ON user_track_selection(user_id, selected_at);
 
 -- ============================================================================
 -- PHASE 3: RUNTIME ASSESSMENT ENGINE
@@ -124,13 +131,14 @@ CREATE TABLE assessment_sessions (
     session_id SERIAL PRIMARY KEY,
     user_id INTEGER NOT NULL REFERENCES users(user_id) ON DELETE CASCADE,
     track_id INTEGER NOT NULL REFERENCES tracks(track_id) ON DELETE CASCADE,
-    status VARCHAR(20) NOT NULL CHECK (status IN ('in_progress', 'completed')),
+    status VARCHAR(20) NOT NULL CHECK (status IN ('generating', 'in_progress', 'completed')),
     started_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     completed_at TIMESTAMP NULL
 );
 
 CREATE INDEX idx_assessment_sessions_user ON assessment_sessions(user_id);
 CREATE INDEX idx_assessment_sessions_status ON assessment_sessions(status);
+CREATE INDEX idx_assessment_sessions_user_status_started ON assessment_sessions(user_id, status, started_at);
 
 CREATE TABLE assessment_question_pool (
     question_id SERIAL PRIMARY KEY,
@@ -153,6 +161,7 @@ CREATE TABLE assessment_session_questions (
 
 CREATE INDEX idx_assessment_session_questions_session ON assessment_session_questions(session_id);
 CREATE INDEX idx_assessment_session_questions_question ON assessment_session_questions(question_id);
+CREATE UNIQUE INDEX idx_assessment_session_questions_session_question ON assessment_session_questions(session_id, question_id);
 
 CREATE TABLE assessment_responses (
     response_id SERIAL PRIMARY KEY,
@@ -223,6 +232,7 @@ CREATE TABLE learning_paths (
 
 CREATE INDEX idx_learning_paths_user ON learning_paths(user_id);
 CREATE INDEX idx_learning_paths_result ON learning_paths(result_id);
+CREATE INDEX idx_learning_paths_user_created ON learning_paths(user_id, created_at);
 
 CREATE TABLE learning_path_stages (
     stage_id SERIAL PRIMARY KEY,
@@ -278,6 +288,30 @@ CREATE TABLE user_content_progress (
 CREATE INDEX idx_user_content_progress_user ON user_content_progress(user_id);
 CREATE INDEX idx_user_content_progress_content ON user_content_progress(content_id);
 CREATE INDEX idx_user_content_progress_completed ON user_content_progress(user_id, is_completed);
+CREATE INDEX idx_user_content_progress_user_started ON user_content_progress(user_id, started_at);
+
+-- Per-user stage totals, maintained by the application on progress writes
+CREATE TABLE learning_path_stage_progress (
+    user_id INTEGER NOT NULL REFERENCES users(user_id) ON DELETE CASCADE,
+    stage_id INTEGER NOT NULL REFERENCES learning_path_stages(stage_id) ON DELETE CASCADE,
+    total_content INTEGER NOT NULL DEFAULT 0,
+    completed_content INTEGER NOT NULL DEFAULT 0,
+    time_spent_minutes INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (user_id, stage_id)
+);
+
+-- Per-user totals across all of a user's paths, maintained by the application
+CREATE TABLE user_progress_summary (
+    user_id INTEGER PRIMARY KEY REFERENCES users(user_id) ON DELETE CASCADE,
+    total_content_items INTEGER NOT NULL DEFAULT 0,
+    completed_items INTEGER NOT NULL DEFAULT 0,
+    total_time_minutes INTEGER NOT NULL DEFAULT 0,
+    completion_percentage INTEGER GENERATED ALWAYS AS (
+        CASE WHEN total_content_items > 0 THEN completed_items * 100 / total_content_items ELSE 0 END
+    ) STORED,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
 
 -- ============================================================================
 -- PHASE 6: RAG-BASED CONTEXTUAL CHAT ASSISTANT
@@ -302,6 +336,7 @@ CREATE TABLE chat_sessions (
 
 CREATE INDEX idx_chat_sessions_user ON chat_sessions(user_id);
 CREATE INDEX idx_chat_sessions_stage ON chat_sessions(stage_id);
+CREATE INDEX idx_chat_sessions_user_started ON chat_sessions(user_id, started_at);
 
 CREATE TABLE chat_messages (
     message_id SERIAL PRIMARY KEY,
@@ -311,7 +346,7 @@ CREATE TABLE chat_messages (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
-CREATE INDEX idx_chat_messages_chat ON chat_messages(chat_id);
+CREATE INDEX idx_chat_messages_chat_message ON chat_messages(chat_id, message_id);
 CREATE INDEX idx_chat_messages_created ON chat_messages(created_at);
 
 -- ============================================================================
@@ -322,14 +357,16 @@ CREATE TABLE evaluation_sessions (
     evaluation_id SERIAL PRIMARY KEY,
     user_id INTEGER NOT NULL REFERENCES users(user_id) ON DELETE CASCADE,
     path_id INTEGER NOT NULL REFERENCES learning_paths(path_id) ON DELETE CASCADE,
-    status VARCHAR(20) NOT NULL CHECK (status IN ('in_progress', 'completed')),
+    status VARCHAR(20) NOT NULL CHECK (status IN ('in_progress', 'evaluating', 'completed')),
     started_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    completed_at TIMESTAMP NULL
+    completed_at TIMESTAMP NULL,
+    scoring_started_at TIMESTAMP NULL
 );
 
 CREATE INDEX idx_evaluation_sessions_user ON evaluation_sessions(user_id);
 CREATE INDEX idx_evaluation_sessions_path ON evaluation_sessions(path_id);
 CREATE INDEX idx_evaluation_sessions_status ON evaluation_sessions(status);
+CREATE INDEX idx_evaluation_sessions_user_status_started ON evaluation_sessions(user_id, status, started_at);
 
 CREATE TABLE evaluation_dialogues (
     dialogue_id SERIAL PRIMARY KEY,
@@ -387,6 +424,35 @@ CREATE TABLE progress_analysis_reports (
 CREATE INDEX idx_progress_analysis_reports_path ON progress_analysis_reports(path_id);
 CREATE INDEX idx_progress_analysis_reports_user ON progress_analysis_reports(user_id);
 
+-- ============================================================================
+-- DASHBOARD ROLLUP (per-user path and completed-session counts, refreshed
+-- periodically by the server; content totals live in user_progress_summary)
+-- ============================================================================
+
+CREATE MATERIALIZED VIEW mv_user_dashboard_rollup AS
+SELECT
+    u.user_id,
+    COALESCE(lp.total_paths, 0) AS total_paths,
+    COALESCE(a.completed_assessments, 0) AS completed_assessments,
+    COALESCE(e.completed_evaluations, 0) AS completed_evaluations,
+    now() AS refreshed_at
+FROM users u
+LEFT JOIN (
+    SELECT user_id, COUNT(*) AS total_paths
+    FROM learning_paths GROUP BY user_id
+) lp ON lp.user_id = u.user_id
+LEFT JOIN (
+    SELECT user_id, COUNT(*) AS completed_assessments
+    FROM assessment_sessions WHERE status = 'completed' GROUP BY user_id
+) a ON a.user_id = u.user_id
+LEFT JOIN (
+    SELECT user_id, COUNT(*) AS completed_evaluations
+    FROM evaluation_sessions WHERE status = 'completed' GROUP BY user_id
+) e ON e.user_id = u.user_id;
+
+-- Unique index required by REFRESH MATERIALIZED VIEW CONCURRENTLY
+CREATE UNIQUE INDEX idx_mv_user_dashboard_rollup_user ON mv_user_dashboard_rollup(user_id);
+
 -- ============================================================================
 -- SAMPLE DATA (Optional — uncomment to seed initial tracks)
 -- Admin user is created automatically by the server on first boot.
@@ -1,5 +1,11 @@
 """
 Simple runner script for the GrowWise backend
+
+Development (default) runs a single auto-reloading process. For production set
+RELOAD=false: the app then runs WEB_CONCURRENCY worker processes (default 2)
+on uvloop + httptools when they are installed. Every worker opens its own
+database pools (see app/database.py), so raise WEB_CONCURRENCY only as far as
+workers x per-worker connections stays under Postgres' max_connections.
 """
 import os
 import uvicorn
@@ -9,11 +15,19 @@ load_dotenv()
 
 if __name__ == "__main__":
     port = int(os.getenv("PORT", "8001"))
+    reload = os.getenv("RELOAD", "true").lower() == "true"
+    limit_concurrency = os.getenv("UVICORN_LIMIT_CONCURRENCY")
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0",
         port=port,
-        reload=True,
+        reload=reload,
+        # --reload and --workers are mutually exclusive
+        workers=1 if reload else int(os.getenv("WEB_CONCURRENCY", "2")),
+        # "auto" picks uvloop/httptools when installed, asyncio/h11 otherwise
+        loop="auto",
+        http="auto",
+        backlog=int(os.getenv("UVICORN_BACKLOG", "2048")),
+        limit_concurrency=int(limit_concurrency) if limit_concurrency else None,
         log_level="info"
     )
-
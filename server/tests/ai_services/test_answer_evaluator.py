@@ -8,6 +8,7 @@ Coverage:
   B.  _mock_evaluate      – correct structure, value ranges, heuristics.
   C.  evaluate_answer     – public async interface (mock path).
   D.  Integration         – submit_answer API stores criteria_scores in DB.
+  E.  _evaluation_key     – result-cache key normalisation.
 """
 
 import asyncio
@@ -20,6 +21,7 @@ import pytest
 
 from app.ai_services.answer_evaluator import (
     CRITERIA,
+    _evaluation_key,
     _mock_evaluate,
     _validate,
     evaluate_answer,
@@ -493,3 +495,27 @@ def test_submit_all_answers_then_complete_stores_dimension_results() -> None:
         assert result["overall_score"] is not None
         assert result["detected_level"] in ("beginner", "intermediate", "advanced")
         assert "dimension" in result["ai_reasoning"].lower() or result["overall_score"] >= 0
+
+
+# ===========================================================================
+# E.  _evaluation_key  (result cache)
+# ===========================================================================
+
+
+def _qa(**overrides) -> Dict:
+    ctx = _full_context(**overrides)
+    ctx.pop("track_name")
+    return ctx
+
+
+def test_evaluation_key_ignores_answer_case_and_whitespace() -> None:
+    a = _evaluation_key("Full Stack Development", "", _qa(user_answer="Use  a CDN\nand Redis"))
+    b = _evaluation_key("Full Stack Development", "", _qa(user_answer="use a cdn and redis "))
+    assert a == b
+
+
+def test_evaluation_key_depends_on_question_and_context() -> None:
+    base = _evaluation_key("Full Stack Development", "", _qa())
+    assert base != _evaluation_key("Full Stack Development", "", _qa(question_text="Another question?"))
+    assert base != _evaluation_key("Full Stack Development", "", _qa(dimension_weight=0.5))
+    assert base != _evaluation_key("Data Engineering", "", _qa())
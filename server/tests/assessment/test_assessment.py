@@ -1,3 +1,4 @@
+import time
 import uuid
 from typing import Dict
 
@@ -137,6 +138,46 @@ def test_create_assessment_session_generates_questions(
         assert "dimension_id" in q
 
 
+def test_create_assessment_session_in_background(
+    api_client: httpx.Client, admin_headers: Dict[str, str], auth_headers: Dict[str, str]
+) -> None:
+    """
+    With ?background=true the session comes back immediately as "generating"
+    (202) and switches to "in_progress" once its questions are stored.
+    """
+    track_id = _create_track(api_client, admin_headers)
+
+    session_resp = api_client.post(
+        "/api/assessment/sessions",
+        headers=auth_headers,
+        params={"background": "true"},
+        json={"track_id": track_id},
+    )
+    assert session_resp.status_code == 202
+    session = session_resp.json()
+    session_id = session["session_id"]
+    assert session["status"] == "generating"
+
+    # Poll until generation finishes
+    for _ in range(60):
+        poll_resp = api_client.get(
+            f"/api/assessment/sessions/{session_id}", headers=auth_headers
+        )
+        assert poll_resp.status_code == 200
+        if poll_resp.json()["status"] == "in_progress":
+            break
+        time.sleep(1)
+    else:
+        pytest.fail("Background question generation did not finish in time")
+
+    questions_resp = api_client.get(
+        f"/api/assessment/sessions/{session_id}/questions",
+        headers=auth_headers,
+    )
+    assert questions_resp.status_code == 200
+    assert len(questions_resp.json()) == 10
+
+
 def test_get_assessment_session_only_owner_can_access(
     api_client: httpx.Client, admin_headers: Dict[str, str]
 ) -> None:
@@ -445,3 +486,56 @@ def test_get_my_assessment_sessions_order(
     # First element should be the most recent session
     assert sessions[0]["session_id"] == resp2.json()["session_id"]
 
+
+
+# ============================================================================
+# Question pool
+# ============================================================================
+
+
+def test_create_questions_bulk(
+    api_client: httpx.Client, admin_headers: Dict[str, str]
+) -> None:
+    """
+    Bulk-creating questions returns them with IDs, in request order, and they
+    show up in the track's question list.
+    """
+    track_id = _create_track(api_client, admin_headers)
+    payload = [
+        {
+            "track_id": track_id,
+            "question_text": f"Bulk question {i}",
+            "question_type": "open",
+            "difficulty": "medium",
+        }
+        for i in range(3)
+    ]
+
+    resp = api_client.post(
+        "/api/assessment/questions/bulk",
+        headers=admin_headers,
+        json=payload,
+    )
+    assert resp.status_code == 201
+    created = resp.json()
+    assert [q["question_text"] for q in created] == [q["question_text"] for q in payload]
+    assert all(isinstance(q["question_id"], int) for q in created)
+
+    list_resp = api_client.get(f"/api/assessment/questions/track/{track_id}")
+    assert list_resp.status_code == 200
+    listed_ids = {q["question_id"] for q in list_resp.json()}
+    assert {q["question_id"] for q in created} <= listed_ids
+
+
+def test_create_questions_bulk_requires_admin(
+    api_client: httpx.Client, auth_headers: Dict[str, str]
+) -> None:
+    """
+    Non-admin users cannot bulk-create questions (403).
+    """
+    resp = api_client.post(
+        "/api/assessment/questions/bulk",
+        headers=auth_headers,
+        json=[],
+    )
+    assert resp.status_code == 403
@@ -396,6 +396,23 @@ def test_profile_update_persists_after_new_login(api_client):
     profile = api_client.get("/api/auth/me", headers={"Authorization": f"Bearer {token2}"}).json()
     assert profile["full_name"] == "Updated"
 
+def test_update_profile_email_already_in_use(api_client):
+    """Test that changing email to another user's address is rejected."""
+    taken = f"taken_{uuid.uuid4()}@example.com"
+    email = f"mover_{uuid.uuid4()}@example.com"
+    api_client.post("/api/auth/register", json={"email": taken, "password": "ValidPass123!", "full_name": "u"})
+    api_client.post("/api/auth/register", json={"email": email, "password": "ValidPass123!", "full_name": "u"})
+    res = api_client.post("/api/auth/login", data={"username": email, "password": "ValidPass123!"})
+    token = res.json()["access_token"]
+
+    res = api_client.put("/api/auth/me", headers={"Authorization": f"Bearer {token}"}, json={"email": taken.upper()})
+    assert res.status_code == 400
+    assert "already in use" in res.text.lower()
+
+    # Own email stays unchanged and the account is still usable
+    profile = api_client.get("/api/auth/me", headers={"Authorization": f"Bearer {token}"}).json()
+    assert profile["email"] == email
+
 # ============================================================================
 # 5. 🔄 Session Management — Multi-Device Reality
 # ============================================================================
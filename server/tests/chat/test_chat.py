@@ -1,3 +1,4 @@
+import time
 import uuid
 from typing import Dict, Tuple
 
@@ -239,3 +240,53 @@ def test_chat_session_flow_and_messages(
     )
     assert get_after_delete.status_code == 404
 
+
+
+def test_stream_message_sse(
+    api_client: httpx.Client, admin_headers: Dict[str, str], auth_headers: Dict[str, str]
+) -> None:
+    """
+    Streaming endpoint returns text/event-stream chunks ending with a done
+    event, and both messages are stored afterwards.
+    """
+    _, stage_id, _ = _create_assessment_and_learning_path_with_stage(
+        api_client, admin_headers, auth_headers
+    )
+    create_resp = api_client.post(
+        "/api/chat/sessions",
+        headers=auth_headers,
+        json={"stage_id": stage_id},
+    )
+    assert create_resp.status_code == 201
+    chat_id = create_resp.json()["chat_id"]
+
+    stream_resp = api_client.post(
+        f"/api/chat/sessions/{chat_id}/messages/stream",
+        headers=auth_headers,
+        json={"message_text": "What should I focus on first?"},
+    )
+    assert stream_resp.status_code == 200
+    assert stream_resp.headers["content-type"].startswith("text/event-stream")
+    body = stream_resp.text
+    assert body.startswith("data: ")
+    assert body.rstrip().endswith("event: done\ndata: {}")
+
+    # The AI message is stored by a background task after the stream ends
+    for _ in range(20):
+        msgs_resp = api_client.get(
+            f"/api/chat/sessions/{chat_id}/messages", headers=auth_headers
+        )
+        assert msgs_resp.status_code == 200
+        senders = [m["sender"] for m in msgs_resp.json()]
+        if len(senders) == 3:
+            break
+        time.sleep(0.1)
+    assert senders == ["ai", "user", "ai"]
+
+    # Unknown chat is still a 404 before any streaming starts
+    missing_resp = api_client.post(
+        "/api/chat/sessions/999999/messages/stream",
+        headers=auth_headers,
+        json={"message_text": "hello"},
+    )
+    assert missing_resp.status_code == 404
@@ -1,3 +1,4 @@
+import time
 import uuid
 from typing import Dict, Tuple
 
@@ -219,6 +220,110 @@ def test_evaluation_conversation_and_complete_flow(
     assert get_result_resp.status_code == 200
 
 
+def test_create_evaluation_session_in_background(
+    api_client: httpx.Client, admin_headers: Dict[str, str], auth_headers: Dict[str, str]
+) -> None:
+    """
+    With ?background=true the session comes back immediately (202) and the
+    interviewer's opening message shows up in its dialogues afterwards.
+    """
+    path_id = _create_learning_path_for_evaluation(
+        api_client, admin_headers, auth_headers
+    )
+
+    create_resp = api_client.post(
+        "/api/evaluation/sessions",
+        headers=auth_headers,
+        params={"background": "true"},
+        json={"path_id": path_id},
+    )
+    assert create_resp.status_code == 202
+    evaluation_id = create_resp.json()["evaluation_id"]
+
+    # Poll until the intro is stored
+    for _ in range(60):
+        dialogues_resp = api_client.get(
+            f"/api/evaluation/sessions/{evaluation_id}/dialogues",
+            headers=auth_headers,
+        )
+        assert dialogues_resp.status_code == 200
+        dialogues = dialogues_resp.json()
+        if dialogues:
+            break
+        time.sleep(0.5)
+    else:
+        pytest.fail("Background intro generation did not finish in time")
+
+    assert dialogues[0]["speaker"] == "ai"
+    assert dialogues[0]["sequence_no"] == 1
+
+    # Replies follow the intro
+    resp = api_client.post(
+        f"/api/evaluation/sessions/{evaluation_id}/respond",
+        headers=auth_headers,
+        json={"message_text": "Here is my detailed explanation."},
+    )
+    assert resp.status_code == 200
+    assert resp.json()["sequence_no"] == 3
+
+
+def test_complete_evaluation_in_background(
+    api_client: httpx.Client, admin_headers: Dict[str, str], auth_headers: Dict[str, str]
+) -> None:
+    """
+    With ?background=true completion returns the session as "evaluating"
+    (202) and the result becomes available once scoring finishes.
+    """
+    path_id = _create_learning_path_for_evaluation(
+        api_client, admin_headers, auth_headers
+    )
+
+    create_resp = api_client.post(
+        "/api/evaluation/sessions",
+        headers=auth_headers,
+        json={"path_id": path_id},
+    )
+    assert create_resp.status_code == 201
+    evaluation_id = create_resp.json()["evaluation_id"]
+
+    for _ in range(2):
+        resp = api_client.post(
+            f"/api/evaluation/sessions/{evaluation_id}/respond",
+            headers=auth_headers,
+            json={"message_text": "Here is my detailed explanation."},
+        )
+        assert resp.status_code == 200
+
+    complete_resp = api_client.post(
+        f"/api/evaluation/sessions/{evaluation_id}/complete",
+        headers=auth_headers,
+        params={"background": "true"},
+    )
+    assert complete_resp.status_code == 202
+    assert complete_resp.json()["status"] == "evaluating"
+
+    # Poll until the result is stored
+    for _ in range(60):
+        result_resp = api_client.get(
+            f"/api/evaluation/sessions/{evaluation_id}/result",
+            headers=auth_headers,
+        )
+        if result_resp.status_code == 200:
+            break
+        assert result_resp.status_code == 404
+        time.sleep(0.5)
+    else:
+        pytest.fail("Background evaluation scoring did not finish in time")
+
+    assert result_resp.json()["readiness_level"] in ["junior", "mid", "senior_ready"]
+
+    session_resp = api_client.get(
+        f"/api/evaluation/sessions/{evaluation_id}",
+        headers=auth_headers,
+    )
+    assert session_resp.json()["status"] == "completed"
+
+
 def test_get_my_evaluation_sessions_order(
     api_client: httpx.Client, admin_headers: Dict[str, str], auth_headers: Dict[str, str]
 ) -> None:
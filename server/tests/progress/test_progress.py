@@ -230,6 +230,52 @@ def test_learning_path_progress_and_dashboard(
     assert "user" in dash
     assert "assessments" in dash
     assert "learning" in dash
+    assert dash["learning"]["total_learning_paths"] >= 1
+    assert dash["learning"]["total_content_items"] >= data["total_content_items"]
+    assert 0 <= dash["learning"]["completion_percentage"] <= 100
+
+
+def test_learning_path_progress_reflects_later_completions(
+    api_client: httpx.Client, admin_headers: Dict[str, str], auth_headers: Dict[str, str]
+) -> None:
+    """
+    Stage totals are kept in a summary table and the dashboard is cached;
+    completing content after the first read must show up in the next read
+    of both.
+    """
+    path_id, stage_id = _create_learning_path_with_progress(
+        api_client, admin_headers, auth_headers
+    )
+
+    before = api_client.get(
+        f"/api/progress/learning-path/{path_id}", headers=auth_headers
+    ).json()
+    dash_before = api_client.get("/api/progress/dashboard", headers=auth_headers).json()
+
+    items = api_client.get(
+        f"/api/content/stage/{stage_id}", headers=auth_headers
+    ).json()
+    assert len(items) >= 2
+    complete_resp = api_client.post(
+        f"/api/content/{items[1]['content_id']}/complete", headers=auth_headers
+    )
+    assert complete_resp.status_code == 200
+
+    after = api_client.get(
+        f"/api/progress/learning-path/{path_id}", headers=auth_headers
+    ).json()
+    assert after["completed_items"] == before["completed_items"] + 1
+    assert after["total_content_items"] == before["total_content_items"]
+    first_stage = next(s for s in after["stages_progress"] if s["stage_id"] == stage_id)
+    assert first_stage["completed_content"] == 2
+
+    # The dashboard is cached per user and worker; the completion must clear
+    # it (the test server runs a single worker)
+    dash_after = api_client.get("/api/progress/dashboard", headers=auth_headers).json()
+    assert (
+        dash_after["learning"]["completed_items"]
+        == dash_before["learning"]["completed_items"] + 1
+    )
 
 
 # ============================================================================